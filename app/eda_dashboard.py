@@ -11,15 +11,17 @@ matplotlib.rcParams["axes.unicode_minus"] = False
 # 현재 파일 기준 상위 디렉토리(DataAnalysis)를 모듈 경로에 추가
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from eda_modules.variable_type_splitter import split_variable_types
 from eda_modules.describe_by_type import describe_by_type
-from eda_modules.correlation_matrix import plot_correlation_matrix
-from eda_modules.outlier_detection import plot_outliers_boxplot, plot_outliers_iqr_custom, plot_outliers_zscore_custom
+from eda_modules.correlation_matrix import plot_correlation_matrix, plot_correlation_heatmap, top_correlation_pairs, WIDE_TABLE_COLS
+from eda_modules.outlier_detection import outlier_jobs
 from eda_modules.class_balance_check import check_class_balance
-from eda_modules.value_distribution import plot_value_distributions
+from eda_modules.value_distribution import distribution_jobs
+from eda_modules.render_pool import render_streaming, RENDER_WORKERS
+from eda_modules.artifact_cache import get_or_render, artifact_stats
 from eda_modules.filters import filter_dataframe
+from eda_modules.group_index import get_group_index
 from eda_modules.value_counts import show_value_counts
-from eda_modules.categorical_heatmap import plot_cat_matrix
+from eda_modules.categorical_heatmap import cat_matrix_jobs
 from eda_modules.null_0_value_check import check_0_value, check_null_value
 from eda_modules.cat_statistical_check import (
     perform_multivariate_anova, 
@@ -28,7 +30,13 @@ from eda_modules.cat_statistical_check import (
     perform_independent_ttest,
     perform_ttest_posthoc
 )
-from eda_modules.scatter_plot import plot_scatter
+from eda_modules.scatter_plot import plot_scatter, scatter_mode, value_range
+from eda_modules.feature_screening import screen_features
+from eda_modules.normality_engine import NORMALITY_METHODS
+from eda_modules.outlier_mask import OUTLIER_MASK_METHODS
+from eda_modules.dataset_cache import load_uploaded_file, get_dataset_info, list_uploaded_sheets
+from eda_modules.dataset_store import list_datasets
+from eda_modules.artifact_store import compact_store, store_usage, start_background_compaction, MAX_STORE_MB
 import streamlit.components.v1 as components  # type: ignore 
 
 # Matplotlib 한글 폰트 설정 (Windows 기준: Malgun Gothic)
@@ -43,6 +51,9 @@ st.set_page_config(page_title="EDA Dashboard", layout="wide", #layout = centered
                         'About': 'EDA Dashboard by Kim Minyoung'
                     }) 
 
+# 그림 저장소 용량 관리 (서버 프로세스당 한 번 시작되는 백그라운드 LRU 정리)
+start_background_compaction()
+
 # 제외할 컬럼 저장 및 불러오기(json)
 def save_filter_config(filtered_vars, path):
     with open(path, "w", encoding="utf-8") as f:
@@ -54,16 +65,35 @@ def load_filter_config(path):
             return json.load(f)
     return {"datetime": [], "categorical": [], "numerical": []}
 
-# Object 컬럼 streamlit에서 불필요한 충돌을 막기 위해 문자열로 모두 변경 처리
-def sanitize_object_columns(df):
-    for col in df.select_dtypes(include='object').columns:
-        df[col] = df[col].astype(str).replace("nan", "")
-    return df
-
 def sanitize_filename(name: str) -> str:
     # Windows에서 사용할 수 없는 문자를 ''로 대체
     return re.sub(r'[\\/*?:"<>|]', "", str(name))
 
+def show_image_grid(jobs, n_cols, max_workers=None):
+    """
+    (이미지 경로, 작업) 목록을 격자로 표시
+
+    이미 저장된 이미지는 바로 보여주고, 없는 이미지는 렌더링 프로세스 풀에서
+    완성되는 순서대로 해당 칸에 채워 넣는다.
+    """
+    slots = []
+    for i in range(0, len(jobs), n_cols):
+        cols = st.columns(n_cols)
+        for j in range(n_cols):
+            if i + j < len(jobs):
+                slots.append(cols[j].empty())
+
+    pending = []
+    for slot, (img_path, task) in zip(slots, jobs):
+        if task is None:
+            slot.image(img_path, use_container_width=True)
+        else:
+            pending.append((slot, task))
+
+    for idx, path in render_streaming([task for _, task in pending], max_workers):
+        if path:
+            pending[idx][0].image(path, use_container_width=True)
+
 # GA4 태그 삽입
 components.html("""
 <!-- Microsft Clarity -->
@@ -82,11 +112,23 @@ components.html("""
 st.title("🧪 EDA 대시보드")
 
 uploaded_file = st.file_uploader("📂 CSV 또는 Excel 파일 업로드", type=["csv", "xlsx", "xls"])
+compact_mode = st.toggle("🗜️ 메모리 절약 모드 (category / Arrow 문자열 / 수치형 downcast)", value=True, key="toggle_compact")
 
 if uploaded_file:
     ext = uploaded_file.name.split(".")[-1].lower()
     data_name = uploaded_file.name.split(".")[0]
-    data_path = os.path.join("data", uploaded_file.name)
+
+    # 엑셀은 시트 목록만 먼저 읽고, 선택한 시트만 컬럼형 파일로 1회 변환해 캐시
+    sheet_name = None
+    if ext in ["xlsx", "xls"]:
+        try:
+            sheet_names = list_uploaded_sheets(uploaded_file)
+        except ValueError as e:
+            st.error(f"❌ {e}")
+            st.stop()
+        if len(sheet_names) > 1:
+            sheet_name = st.selectbox("📑 분석할 시트 선택", options=sheet_names, key="selectbox_sheet")
+            data_name = f"{data_name}_{sanitize_filename(sheet_name)}"
 
     st.markdown(f"""
         <script>
@@ -97,34 +139,29 @@ if uploaded_file:
         unsafe_allow_html=True
     )
 
-    os.makedirs("data", exist_ok=True)
-    with open(data_path, "wb") as f:
-        f.write(uploaded_file.getbuffer())
-    
-    # 엑셀 파일 읽기 (xls, xlsx 모두 지원)
-    if ext == "csv":
-        df = pd.read_csv(uploaded_file)
-    elif ext in ["xlsx", "xls"]:
-        # 엑셀 파일의 경우 엔진 자동 선택 (openpyxl 또는 xlrd)
-        try:
-            if ext == "xlsx":
-                df = pd.read_excel(uploaded_file, engine='openpyxl')
-            else:  # xls
-                df = pd.read_excel(uploaded_file, engine='xlrd')
-        except Exception as e:
-            try:
-                # 대체 엔진 시도
-                df = pd.read_excel(uploaded_file)
-            except Exception as e2:
-                st.error(f"❌ 엑셀 파일 읽기 실패: {e2}")
-                st.stop()
-    else:
-        st.error(f"❌ 지원하지 않는 파일 형식입니다: {ext}")
+    # 업로드 내용 해시 기준 캐시: 같은 파일이면 파싱/sanitize/변수 유형 분류를 건너뜀
+    # CSV는 청크 단위로 컬럼형 저장소에 적재되며 진행률을 표시
+    load_progress = st.progress(0.0, text="📥 데이터 적재 중...")
+    try:
+        data_key, df, var_types = load_uploaded_file(
+            uploaded_file,
+            compact=compact_mode,
+            sheet_name=sheet_name,
+            progress_callback=lambda p: load_progress.progress(p, text=f"📥 데이터 적재 중... {p:.0%}")
+        )
+    except ValueError as e:
+        st.error(f"❌ {e}")
         st.stop()
-    
-    df = sanitize_object_columns(df)
+    load_progress.empty()
     st.success(f"✅ 파일 업로드 완료: {uploaded_file.name}")
 
+    dataset_info = get_dataset_info(data_key)
+    if dataset_info:
+        st.caption(
+            f"💾 메모리 사용량: {dataset_info['memory_before_mb']:,.1f} MB → "
+            f"{dataset_info['memory_after_mb']:,.1f} MB ({dataset_info['rows']:,}행)"
+        )
+
     #st.set_page_config(page_title=data_name)
     st.title(f"📊 {data_name}")
     # data_title = "_".join(data_name.split("_")[3:])
@@ -135,21 +172,13 @@ if uploaded_file:
     #                     'About': 'EDA Dashboard by Kim Minyoung'
     #                 }) 
 
-    report_base = os.path.join("reports", data_name)
-    outlier_dir = os.path.join(report_base, "outliers_by_item")
-    dist_dir = os.path.join(report_base, "distributions_by_item")
-
-    os.makedirs(outlier_dir, exist_ok=True)
-    os.makedirs(dist_dir, exist_ok=True)
-
     #제외할 컬럼 필터 불러오기
     filter_dir = "feature_filters"
     os.makedirs(filter_dir, exist_ok=True)
     FILTER_PATH = os.path.join(filter_dir, f"filter_config_{data_name}.json")
     stored_filters = load_filter_config(FILTER_PATH)
 
-    # 변수 유형 분류
-    var_types = split_variable_types(df)
+    # 변수 유형 분류 (데이터셋 캐시에 함께 저장됨)
     datetime_cols = var_types["datetime"]
     categorical_cols = var_types["categorical"]
     numerical_cols = var_types["numerical"]
@@ -216,10 +245,9 @@ if uploaded_file:
         group_or_not = st.selectbox("🔍 그룹화 여부 선택", options=["그룹화 X", "그룹화"], key="selectbox_describe_group")
         if group_or_not == "그룹화":
             group_by_col = st.selectbox("🔍 그룹화할 컬럼 선택", options=filtered_var_types["categorical"], key="selectbox_describe_group_col")
-            grouped_df = df.groupby(group_by_col)
-            describe_result = describe_by_type(grouped_df, filtered_var_types)
+            describe_result = describe_by_type(df, filtered_var_types, group_col=group_by_col, data_key=data_key)
         else:
-            describe_result = describe_by_type(df, filtered_var_types)
+            describe_result = describe_by_type(df, filtered_var_types, data_key=data_key)
         
         if "numerical" in describe_result:
             st.write("🔢 수치형 변수 통계")
@@ -236,10 +264,15 @@ if uploaded_file:
     with tab2:
         st.markdown("### 📈 시각화")
         st.markdown("**기능:** 이상치 분포, 변수 분포(KDE), 범주형 히트맵, null/0값 확인, 산점도")
+        render_workers = st.number_input("🧵 그림 생성 동시 프로세스 수", min_value=1, max_value=max(os.cpu_count() or 1, RENDER_WORKERS),
+                                         value=RENDER_WORKERS, step=1, key="number_render_workers")
         
         # 이상치 분포 시각화
         st.subheader("🔍 이상치 분포 (boxplot) 시각화")
         outlier_method = st.selectbox("🧪 이상치 탐지 방식 선택", ["Boxplot(기본 IQR)", "Z-Score", "IQR"])
+        # 미선택 시 대용량 데이터는 분위수 스케치(근사)로 사분위수/중앙값 계산
+        exact_quantiles = st.checkbox("📐 분위수 정확 계산 (대용량 데이터는 느릴 수 있음)", value=False, key="checkbox_exact_quantile")
+        quantile_exact = True if exact_quantiles else None
         with st.expander("🎨 이상치 boxplot 색상 설정"):
             selected_color_outlier = st.selectbox(
                 "시각화 색상 선택",
@@ -259,27 +292,14 @@ if uploaded_file:
         # 범주형 변수 선택 (그룹화 기준)
         selected_groupby_col = st.selectbox("📑 이상치를 그룹화할 기준 범주형 변수 선택 (미선택 가능)", options=["선택 안함"] + categorical_cols, key="selectbox_outlier_group"
         )
-        base_dir = "outlier_imgs"
-        method_dir = {
-            "Boxplot(기본 IQR)": "boxplot",
-            "Z-Score": "zscore",
-            "IQR": "iqr"
-        }[outlier_method]
-
         if st.toggle("📦 이상치 시각화 보기", value=False, key=f"toggle_outlier_{selected_groupby_col}"):
             is_grouped = selected_groupby_col != "선택 안함"
             
             # 그룹 값 선택
             if is_grouped:
-                group_values = df[selected_groupby_col].dropna().unique().tolist()
+                # 그룹 값 목록은 그룹 인덱스에서 (데이터셋 + 컬럼별로 한 번만 생성)
+                group_values = get_group_index(df, selected_groupby_col, data_key).values()
                 selected_group_value = st.selectbox("🔍 확인할 값 선택", options=group_values, key="selectbox_outlier_value")
-                df_selected = df[df[selected_groupby_col] == selected_group_value]
-                save_dir = f"reports/{data_name}/outliers_by_{selected_groupby_col}/{method_dir}/"
-                item_name = selected_group_value
-            else:
-                df_selected = df
-                save_dir = f"reports/{data_name}/outliers_all/{method_dir}/"
-                item_name = "all"
 
             # 시각화할 변수 선택
             selected_num_cols = st.multiselect(
@@ -290,50 +310,28 @@ if uploaded_file:
             )
 
             if selected_num_cols:
-                item_safe = re.sub(r'[\\/*?:"<>|]', "", str(item_name))
-                item_dir = os.path.join(save_dir, item_safe)
-                os.makedirs(item_dir, exist_ok=True)
-
-                img_paths = []
-
-                if outlier_method == "Boxplot(기본 IQR)":
-                    param_dir = os.path.join(item_dir, f"basic_boxplot")
-                    pass
-                elif outlier_method == "Z-Score":
-                    z_threshold = st.slider("Z-Score 임계값 (절댓값)", 1.0, 7.0, 3.0, step=1.0, key = f"z_threshold_slider")
-                    param_dir = os.path.join(item_dir, f"zthreshold_{z_threshold}")
+                outlier_options = {}
+                if outlier_method == "Z-Score":
+                    outlier_options["z_threshold"] = st.slider("Z-Score 임계값 (절댓값)", 1.0, 7.0, 3.0, step=1.0, key = f"z_threshold_slider")
                 elif outlier_method == "IQR":
-                    q1 = st.slider("Q1 백분위 (하위 경계)", 25, 10, 25, step=5, key = f"q1_slider")
-                    q3 = st.slider("Q3 백분위 (상위 경계)", 75, 90, 75, step=5, key = f"q3_slider")
-                    k = st.slider("IQR 계수 (k)", 1.0, 3.0, 1.5, step=0.1, key = f"k_slider")
-                    param_dir = os.path.join(item_dir, f"q1_{q1}_q3_{q3}_k_{k}")
-                os.makedirs(param_dir, exist_ok=True)
-
-                for col in selected_num_cols:
-                    print("col", col)
-                    img_path = os.path.join(param_dir, f"{col}_boxplot_{selected_color_outlier}.png")
-                    if os.path.exists(img_path):
-                        img_paths.append(img_path)
-                    else:
-                        # 새로 생성
-                        if outlier_method == "Boxplot(기본 IQR)":
-                            path = plot_outliers_boxplot(df_selected, col, save_path=img_path, color=selected_color_outlier)
-                        elif outlier_method == "Z-Score":
-                            path = plot_outliers_zscore_custom(df_selected, col, z_threshold=z_threshold, save_path=img_path, color=selected_color_outlier)
-                        elif outlier_method == "IQR":
-                            path = plot_outliers_iqr_custom(df_selected, col, save_path=img_path, q1=q1, q3=q3, k=k, color=selected_color_outlier)
-
-                        img_paths.append(path)
+                    outlier_options["q1"] = st.slider("Q1 백분위 (하위 경계)", 25, 10, 25, step=5, key = f"q1_slider")
+                    outlier_options["q3"] = st.slider("Q3 백분위 (상위 경계)", 75, 90, 75, step=5, key = f"q3_slider")
+                    outlier_options["k"] = st.slider("IQR 계수 (k)", 1.0, 3.0, 1.5, step=0.1, key = f"k_slider")
+
+                # (이미지 경로, 작업) 목록: 캐시 키/통계 계산은 배치 리포트와 같은 작업 생성 함수 사용
+                img_paths = outlier_jobs(
+                    df, selected_num_cols,
+                    method={"Boxplot(기본 IQR)": "boxplot", "Z-Score": "zscore", "IQR": "iqr"}[outlier_method],
+                    group_col=selected_groupby_col if is_grouped else None,
+                    group_value=selected_group_value if is_grouped else None,
+                    color=selected_color_outlier, exact=quantile_exact, data_key=data_key,
+                    **outlier_options,
+                )
 
-                # 이미지 그리드 표시
+                # 이미지 그리드 표시 (완성되는 순서대로 채움)
                 num_imgs = len(img_paths)
                 n_cols = 1 if num_imgs == 1 else (2 if num_imgs == 2 else 3)
-                for i in range(0, num_imgs, n_cols):
-                    cols = st.columns(n_cols)
-                    for j in range(n_cols):
-                        if i + j < num_imgs:
-                            with cols[j]:
-                                st.image(img_paths[i + j], use_container_width=True)
+                show_image_grid(img_paths, n_cols, max_workers=render_workers)
 
         def sanitize_filename(name: str) -> str:
             return re.sub(r'[\\/*?:"<>|]', "", str(name))
@@ -361,20 +359,14 @@ if uploaded_file:
         )
 
         if st.toggle("📦 각 변수 분포 kde 시각화 보기", value=False, key="toggle_kde_view"):
-            kde_dir = f"reports/{data_name}/distributions_by_{selected_groupby_col_kde}"
-
             if selected_groupby_col_kde != "선택 안함": #ITEM_CD별로 시각화하고 싶을 때 
-                group_values = df[selected_groupby_col_kde].dropna().unique().tolist()
+                kde_group_index = get_group_index(df, selected_groupby_col_kde, data_key)
+                group_values = kde_group_index.values()
                 selected_value = st.selectbox(f"🔍 확인할 {selected_groupby_col_kde} 값 선택", options=group_values, key="selectbox_kde_value")
 
-                df_selected = df[df[selected_groupby_col_kde] == selected_value]
-                group_dir = os.path.join(kde_dir, f"{selected_groupby_col_kde}_{sanitize_filename(selected_value)}")
-                os.makedirs(group_dir, exist_ok=True)
+                df_selected = kde_group_index.take(df, selected_value)
             else: #전체 데이터로 시각화하고 싶을 때 
-                df_selected = df.copy()
-                group_dir = os.path.join(kde_dir, "all")
-                print("DEBUGGING: 전체 데이터로 시각화!!!!!!!")
-                os.makedirs(group_dir, exist_ok=True)
+                df_selected = df
 
             selected_cols_dist = st.multiselect(
                 "🎯 시각화할 변수 선택",
@@ -385,34 +377,19 @@ if uploaded_file:
 
             if selected_cols_dist:
 
-                img_paths = []
-                if (
-                    os.path.exists(group_dir)
-                    and any(fname.endswith(f"_distribution_{selected_color_kde}.png") for fname in os.listdir(group_dir))
-                ):
-                    for col in selected_cols_dist:
-                        fname = f"{col}_distribution_{selected_color_kde}.png"
-                        path = os.path.join(group_dir, fname)
-                        if os.path.exists(path):
-                            img_paths.append(path)
-                else:
-                    img_paths = plot_value_distributions(
-                        df_selected,
-                        selected_cols_dist,
-                        item_col=None if selected_groupby_col_kde == "선택 안함" else selected_groupby_col_kde,
-                        save_dir=kde_dir,
-                        color=selected_color_kde
-                    )
+                # 아티팩트 캐시에 있는 그림은 그대로 쓰고, 없는 그림만 렌더링 프로세스 풀에서 생성
+                img_paths = distribution_jobs(
+                    df_selected,
+                    selected_cols_dist,
+                    item_col=None if selected_groupby_col_kde == "선택 안함" else selected_groupby_col_kde,
+                    color=selected_color_kde,
+                    data_key=data_key
+                )
 
-                # 시각화
+                # 시각화 (완성되는 순서대로 채움)
                 num_imgs = len(img_paths)
                 n_cols = 1 if num_imgs == 1 else (2 if num_imgs == 2 else 3)
-                for i in range(0, num_imgs, n_cols):
-                    cols = st.columns(n_cols)
-                    for j in range(n_cols):
-                        if i + j < num_imgs:
-                            with cols[j]:
-                                st.image(img_paths[i + j], use_container_width=True)
+                show_image_grid(img_paths, n_cols, max_workers=render_workers)
 
         st.subheader("📊 범주형 변수 선택해서 Heatmap으로 데이터 분포 확인")
         selected_cat_cols = st.multiselect("🎯 확인할 변수 선택 (정확히 2개)", options=filtered_var_types["categorical"], key="selectbox_cat_heatmap")
@@ -421,54 +398,31 @@ if uploaded_file:
             st.warning("⚠️ 정확히 두 개의 범주형 변수를 선택해주세요.")
         else:
             if st.toggle("📦 Heatmap 시각화 하기", value=False, key="toggle_heatmap"):
-                cat_heatmap_dir = f"reports/{data_name}/categorical_heatmap/{selected_cat_cols[0]}_{selected_cat_cols[1]}"
-                os.makedirs(cat_heatmap_dir, exist_ok=True)
                 check_cols = filtered_var_types["numerical"]
 
-                img_paths = []
-                if (
-                    os.path.exists(cat_heatmap_dir)
-                    and any(fname.endswith("_median_heatmap.png") for fname in os.listdir(cat_heatmap_dir))
-                ):
-                    for col in check_cols:
-                        fname = f"{col}_median_heatmap.png"
-                        path = os.path.join(cat_heatmap_dir, fname)
-                        if os.path.exists(path):
-                            img_paths.append(path)
-                else:
-                    img_paths = plot_cat_matrix(df, selected_cat_cols, check_cols, save_path=cat_heatmap_dir)
+                # 수치형 컬럼별 중앙값 히트맵 (캐시에 없는 것만 렌더링 프로세스 풀에서 생성)
+                img_paths = cat_matrix_jobs(df, selected_cat_cols, check_cols, exact=quantile_exact, data_key=data_key)
 
                 # 시각화
                 num_imgs = len(img_paths)
                 n_cols = 1 if num_imgs == 1 else 2
-                for i in range(0, num_imgs, n_cols):
-                    cols = st.columns(n_cols)
-                    for j in range(n_cols):
-                        if i + j < num_imgs:
-                            with cols[j]:
-                                st.image(img_paths[i + j])
-
-                    st.markdown("<br>", unsafe_allow_html=True)
+                show_image_grid(img_paths, n_cols, max_workers=render_workers)
 
         st.subheader("📊 null값 및 0값 확인하기")
         if st.toggle("📦 시작하기", value=False, key="toggle_null_zero"):
             selected_0_or_null = st.selectbox("🎯 0 / Null 확인 여부 선택", options=["0", "Null"], key="selectbox_0_or_null")
             selected_cat_idx_col = st.selectbox("🎯 확인할 변수 선택", options=filtered_var_types["categorical"], key="selectbox_cat_idx")
-            null_0_dir = f"reports/{data_name}/null_0_value_check/"
-            os.makedirs(null_0_dir, exist_ok=True)
             check_cols = filtered_var_types["numerical"]
 
-            fname = f"{selected_0_or_null}_{selected_cat_idx_col}_value_check.png"
-            img_path = os.path.join(null_0_dir, fname)
-
-            # 이미지가 없을 경우에만 생성
-            if not os.path.exists(img_path):
-                if selected_0_or_null == "0":
-                    img_path = check_0_value(df, check_cols, selected_cat_idx_col, save_path=img_path)
-                elif selected_0_or_null == "Null":
-                    img_path = check_null_value(df, check_cols, selected_cat_idx_col, save_path=img_path)
+            # 아티팩트 캐시에 없을 경우에만 생성
+            img_path = get_or_render(
+                data_key,
+                check_0_value if selected_0_or_null == "0" else check_null_value,
+                {"cols": check_cols, "cat_col": selected_cat_idx_col},
+                dict(df=df, cols=check_cols, cat_col=selected_cat_idx_col, data_key=data_key),
+            )
 
-            if os.path.exists(img_path):
+            if img_path and os.path.exists(img_path):
                 st.image(img_path, use_container_width=True)
             else:
                 st.warning("⚠️ 이미지 생성에 실패했습니다.")
@@ -488,11 +442,19 @@ if uploaded_file:
             
             test_method = st.selectbox(
                 "🧪 검정 방법 선택",
-                options=["shapiro", "ks"],
-                format_func=lambda x: "Shapiro-Wilk" if x == "shapiro" else "Kolmogorov-Smirnov",
+                options=list(NORMALITY_METHODS),
+                format_func=lambda x: NORMALITY_METHODS[x] + (" (큰 표본에서 빠름)" if x in ("anderson", "dagostino") else ""),
                 key="normality_method"
             )
             
+            normality_seed = 42
+            if test_method == "shapiro":
+                normality_seed = st.number_input(
+                    "🎲 표본 추출 seed (5,000개 초과 시 무작위 추출)",
+                    min_value=0, value=42, step=1,
+                    key="normality_seed"
+                )
+            
             group_by_norm = st.selectbox(
                 "📑 그룹별 검정 여부",
                 options=["전체 데이터", "그룹별 검정"],
@@ -509,9 +471,9 @@ if uploaded_file:
             
             if st.button("🔍 정규성 검정 실행", key="btn_normality"):
                 if selected_cat_col_norm:
-                    result = perform_normality_test(df, selected_num_col_norm, cat_col=selected_cat_col_norm, method=test_method)
+                    result = perform_normality_test(df, selected_num_col_norm, cat_col=selected_cat_col_norm, method=test_method, data_key=data_key, seed=int(normality_seed))
                 else:
-                    result = perform_normality_test(df, selected_num_col_norm, method=test_method)
+                    result = perform_normality_test(df, selected_num_col_norm, method=test_method, data_key=data_key, seed=int(normality_seed))
                 
                 if "error" in result:
                     st.error(f"❌ {result['error']}")
@@ -523,6 +485,31 @@ if uploaded_file:
                     st.write("**정규성 검정 결과**")
                     st.json(result)
 
+        st.subheader("🧹 이상치 제거 설정 (ANOVA / t검정 / 일괄 스크리닝 공통)")
+
+        col_out_method, col_out_thr, col_out_within = st.columns(3)
+        with col_out_method:
+            stat_outlier_method = st.selectbox(
+                "이상치 제거 방식",
+                options=list(OUTLIER_MASK_METHODS),
+                format_func=lambda x: OUTLIER_MASK_METHODS[x][0],
+                key="stat_outlier_method"
+            )
+        with col_out_thr:
+            stat_outlier_threshold = st.number_input(
+                "임계값 (Z / IQR 배수 / 수정 Z)",
+                min_value=0.5, max_value=20.0, step=0.5,
+                value=OUTLIER_MASK_METHODS[stat_outlier_method][1],
+                key=f"stat_outlier_threshold_{stat_outlier_method}"
+            )
+        with col_out_within:
+            stat_outlier_within = st.checkbox("그룹(범주) 안에서 기준 계산", value=False, key="stat_outlier_within")
+        # 검정 함수 공통 이상치 옵션 (마스크는 데이터셋 / 컬럼 / 방식 / 임계값별로 한 번만 계산해서 공유)
+        stat_outlier_options = dict(z_threshold=stat_outlier_threshold, outlier_method=stat_outlier_method,
+                                    outlier_within=stat_outlier_within, data_key=data_key)
+        stat_outlier_note = (f"🧪 {OUTLIER_MASK_METHODS[stat_outlier_method][0]} 방식 이상치 제거 임계값: "
+                             f"**{stat_outlier_threshold}**" + (" (그룹 안에서 계산)" if stat_outlier_within else ""))
+
         st.subheader("📊 다변량 ANOVA (범주형 vs 수치형 변수)")
 
         with st.expander("ℹ️ ANOVA 검정 목적 및 사용 예시", expanded=False):
@@ -573,12 +560,29 @@ if uploaded_file:
                         st.info(f"ℹ️ 다원배치 ANOVA: 범주형 변수 {num_factors}개 선택됨 ({', '.join(selected_cat_cols_anova)})")
 
                 if selected_cat_cols_anova and selected_num_col_anova:
-                    st.markdown(f"🧪 Z-Score 방식 이상치 제거 임계값: **7.0**")
-                    result_df = perform_multivariate_anova(df, selected_cat_cols_anova, selected_num_col_anova, z_threshold=7.0)
+                    # 다변량 ANOVA는 전체 데이터 기준으로만 이상치 제거
+                    st.markdown(f"🧪 {OUTLIER_MASK_METHODS[stat_outlier_method][0]} 방식 이상치 제거 임계값: **{stat_outlier_threshold}**")
+                    result_df = perform_multivariate_anova(
+                        df, selected_cat_cols_anova, selected_num_col_anova, z_threshold=stat_outlier_threshold,
+                        outlier_method=stat_outlier_method, data_key=data_key
+                    )
                     if result_df is not None:
                         st.dataframe(result_df)
                     else:
                         st.warning("ANOVA 분석에 실패했거나 유효한 데이터가 없습니다.")
+                    
+                    if st.checkbox("statsmodels(OLS + anova_lm)로 교차 검증 (수준이 많으면 메모리를 많이 사용)",
+                                   value=False, key="multi_anova_cross_check"):
+                        with st.spinner("statsmodels로 다시 계산 중..."):
+                            sm_result_df = perform_multivariate_anova(
+                                df, selected_cat_cols_anova, selected_num_col_anova, z_threshold=stat_outlier_threshold,
+                                outlier_method=stat_outlier_method, data_key=data_key, method='statsmodels'
+                            )
+                        with st.expander("🔁 statsmodels 교차 검증 결과", expanded=True):
+                            if sm_result_df is not None:
+                                st.dataframe(sm_result_df)
+                            else:
+                                st.warning("ANOVA 분석에 실패했거나 유효한 데이터가 없습니다.")
             else:  # 단일 변수 ANOVA + 사후검정
                 selected_cat_col_anova = st.selectbox(
                     "🎯 독립 변수 (범주형, 단일 변수) 선택",
@@ -592,12 +596,32 @@ if uploaded_file:
                     key="single_anova_num"
                 )
                 
+                cross_check_anova = st.checkbox(
+                    "statsmodels(OLS + pairwise_tukeyhsd)로 교차 검증 (행/그룹이 많으면 느림)",
+                    value=False,
+                    key="single_anova_cross_check"
+                )
+                
                 if selected_cat_col_anova and selected_num_col_anova:
-                    st.markdown(f"🧪 Z-Score 방식 이상치 제거 임계값: **7.0**")
+                    st.markdown(stat_outlier_note)
                     anova_result, posthoc_result = perform_anova_with_posthoc(
-                        df, selected_cat_col_anova, selected_num_col_anova, z_threshold=7.0
+                        df, selected_cat_col_anova, selected_num_col_anova, **stat_outlier_options
                     )
                     
+                    if cross_check_anova:
+                        with st.spinner("statsmodels로 다시 계산 중..."):
+                            sm_anova_result, sm_posthoc_result = perform_anova_with_posthoc(
+                                df, selected_cat_col_anova, selected_num_col_anova,
+                                method='statsmodels', **stat_outlier_options
+                            )
+                        with st.expander("🔁 statsmodels 교차 검증 결과", expanded=True):
+                            if sm_anova_result:
+                                st.json(sm_anova_result)
+                            if sm_posthoc_result and "error" not in sm_posthoc_result:
+                                st.dataframe(sm_posthoc_result["summary"])
+                            elif sm_posthoc_result:
+                                st.warning(f"⚠️ {sm_posthoc_result['error']}")
+                    
                     if anova_result:
                         st.write("**ANOVA 검정 결과**")
                         st.json(anova_result)
@@ -648,8 +672,8 @@ if uploaded_file:
             
             if ttest_mode == "두 그룹 비교":
                 if selected_cat_col_ttest and selected_num_col_ttest:
-                    st.markdown(f"🧪 Z-Score 방식 이상치 제거 임계값: **7.0**")
-                    result = perform_independent_ttest(df, selected_cat_col_ttest, selected_num_col_ttest, z_threshold=7.0)
+                    st.markdown(stat_outlier_note)
+                    result = perform_independent_ttest(df, selected_cat_col_ttest, selected_num_col_ttest, **stat_outlier_options)
                     
                     if "error" in result:
                         st.error(f"❌ {result['error']}")
@@ -688,10 +712,10 @@ if uploaded_file:
                 )
                 
                 if selected_cat_col_ttest and selected_num_col_ttest:
-                    st.markdown(f"🧪 Z-Score 방식 이상치 제거 임계값: **7.0**")
+                    st.markdown(stat_outlier_note)
                     result_df = perform_ttest_posthoc(
                         df, selected_cat_col_ttest, selected_num_col_ttest, 
-                        z_threshold=7.0, correction=correction_method
+                        correction=correction_method, **stat_outlier_options
                     )
                     
                     if "error" in result_df.columns:
@@ -700,6 +724,64 @@ if uploaded_file:
                         st.write("**쌍별 t검정 결과**")
                         st.dataframe(result_df)
 
+        st.subheader("📊 범주형 x 수치형 일괄 스크리닝")
+
+        with st.expander("ℹ️ 일괄 스크리닝 목적 및 사용 예시", expanded=False):
+            st.markdown("""
+        **일괄 스크리닝의 목적:**
+        - 선택한 모든 범주형 x 수치형 변수 조합에 일원배치 ANOVA(선택 시 Kruskal-Wallis도)를 한 번에 수행
+        - 효과 크기(ANOVA: η², Kruskal-Wallis: ε²)와 다중비교 보정 p-value 순으로 정렬해서 영향이 큰 조합을 먼저 확인
+        
+        **사용 예시:**
+        - 어떤 범주형 변수(라인, 품목 등)가 어떤 수치형 측정값과 관련이 있는지 한 번에 찾기
+        - 관심 있는 조합을 찾은 뒤 위의 단일 변수 ANOVA + 사후검정으로 자세히 확인
+            """)
+
+        if st.toggle("📦 일괄 스크리닝 시작하기", value=False, key="toggle_screening"):
+            screening_cat_cols = st.multiselect(
+                "🎯 범주형 변수 선택",
+                options=filtered_var_types["categorical"],
+                default=filtered_var_types["categorical"],
+                key="screening_cat"
+            )
+            screening_num_cols = st.multiselect(
+                "🎯 수치형 변수 선택",
+                options=filtered_var_types["numerical"],
+                default=filtered_var_types["numerical"],
+                key="screening_num"
+            )
+            col_test, col_corr = st.columns(2)
+            with col_test:
+                screening_kruskal = st.checkbox("Kruskal-Wallis 검정도 수행", value=False, key="screening_kruskal")
+            with col_corr:
+                screening_correction = st.selectbox(
+                    "🧪 다중비교 보정 방법",
+                    options=["fdr_bh", "bonferroni", "holm", "none"],
+                    format_func=lambda x: {
+                        "bonferroni": "Bonferroni",
+                        "holm": "Holm",
+                        "fdr_bh": "FDR (Benjamini-Hochberg)",
+                        "none": "보정 없음"
+                    }[x],
+                    key="screening_correction"
+                )
+            
+            if screening_cat_cols and screening_num_cols:
+                st.markdown(stat_outlier_note)
+                with st.spinner("조합별 검정 중..."):
+                    screening_df, screening_time = screen_features(
+                        df, screening_cat_cols, screening_num_cols,
+                        tests=("anova", "kruskal") if screening_kruskal else ("anova",),
+                        correction=screening_correction, **stat_outlier_options
+                    )
+                st.caption(
+                    f"⏱️ {screening_time['tasks']}개 작업 / {len(screening_df):,}개 검정: "
+                    f"전체 {screening_time['wall_s']:.2f}초 (그룹 코드 준비 {screening_time['index_s']:.2f}초, "
+                    f"검정 계산 합계 {screening_time['compute_s']:.2f}초"
+                    f"{', 현재 프로세스' if screening_time['in_process'] else ', 프로세스 풀'})"
+                )
+                st.dataframe(screening_df)
+
     with tab4:
         st.markdown("### 🔗 상관관계 분석")
         st.markdown("**기능:** 수치형 변수 간 상관관계 분석, 산점도")
@@ -712,13 +794,39 @@ if uploaded_file:
             # 수치형 변수 선택
             selected_num_cols = st.multiselect("🎯 분석할 수치형 변수 선택", options=filtered_var_types["numerical"], default=filtered_var_types["numerical"])
             
-            if selected_num_cols:
-                corr_dir = f"reports/{data_name}/correlation_matrix/"
-                os.makedirs(corr_dir, exist_ok=True)
-                corr_img_path = os.path.join(corr_dir, f"{corr_method}_correlation_matrix.png")
+            # 컬럼이 많으면 기본으로 넓은 테이블 모드 (주석 달린 큰 이미지 대신 인터랙티브 히트맵 + 상위 쌍 표)
+            wide_mode = st.checkbox(
+                "🧩 넓은 테이블 모드 (군집 정렬 + 강한 상관만 표시)",
+                value=len(selected_num_cols) > WIDE_TABLE_COLS,
+                key="checkbox_corr_wide",
+            )
 
-                # 이미지 저장 및 출력
-                plot_correlation_matrix(df, selected_num_cols, corr_img_path, method=corr_method)
+            if selected_num_cols and wide_mode:
+                col_thr, col_topk, col_cluster = st.columns(3)
+                with col_thr:
+                    corr_threshold = st.slider("|r| 임계값", 0.0, 1.0, 0.5, 0.05, key="slider_corr_threshold")
+                with col_topk:
+                    corr_top_k = st.number_input("상위 쌍 개수", min_value=1, max_value=1000, value=50, step=10, key="number_corr_top_k")
+                with col_cluster:
+                    corr_cluster = st.checkbox("계층적 군집 정렬", value=True, key="checkbox_corr_cluster")
+
+                fig_corr, corr = plot_correlation_heatmap(
+                    df, selected_num_cols, method=corr_method, threshold=corr_threshold,
+                    cluster=corr_cluster, data_key=data_key,
+                )
+                st.plotly_chart(fig_corr, use_container_width=False, key="corr_heatmap")
+
+                pairs = top_correlation_pairs(corr, threshold=corr_threshold, top_k=int(corr_top_k))
+                st.write(f"**|r| ≥ {corr_threshold:.2f} 인 변수 쌍 (상위 {len(pairs)}개)**")
+                st.dataframe(pairs, use_container_width=True)
+            elif selected_num_cols:
+                # 아티팩트 캐시에 없을 때만 계산/저장 후 출력
+                corr_img_path = get_or_render(
+                    data_key,
+                    plot_correlation_matrix,
+                    {"cols": selected_num_cols, "method": corr_method},
+                    dict(df=df, num_cols=selected_num_cols, method=corr_method, data_key=data_key),
+                )
                 st.image(corr_img_path, use_container_width=True)
 
         st.subheader("📊 산점도 (Scatter Plot)")
@@ -745,6 +853,28 @@ if uploaded_file:
                     options=filtered_var_types["categorical"],
                     key="scatter_hue"
                 )
+
+            # 행 수가 많으면 자동으로 WebGL / 서버 집계 밀도 격자로 전환
+            selected_scatter_mode = st.selectbox(
+                "🖌️ 그리기 방식",
+                options=["auto", "svg", "webgl", "density"],
+                format_func=lambda m: {"auto": "자동 (행 수 기준)", "svg": "일반 산점도", "webgl": "WebGL 산점도", "density": "밀도 격자 (서버 집계)"}[m],
+                key="scatter_mode"
+            )
+
+            # 표시 범위를 좁히면 범위 안의 행만 다시 집계 (확대해서 보기)
+            scatter_x_range = scatter_y_range = None
+            if selected_x_col and selected_y_col and st.checkbox("🔎 표시 범위 지정 (범위 안의 행만 다시 집계)", value=False, key="scatter_window_check"):
+                # 값이 모두 결측이거나 모두 같은 컬럼은 슬라이더를 만들 수 없으므로 그 축은 범위 지정 없이 표시
+                x_bounds, y_bounds = value_range(df[selected_x_col]), value_range(df[selected_y_col])
+                if x_bounds is not None:
+                    scatter_x_range = st.slider(f"{selected_x_col} 범위", *x_bounds, x_bounds, key="scatter_x_range")
+                else:
+                    st.caption(f"ℹ️ {selected_x_col}: 유효한 값이 없거나 모두 같아 범위를 지정할 수 없습니다.")
+                if y_bounds is not None:
+                    scatter_y_range = st.slider(f"{selected_y_col} 범위", *y_bounds, y_bounds, key="scatter_y_range")
+                else:
+                    st.caption(f"ℹ️ {selected_y_col}: 유효한 값이 없거나 모두 같아 범위를 지정할 수 없습니다.")
             
             if selected_x_col and selected_y_col:
                 try:
@@ -756,7 +886,10 @@ if uploaded_file:
                         st.warning("⚠️ 유효한 데이터가 없어 산점도를 그릴 수 없습니다.")
                     else:
                         # Plotly 산점도 생성
-                        result = plot_scatter(df, selected_x_col, selected_y_col, selected_hue_col)
+                        result = plot_scatter(
+                            df, selected_x_col, selected_y_col, selected_hue_col,
+                            x_range=scatter_x_range, y_range=scatter_y_range, mode=selected_scatter_mode,
+                        )
                         
                         # result가 튜플인지 확인하고 처리
                         if result is None:
@@ -781,7 +914,10 @@ if uploaded_file:
                             else:
                                 # Plotly 산점도 표시
                                 st.plotly_chart(fig_scatter, use_container_width=True, key="scatter_plot")
-                                st.caption("💡 점에 마우스를 올리면 X, Y 값이 표시됩니다.")
+                                if scatter_mode(len(df_clean), selected_scatter_mode) == "density":
+                                    st.caption(f"💡 {len(df_clean):,}개 행을 격자로 집계했습니다. 표시 범위를 좁히면 해당 범위만 다시 집계합니다.")
+                                else:
+                                    st.caption("💡 점에 마우스를 올리면 X, Y 값이 표시됩니다.")
                                 
                                 # 선택된 데이터 표시 영역
                                 st.markdown("---")
@@ -844,6 +980,29 @@ if uploaded_file:
         filtered_df = filter_dataframe(df)
         st.dataframe(filtered_df)
 
+        # 데이터셋 저장소 (data/) 카탈로그
+        st.subheader("🗂️ 데이터셋 저장소 목록")
+        dataset_catalog = list_datasets()
+        st.dataframe(dataset_catalog, use_container_width=True)
+
+        # 그림 아티팩트 저장소: 데이터셋별 사용량 + 용량 상한 기준 LRU 정리
+        st.subheader("🖼️ 그림 저장소 사용량")
+        artifact_usage = store_usage().merge(
+            dataset_catalog[["key", "name"]].rename(columns={"key": "data_key"}), on="data_key", how="left"
+        )
+        st.dataframe(artifact_usage[["name", "data_key", "files", "size_mb", "last_access"]], use_container_width=True)
+        store_limit_mb = st.number_input("저장소 용량 상한 (MB)", min_value=10.0, value=float(MAX_STORE_MB), step=100.0, key="number_store_limit")
+        if st.button("🧹 지금 정리하기 (오래 안 쓴 그림부터 삭제)", key="button_compact_store"):
+            result = compact_store(max_mb=store_limit_mb)
+            st.success(f"✅ {result['evicted']:,}개 삭제 ({result['freed_mb']:,.1f} MB 확보), 현재 {result['total_mb']:,.1f} MB")
+
+        # 그림 아티팩트 캐시 적중률 (서버 프로세스 기준 누적)
+        cache_stats = artifact_stats()
+        st.caption(
+            f"🖼️ 그림 캐시: 적중 {cache_stats['hits']:,}회 / 생성 {cache_stats['misses']:,}회 "
+            f"(적중률 {cache_stats['hit_rate']:.0%})"
+        )
+
 
 else:
     st.info("⬆️ 분석을 시작하려면 파일을 업로드해주세요.")
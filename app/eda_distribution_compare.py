@@ -4,12 +4,18 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 import os
-import hashlib
-from io import StringIO
-from typing import Dict, List
+import sys
+from typing import Dict
 
 import matplotlib.colors as mcolors
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from eda_modules.dataset_cache import load_uploaded_files
+from eda_modules.artifact_cache import combine_keys, lookup_artifact, render_artifact
+from eda_modules.artifact_store import start_background_compaction
+from eda_modules.kde_engine import kde_batch
+
 CUSTOM_PALETTES = {
     "tab10": sns.color_palette("tab10", 10),
     "tab20": sns.color_palette("tab20", 20),
@@ -20,7 +26,73 @@ CUSTOM_PALETTES = {
     "custom20": list(mcolors.TABLEAU_COLORS.values()) + list(mcolors.CSS4_COLORS.values())[:10]
 }
 
+# 그림 모양이 바뀌면 올려서 이전 캐시 무효화
+RENDERER_VERSION = 2
+
+
+def render_category_compare(data_dict, cat_col, col, palette, use_kde_for_constant, xlim, save_path):
+    """
+    파일 × 범주 그룹별 col 분포(KDE)를 겹쳐 그린 그림 저장
+
+    Returns:
+        저장 경로 (모든 파일에 그릴 데이터가 없으면 None)
+    """
+    fig, ax = plt.subplots(figsize=(8, 5))
+    sns.set_palette(CUSTOM_PALETTES[palette])
+    # (label, 'kde' 또는 'hist', 값) — KDE는 모아서 kde_batch로 한 번에 계산 후 순서대로 그림
+    entries = []
+
+    for data_name, df in data_dict.items():
+        if cat_col not in df.columns or col not in df.columns:
+            continue
+
+        for group_val, group_df in df.groupby(cat_col, observed=True):
+            col_data = pd.to_numeric(group_df[col], errors='coerce').dropna()
+            if len(col_data) == 0:
+                continue
+
+            label = f"{data_name} - {group_val}"
+            unique_vals = col_data.unique()
+
+            if len(unique_vals) == 1:
+                if use_kde_for_constant:
+                    noise = np.random.normal(loc=0, scale=0.01, size=len(col_data))
+                    noisy_data = col_data + noise
+                    entries.append((label, "kde", noisy_data.to_numpy()))
+                else:
+                    entries.append((label, "hist", col_data))
+            elif len(col_data) > 1:
+                entries.append((label, "kde", col_data.to_numpy()))
+
+    if not entries:
+        plt.close(fig)
+        return None
+
+    kde_indices = [i for i, (_, kind, _) in enumerate(entries) if kind == "kde"]
+    curves = dict(zip(kde_indices, kde_batch([entries[i][2] for i in kde_indices])))
+    for i, (label, kind, values) in enumerate(entries):
+        if kind == "hist":
+            sns.histplot(values, bins=1, label=label, ax=ax)
+        elif curves.get(i) is not None:
+            ax.plot(*curves[i], label=label)
+
+    ax.set_title(f"KDE 분포: {cat_col}별 {col}", fontsize=10)
+    ax.set_xlabel(col, fontsize=10)
+    ax.set_ylabel("Density", fontsize=10)
+    ax.legend(title="Data - Group", fontsize=8)
+    ax.grid(True, linestyle="--", alpha=0.4)
+
+    if xlim:
+        ax.set_xlim(*xlim)
+
+    plt.tight_layout()
+    fig.savefig(save_path)
+    plt.close(fig)
+    return save_path
+
 st.set_page_config(page_title="여러 데이터 분포 비교", layout="wide")
+# 그림 저장소 용량 관리 (서버 프로세스당 한 번 시작되는 백그라운드 LRU 정리)
+start_background_compaction()
 st.title("📊 여러 데이터 분포 비교를 위한 대시보드")
 
 st.markdown("""
@@ -32,11 +104,17 @@ uploaded_files = st.file_uploader("📂 여러 데이터 파일 업로드 (CSV)"
 data_dict: Dict[str, pd.DataFrame] = {}
 
 if uploaded_files:
-    for file in uploaded_files:
-        file_name = os.path.splitext(file.name)[0]
-        stringio = StringIO(file.getvalue().decode("utf-8"))
-        df = pd.read_csv(stringio)
-        data_dict[file_name] = df
+    # 파일들을 동시에 청크 단위 적재 (업로드 바이트에서 바로 파싱, 내용 해시 기준 캐시)
+    load_progress = st.progress(0.0, text="📥 데이터 적재 중...")
+    data_dict, load_timings = load_uploaded_files(
+        uploaded_files, sanitize=False,
+        progress_callback=lambda p: load_progress.progress(p, text=f"📥 데이터 적재 중... {p:.0%}")
+    )
+    load_progress.empty()
+    with st.expander("⏱️ 파일별 적재 시간"):
+        st.dataframe(pd.DataFrame(load_timings), use_container_width=True)
+    # 업로드된 파일들의 내용 해시를 묶은 키 (같은 이름으로 내용이 바뀐 파일을 다시 올리면 키도 바뀜)
+    data_key = combine_keys([t["key"] for t in load_timings])
 
     # ✅ 공통 범주형 / 수치형 변수 확인
     common_cat_cols = set.intersection(*[
@@ -68,63 +146,27 @@ if uploaded_files:
             with col2:
                 x_max = st.number_input("X축 최대값", value=300.0)
 
-        # ✅ 캐시 키 생성
-        def generate_hash_key(file_names: List[str], cat_col: str, col: str, kde_option: bool, x_min, x_max) -> str:
-            key_str = "_".join(sorted(file_names)) + f"_{cat_col}_{col}_{kde_option}"
-            if set_xlim and x_min is not None and x_max is not None:
-                key_str += f"_xlim_{x_min}_{x_max}"
-            return hashlib.md5(key_str.encode()).hexdigest()
-
-        hash_key = generate_hash_key(list(data_dict.keys()), selected_cat_col, selected_col, use_kde_for_constant, x_min, x_max)
-        save_dir = f"reports_catcol/distributions_by_category_compare/{selected_cat_col}"
-        os.makedirs(save_dir, exist_ok=True)
-        save_path = os.path.join(save_dir, f"{selected_col}_compare_{hash_key}.png")
-
-        if os.path.exists(save_path):
+        # ✅ 아티팩트 캐시 키: 데이터 내용 해시(파일별 캐시 키) + 설정 정보 + x축 범위
+        xlim = (x_min, x_max) if set_xlim and x_min is not None and x_max is not None and x_min < x_max else None
+        compare_params = {
+            "files": list(data_dict.keys()),
+            "cat_col": selected_cat_col,
+            "col": selected_col,
+            "palette": selected_color_palette,
+            "kde_for_constant": use_kde_for_constant,
+            "xlim": xlim,
+        }
+        save_path, cached = lookup_artifact(data_key, render_category_compare, compare_params, version=RENDERER_VERSION)
+
+        if cached:
             st.image(save_path, caption=f"{selected_cat_col} - {selected_col} 저장된 분포 그래프", use_container_width=True)
         else:
-            fig, ax = plt.subplots(figsize=(8, 5))
-            sns.set_palette(CUSTOM_PALETTES[selected_color_palette])
-            plotted = False
-
-            for data_name, df in data_dict.items():
-                if selected_cat_col not in df.columns or selected_col not in df.columns:
-                    continue
-
-                for group_val, group_df in df.groupby(selected_cat_col):
-                    col_data = pd.to_numeric(group_df[selected_col], errors='coerce').dropna()
-                    if len(col_data) == 0:
-                        continue
-
-                    label = f"{data_name} - {group_val}"
-                    unique_vals = col_data.unique()
-
-                    if len(unique_vals) == 1:
-                        if use_kde_for_constant:
-                            noise = np.random.normal(loc=0, scale=0.01, size=len(col_data))
-                            noisy_data = col_data + noise
-                            sns.kdeplot(noisy_data, label=label, ax=ax)
-                        else:
-                            sns.histplot(col_data, bins=1, label=label, ax=ax)
-                    elif len(col_data) > 1:
-                        sns.kdeplot(col_data, label=label, ax=ax)
-
-                    plotted = True
-
-            if plotted:
-                ax.set_title(f"KDE 분포: {selected_cat_col}별 {selected_col}", fontsize=10)
-                ax.set_xlabel(selected_col, fontsize=10)
-                ax.set_ylabel("Density", fontsize=10)
-                ax.legend(title="Data - Group", fontsize=8)
-                ax.grid(True, linestyle="--", alpha=0.4)
-
-                if set_xlim and x_min is not None and x_max is not None and x_min < x_max:
-                    ax.set_xlim(x_min, x_max)
-
-                plt.tight_layout()
-                st.pyplot(fig)
-
-                fig.savefig(save_path)
+            save_path = render_artifact(render_category_compare, save_path, dict(
+                data_dict=data_dict, cat_col=selected_cat_col, col=selected_col,
+                palette=selected_color_palette, use_kde_for_constant=use_kde_for_constant, xlim=xlim,
+            ))
+            if save_path:
+                st.image(save_path, use_container_width=True)
                 st.success(f"✅ 그래프가 저장되었습니다: {save_path}")
             else:
                 st.warning("⚠️ 모든 데이터셋에서 시각화 가능한 데이터가 없어 그래프를 생성하지 못했습니다.")
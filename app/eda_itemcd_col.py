@@ -4,12 +4,20 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 import os
-import hashlib
-from io import StringIO
-from typing import Dict, List
+import sys
+from typing import Dict
 
 import matplotlib.colors as mcolors
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from eda_modules.dataset_cache import load_uploaded_files
+from eda_modules.artifact_cache import combine_keys, lookup_artifact, render_artifact
+from eda_modules.artifact_store import start_background_compaction
+from eda_modules.kde_engine import kde_batch
+from eda_modules.group_index import get_group_index, group_coverage
+from eda_modules.dataset_store import STORE_DIR
+
 CUSTOM_PALETTES = {
     "tab10": sns.color_palette("tab10", 10),
     "tab20": sns.color_palette("tab20", 20),
@@ -20,7 +28,81 @@ CUSTOM_PALETTES = {
     "custom20": list(mcolors.TABLEAU_COLORS.values()) + list(mcolors.CSS4_COLORS.values())[:10]
 }
 
+# 그림 모양이 바뀌면 올려서 이전 캐시 무효화
+RENDERER_VERSION = 2
+
+
+def render_item_compare(data_dict, item_cd, col, palette, use_kde_for_constant, xlim, save_path, data_keys=None):
+    """
+    ITEM_CD 하나에 대해 파일별 col 분포(KDE)를 겹쳐 그린 그림 저장
+
+    data_keys: 파일 이름별 데이터셋 키 (있으면 파일별 ITEM_CD 그룹 인덱스를 재사용)
+
+    Returns:
+        저장 경로 (모든 파일에 그릴 데이터가 없으면 None)
+    """
+    fig, ax = plt.subplots(figsize=(7, 4))
+    sns.set_palette(CUSTOM_PALETTES[palette])
+    # (파일 이름, 'kde' 또는 'hist', 값) — KDE는 모아서 kde_batch로 한 번에 계산 후 순서대로 그림
+    entries = []
+
+    for data_name, df in data_dict.items():
+        if col not in df.columns:
+            st.warning(f"⚠️ `{data_name}`: 선택한 컬럼 **`{col}`** 이 존재하지 않습니다.")
+            continue
+
+        # ITEM_CD별 행 위치 인덱스로 해당 행만 꺼냄 (전체 행 비교 없이 O(그룹 크기))
+        item_index = get_group_index(df, "ITEM_CD", (data_keys or {}).get(data_name), store_dir=STORE_DIR) if "ITEM_CD" in df.columns else None
+        sub_df = item_index.take(df, item_cd, [col]) if item_index is not None else df.iloc[:0]
+        if sub_df.empty:
+            st.warning(f"⚠️ `{data_name}`: ITEM_CD **`{item_cd}`** 에 해당하는 데이터가 없습니다.")
+            continue
+
+        col_data = pd.to_numeric(sub_df[col], errors='coerce').dropna()
+        if len(col_data) == 0:
+            st.warning(f"⚠️ `{data_name}`: `{col}` 컬럼에 유효한 데이터가 없습니다.")
+            continue
+
+        unique_vals = col_data.unique()
+        if len(unique_vals) == 1:
+            if use_kde_for_constant:
+                noise = np.random.normal(loc=0, scale=0.01, size=len(col_data))
+                noisy_data = col_data + noise
+                entries.append((data_name, "kde", noisy_data.to_numpy()))
+            else:
+                entries.append((data_name, "hist", col_data))
+        elif len(col_data) > 1:
+            entries.append((data_name, "kde", col_data.to_numpy()))
+
+    if not entries:
+        plt.close(fig)
+        return None
+
+    kde_indices = [i for i, (_, kind, _) in enumerate(entries) if kind == "kde"]
+    curves = dict(zip(kde_indices, kde_batch([entries[i][2] for i in kde_indices])))
+    for i, (data_name, kind, values) in enumerate(entries):
+        if kind == "hist":
+            sns.histplot(values, bins=1, label=data_name, ax=ax)
+        elif curves.get(i) is not None:
+            ax.plot(*curves[i], label=data_name)
+
+    ax.set_title(f"KDE distribution - ITEM_CD: {item_cd}, Column: {col}", fontsize=8)
+    ax.set_xlabel(col, fontsize=8)
+    ax.set_ylabel("Density", fontsize=8)
+    ax.legend(title="data", fontsize=8)
+    ax.grid(True, linestyle="--", alpha=0.4)
+
+    if xlim:
+        ax.set_xlim(*xlim)
+
+    plt.tight_layout()
+    fig.savefig(save_path)
+    plt.close(fig)
+    return save_path
+
 st.set_page_config(page_title="여러 데이터 분포 비교", layout="centered")
+# 그림 저장소 용량 관리 (서버 프로세스당 한 번 시작되는 백그라운드 LRU 정리)
+start_background_compaction()
 st.title("📊 여러 데이터 분포 비교를 위한 대시보드")
 
 st.markdown("""
@@ -33,17 +115,27 @@ uploaded_files = st.file_uploader("📂 여러 데이터 파일 업로드 (CSV)"
 data_dict: Dict[str, pd.DataFrame] = {}
 
 if uploaded_files:
-    for file in uploaded_files:
-        file_name = os.path.splitext(file.name)[0]
-        stringio = StringIO(file.getvalue().decode("utf-8"))
-        df = pd.read_csv(stringio)
-        data_dict[file_name] = df
-
-    # ✅ 전체 ITEM_CD (합집합)과 공통 수치형 컬럼 (교집합)
-    all_itemcds = sorted(set().union(*[
-        set(df["ITEM_CD"].dropna().unique())
-        for df in data_dict.values() if "ITEM_CD" in df.columns
-    ]))
+    # 파일들을 동시에 청크 단위 적재 (업로드 바이트에서 바로 파싱, 내용 해시 기준 캐시)
+    load_progress = st.progress(0.0, text="📥 데이터 적재 중...")
+    data_dict, load_timings = load_uploaded_files(
+        uploaded_files, sanitize=False,
+        progress_callback=lambda p: load_progress.progress(p, text=f"📥 데이터 적재 중... {p:.0%}")
+    )
+    load_progress.empty()
+    with st.expander("⏱️ 파일별 적재 시간"):
+        st.dataframe(pd.DataFrame(load_timings), use_container_width=True)
+    # 업로드된 파일들의 내용 해시를 묶은 키 (같은 이름으로 내용이 바뀐 파일을 다시 올리면 키도 바뀜)
+    data_key = combine_keys([t["key"] for t in load_timings])
+    data_keys = dict(zip(data_dict.keys(), [t["key"] for t in load_timings]))
+
+    # ✅ 파일별 ITEM_CD 역색인 (데이터셋 저장소에 함께 저장되어 다음 실행부터는 컬럼을 다시 읽지 않음)
+    item_indexes = {
+        name: get_group_index(df, "ITEM_CD", data_keys[name], store_dir=STORE_DIR)
+        for name, df in data_dict.items() if "ITEM_CD" in df.columns
+    }
+    # ✅ 전체 ITEM_CD (합집합, 파일별 행 수 포함)과 공통 수치형 컬럼 (교집합)
+    item_coverage = group_coverage(item_indexes)
+    all_itemcds = item_coverage["value"].tolist()
     all_numerical_cols = set.intersection(*[
         set(df.select_dtypes(include='number').columns)
         for df in data_dict.values()
@@ -54,7 +146,19 @@ if uploaded_files:
     elif not all_numerical_cols:
         st.error("📛 모든 데이터에 공통된 수치형 변수가 없습니다.")
     else:
-        selected_itemcd = st.selectbox("🔍 ITEM_CD 선택", all_itemcds)
+        with st.expander(f"📋 ITEM_CD별 파일 커버리지 ({len(item_coverage):,}개)"):
+            st.dataframe(item_coverage.rename(columns={"value": "ITEM_CD"}), use_container_width=True)
+
+        itemcd_sort = st.radio("ITEM_CD 정렬", ["코드 순", "행 수 많은 순", "파일 커버리지 순"], horizontal=True)
+        if itemcd_sort == "행 수 많은 순":
+            item_coverage = item_coverage.sort_values("total_rows", ascending=False, kind="stable")
+        elif itemcd_sort == "파일 커버리지 순":
+            item_coverage = item_coverage.sort_values(["files", "total_rows"], ascending=False, kind="stable")
+        item_labels = {
+            value: f"{value}  ({rows:,}행, {files}/{len(data_dict)}개 파일)"
+            for value, rows, files in zip(item_coverage["value"], item_coverage["total_rows"], item_coverage["files"])
+        }
+        selected_itemcd = st.selectbox("🔍 ITEM_CD 선택", list(item_labels), format_func=item_labels.get)
         selected_col = st.selectbox("📈 비교할 수치형 변수 선택", sorted(all_numerical_cols))
         selected_color_palette = st.selectbox("🎨 색상 팔레트 선택", list(CUSTOM_PALETTES.keys()), index=0)
         use_kde_for_constant = st.checkbox("📌 단일값 컬럼에 KDE 그리기 (노이즈 포함)", value=False)
@@ -69,68 +173,29 @@ if uploaded_files:
             with col2:
                 x_max = st.number_input("X축 최대값", value=300.0)
 
-        # ✅ 캐시 키 생성: 데이터셋 이름 + 설정 정보 + x축 범위
-        def generate_hash_key(file_names: List[str], item_cd: str, col: str, kde_option: bool, x_min, x_max) -> str:
-            key_str = "_".join(sorted(file_names)) + f"_{item_cd}_{col}_{kde_option}"
-            if set_xlim and x_min is not None and x_max is not None:
-                key_str += f"_xlim_{x_min}_{x_max}"
-            return hashlib.md5(key_str.encode()).hexdigest()
-
-        hash_key = generate_hash_key(list(data_dict.keys()), selected_itemcd, selected_col, use_kde_for_constant, x_min, x_max)
-        save_dir = f"reports_itemcd_col/distributions_by_item_compare/{selected_itemcd}"
-        os.makedirs(save_dir, exist_ok=True)
-        save_path = os.path.join(save_dir, f"{selected_col}_compare_{hash_key}.png")
-
-        if os.path.exists(save_path):
+        # ✅ 아티팩트 캐시 키: 데이터 내용 해시(파일별 캐시 키) + 설정 정보 + x축 범위
+        xlim = (x_min, x_max) if set_xlim and x_min is not None and x_max is not None and x_min < x_max else None
+        compare_params = {
+            "files": list(data_dict.keys()),
+            "item_cd": selected_itemcd,
+            "col": selected_col,
+            "palette": selected_color_palette,
+            "kde_for_constant": use_kde_for_constant,
+            "xlim": xlim,
+        }
+        save_path, cached = lookup_artifact(data_key, render_item_compare, compare_params, version=RENDERER_VERSION)
+
+        if cached:
             st.image(save_path, caption=f"{selected_itemcd} - {selected_col} 저장된 분포 그래프", use_container_width=True)
         else:
             # ➕ 새로 시각화
-            fig, ax = plt.subplots(figsize=(7, 4))
-            sns.set_palette(CUSTOM_PALETTES[selected_color_palette])
-            plotted = False
-
-            for data_name, df in data_dict.items():
-                if selected_col not in df.columns:
-                    st.warning(f"⚠️ `{data_name}`: 선택한 컬럼 **`{selected_col}`** 이 존재하지 않습니다.")
-                    continue
-
-                sub_df = df[df["ITEM_CD"] == selected_itemcd]
-                if sub_df.empty:
-                    st.warning(f"⚠️ `{data_name}`: ITEM_CD **`{selected_itemcd}`** 에 해당하는 데이터가 없습니다.")
-                    continue
-
-                col_data = pd.to_numeric(sub_df[selected_col], errors='coerce').dropna()
-                if len(col_data) == 0:
-                    st.warning(f"⚠️ `{data_name}`: `{selected_col}` 컬럼에 유효한 데이터가 없습니다.")
-                    continue
-
-                unique_vals = col_data.unique()
-                if len(unique_vals) == 1:
-                    if use_kde_for_constant:
-                        noise = np.random.normal(loc=0, scale=0.01, size=len(col_data))
-                        noisy_data = col_data + noise
-                        sns.kdeplot(noisy_data, label=data_name, ax=ax)
-                    else:
-                        sns.histplot(col_data, bins=1, label=data_name, ax=ax)
-                elif len(col_data) > 1:
-                    sns.kdeplot(col_data, label=data_name, ax=ax)
-
-                plotted = True
-
-            if plotted:
-                ax.set_title(f"KDE distribution - ITEM_CD: {selected_itemcd}, Column: {selected_col}", fontsize=8)
-                ax.set_xlabel(selected_col, fontsize=8)
-                ax.set_ylabel("Density", fontsize=8)
-                ax.legend(title="data", fontsize=8)
-                ax.grid(True, linestyle="--", alpha=0.4)
-
-                if set_xlim and x_min is not None and x_max is not None and x_min < x_max:
-                    ax.set_xlim(x_min, x_max)
-
-                plt.tight_layout()
-                st.pyplot(fig)
-
-                fig.savefig(save_path)
+            save_path = render_artifact(render_item_compare, save_path, dict(
+                data_dict=data_dict, item_cd=selected_itemcd, col=selected_col,
+                palette=selected_color_palette, use_kde_for_constant=use_kde_for_constant, xlim=xlim,
+                data_keys=data_keys,
+            ))
+            if save_path:
+                st.image(save_path, use_container_width=True)
                 st.success(f"✅ 그래프가 저장되었습니다: {save_path}")
             else:
                 st.warning("⚠️ 모든 데이터셋에서 시각화 가능한 데이터가 없어 그래프를 생성하지 못했습니다.")
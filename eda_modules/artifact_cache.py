@@ -0,0 +1,132 @@
+# eda_modules/artifact_cache.py
+
+import os
+import sys
+import json
+import hashlib
+import sqlite3
+import threading
+
+import pandas as pd
+
+from eda_modules.artifact_store import ARTIFACT_DIR, record_access, record_write
+
+_stats = {"hits": 0, "misses": 0}
+_lock = threading.Lock()
+
+
+def _renderer_name(renderer):
+    return f"{renderer.__module__}.{renderer.__qualname__}"
+
+def _renderer_version(renderer):
+    # 그림 함수가 있는 모듈의 RENDERER_VERSION (그림 모양이 바뀌면 올려서 이전 캐시 무효화)
+    module = sys.modules.get(renderer.__module__)
+    return str(getattr(module, "RENDERER_VERSION", 1))
+
+def frame_key(df, cols=None):
+    """데이터셋 키가 없을 때 사용할 DataFrame 내용 해시"""
+    data = df if cols is None else df[list(cols)]
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr((list(data.columns), [str(t) for t in data.dtypes])).encode())
+    h.update(pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+def combine_keys(keys):
+    """여러 데이터셋 키를 순서대로 묶은 키 (여러 파일을 함께 그리는 그림용)"""
+    return hashlib.blake2b("|".join(keys).encode(), digest_size=16).hexdigest()
+
+def artifact_key(data_key, renderer, params, version=None):
+    """
+    (데이터 해시, 그림 함수, 파라미터, 렌더러 버전)으로 정해지는 아티팩트 키
+
+    params는 JSON으로 정규화(키 정렬)하므로 딕셔너리 순서와 무관하다.
+    """
+    payload = json.dumps(
+        [data_key, _renderer_name(renderer), version or _renderer_version(renderer), params],
+        sort_keys=True, default=str, ensure_ascii=False,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=20).hexdigest()
+
+def artifact_path(key, renderer, ext="png", store_dir=ARTIFACT_DIR):
+    """그림 함수 이름별 하위 폴더 + 키 앞 2글자로 나눈 저장 경로"""
+    return os.path.join(store_dir, renderer.__name__, key[:2], f"{key}.{ext}")
+
+def _record(hit):
+    with _lock:
+        _stats["hits" if hit else "misses"] += 1
+
+def _index(record_fn, *args, **kwargs):
+    # 저장소 인덱스 기록은 LRU 정리용 부가 정보이므로 실패해도 그림 제공은 계속 (정리 시 파일 기준으로 복구)
+    try:
+        record_fn(*args, **kwargs)
+    except (OSError, sqlite3.Error) as e:
+        print(f"아티팩트 인덱스 기록 실패: {e}")
+
+def lookup_artifact(data_key, renderer, params, ext="png", version=None, store_dir=ARTIFACT_DIR):
+    """
+    캐시 조회 (적중/실패 횟수 기록)
+
+    Returns:
+        (저장 경로, 적중 여부) 튜플 — 적중이 아니면 경로에 새로 그리면 됨
+    """
+    path = artifact_path(artifact_key(data_key, renderer, params, version), renderer, ext, store_dir)
+    hit = os.path.exists(path)
+    _record(hit)
+    _index(record_access, path, data_key=data_key, renderer=_renderer_name(renderer), store_dir=store_dir)
+    return path, hit
+
+def render_artifact(renderer, save_path, kwargs, store_dir=ARTIFACT_DIR):
+    """
+    임시 파일에 그린 뒤 rename으로 교체 (렌더링 워커에서도 실행 가능)
+
+    임시 파일도 같은 확장자를 써서 savefig가 형식을 그대로 인식하도록 한다.
+
+    Returns:
+        저장 경로 (그릴 것이 없어 renderer가 None을 반환하면 None)
+    """
+    os.makedirs(os.path.dirname(save_path), exist_ok=True)
+    root, ext = os.path.splitext(save_path)
+    tmp_path = f"{root}.tmp{os.getpid()}_{threading.get_ident()}{ext}"
+    try:
+        if renderer(save_path=tmp_path, **kwargs) is None:
+            return None
+        os.replace(tmp_path, save_path)
+        _index(record_write, save_path, store_dir=store_dir)
+        return save_path
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def artifact_task(renderer, save_path, kwargs, store_dir=ARTIFACT_DIR):
+    """render_pool에 넘길 (함수, kwargs) 작업"""
+    return render_artifact, dict(renderer=renderer, save_path=save_path, kwargs=kwargs, store_dir=store_dir)
+
+def get_or_render(data_key, renderer, params, kwargs, ext="png", version=None, store_dir=ARTIFACT_DIR):
+    """
+    캐시에 있으면 경로를 바로 반환하고, 없으면 현재 프로세스에서 그려서 저장
+
+    Parameters:
+        data_key: 데이터셋 키 (dataset_cache 키, frame_key, combine_keys 결과 등)
+        renderer: save_path 인자를 받아 그림을 저장하는 함수
+        params: 캐시 키에 들어갈 파라미터 (컬럼, 색상, 임계값, 그룹 값 등)
+        kwargs: renderer에 넘길 인자 (save_path 제외, 데이터 포함)
+
+    Returns:
+        이미지 경로 (그릴 것이 없으면 None)
+    """
+    path, hit = lookup_artifact(data_key, renderer, params, ext, version, store_dir)
+    if hit:
+        return path
+    return render_artifact(renderer, path, kwargs, store_dir)
+
+def artifact_stats():
+    """현재 프로세스의 캐시 적중/실패 횟수"""
+    with _lock:
+        stats = dict(_stats)
+    total = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = stats["hits"] / total if total else 0.0
+    return stats
+
+def reset_artifact_stats():
+    with _lock:
+        _stats["hits"] = _stats["misses"] = 0
@@ -0,0 +1,222 @@
+# eda_modules/artifact_store.py
+
+import os
+import time
+import sqlite3
+import threading
+from contextlib import closing
+
+import pandas as pd
+
+# 생성된 그림(리포트 이미지)의 내용 주소 기반 저장소
+ARTIFACT_DIR = os.path.join("reports", "artifacts")
+INDEX_FILE = "index.sqlite"
+# 저장소 용량 상한 (MB, 환경변수 EDA_ARTIFACT_MAX_MB로 조정)
+MAX_STORE_MB = float(os.environ.get("EDA_ARTIFACT_MAX_MB", 2048))
+# 백그라운드 정리 주기 (초)
+COMPACTION_INTERVAL = 600
+# 같은 아티팩트의 마지막 접근 시각은 이 간격(초)보다 자주 기록하지 않음
+TOUCH_INTERVAL = 60
+# 이 시간(초)보다 오래된 임시 파일/미완성 항목은 정리 대상
+STALE_SECONDS = 3600
+# 아티팩트 캐시 도입 전 이름 기반 경로로 저장되던 리포트 폴더 (LRU 정리 대상에 포함)
+LEGACY_DIRS = ["reports", "outlier_imgs", "reports_catcol", "reports_itemcd_col"]
+
+_last_touch = {}
+_compaction_threads = {}
+_lock = threading.Lock()
+
+
+def _connect(store_dir):
+    os.makedirs(store_dir, exist_ok=True)
+    conn = sqlite3.connect(os.path.join(store_dir, INDEX_FILE), timeout=30)
+    # 여러 프로세스(대시보드, 렌더링 워커, 비교 앱)가 함께 쓰므로 WAL 사용
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS artifacts ("
+        " path TEXT PRIMARY KEY, data_key TEXT, renderer TEXT,"
+        " size_bytes INTEGER DEFAULT 0, created REAL, last_access REAL)"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_last_access ON artifacts(last_access)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_data_key ON artifacts(data_key)")
+    return conn
+
+def _rel(path, store_dir):
+    return os.path.relpath(path, store_dir)
+
+def record_access(path, data_key=None, renderer=None, store_dir=ARTIFACT_DIR):
+    """
+    아티팩트 조회 기록 (캐시 적중 시 마지막 접근 시각 갱신, 실패 시 생성 예정 항목 등록)
+
+    적중 기록은 TOUCH_INTERVAL 이내 재호출을 무시한다.
+    """
+    now = time.time()
+    rel = _rel(path, store_dir)
+    with _lock:
+        if now - _last_touch.get((store_dir, rel), 0) < TOUCH_INTERVAL:
+            return
+        _last_touch[(store_dir, rel)] = now
+    with closing(_connect(store_dir)) as conn, conn:
+        conn.execute(
+            "INSERT INTO artifacts (path, data_key, renderer, created, last_access) VALUES (?, ?, ?, ?, ?)"
+            " ON CONFLICT(path) DO UPDATE SET last_access = excluded.last_access",
+            (rel, data_key, renderer, now, now),
+        )
+
+def record_write(path, store_dir=ARTIFACT_DIR):
+    """렌더링이 끝난 아티팩트의 파일 크기 기록 (렌더링 워커에서도 호출)"""
+    now = time.time()
+    rel = _rel(path, store_dir)
+    size = os.path.getsize(path)
+    with closing(_connect(store_dir)) as conn, conn:
+        conn.execute(
+            "INSERT INTO artifacts (path, size_bytes, created, last_access) VALUES (?, ?, ?, ?)"
+            " ON CONFLICT(path) DO UPDATE SET size_bytes = excluded.size_bytes, created = excluded.created",
+            (rel, size, now, now),
+        )
+
+def _reconcile(conn, store_dir, now):
+    """인덱스와 실제 파일 맞추기: 지워진 파일 항목 삭제, 인덱스에 없는 파일 등록, 오래된 임시 파일 삭제"""
+    indexed = {row[0] for row in conn.execute("SELECT path FROM artifacts")}
+    on_disk = {}
+    removed_tmp = 0
+    for root, _, files in os.walk(store_dir):
+        for fname in files:
+            full = os.path.join(root, fname)
+            if fname.startswith(INDEX_FILE):
+                continue
+            stat = os.stat(full)
+            if ".tmp" in fname:
+                if now - stat.st_mtime > STALE_SECONDS:
+                    os.remove(full)
+                    removed_tmp += 1
+                continue
+            on_disk[_rel(full, store_dir)] = stat
+
+    # 생성 중일 수 있는 최근 항목은 남겨 둠
+    missing = [(p, now - STALE_SECONDS) for p in indexed - set(on_disk)]
+    conn.executemany("DELETE FROM artifacts WHERE path = ? AND last_access < ?", missing)
+    conn.executemany(
+        "INSERT OR IGNORE INTO artifacts (path, size_bytes, created, last_access) VALUES (?, ?, ?, ?)",
+        [(p, s.st_size, s.st_mtime, s.st_mtime) for p, s in on_disk.items() if p not in indexed],
+    )
+    # 크기가 기록되지 않은 항목(다른 프로세스에서 완료된 렌더링) 보정
+    conn.executemany(
+        "UPDATE artifacts SET size_bytes = ? WHERE path = ? AND size_bytes = 0",
+        [(s.st_size, p) for p, s in on_disk.items()],
+    )
+    return removed_tmp
+
+def _legacy_files(store_dir, legacy_dirs):
+    """이름 기반 리포트 폴더의 이미지 파일 (아티팩트 저장소 자체는 제외)"""
+    store_abs = os.path.abspath(store_dir)
+    files = []
+    for legacy_dir in legacy_dirs:
+        for root, dirs, names in os.walk(legacy_dir):
+            dirs[:] = [d for d in dirs if os.path.abspath(os.path.join(root, d)) != store_abs]
+            for fname in names:
+                if fname.lower().endswith(".png"):
+                    full = os.path.join(root, fname)
+                    stat = os.stat(full)
+                    files.append((max(stat.st_atime, stat.st_mtime), stat.st_size, full))
+    return files
+
+def _remove_empty_dirs(top):
+    for root, _, _ in os.walk(top, topdown=False):
+        if root != top and not os.listdir(root):
+            try:
+                os.rmdir(root)
+            except OSError:
+                pass
+
+def compact_store(max_mb=None, store_dir=ARTIFACT_DIR, legacy_dirs=LEGACY_DIRS):
+    """
+    저장소 정리: 인덱스 정합성 맞추기 + 용량 상한을 넘으면 오래 안 쓴 이미지부터 삭제(LRU)
+
+    아티팩트 캐시 이전의 이름 기반 리포트 폴더(legacy_dirs) 이미지도
+    파일 접근/수정 시각 기준으로 같은 LRU 순서에 포함한다.
+
+    Parameters:
+        max_mb: 용량 상한 (None이면 MAX_STORE_MB)
+
+    Returns:
+        {'evicted', 'freed_mb', 'removed_tmp', 'total_mb'} 딕셔너리
+    """
+    max_bytes = (MAX_STORE_MB if max_mb is None else max_mb) * 1024 ** 2
+    now = time.time()
+    with closing(_connect(store_dir)) as conn, conn:
+        removed_tmp = _reconcile(conn, store_dir, now)
+        indexed = [(last_access, size, os.path.join(store_dir, path), path)
+                   for path, size, last_access in conn.execute(
+                       "SELECT path, size_bytes, last_access FROM artifacts")]
+        legacy = [(t, size, full, None) for t, size, full in _legacy_files(store_dir, legacy_dirs)]
+        candidates = sorted(indexed + legacy)
+        total = sum(size for _, size, _, _ in candidates)
+
+        evicted, freed = 0, 0
+        for _, size, full, rel in candidates:
+            if total - freed <= max_bytes:
+                break
+            try:
+                os.remove(full)
+            except FileNotFoundError:
+                pass
+            if rel is not None:
+                conn.execute("DELETE FROM artifacts WHERE path = ?", (rel,))
+            evicted += 1
+            freed += size
+
+    if evicted:
+        for top in [store_dir] + list(legacy_dirs):
+            _remove_empty_dirs(top)
+    return {
+        "evicted": evicted,
+        "freed_mb": round(freed / 1024 ** 2, 2),
+        "removed_tmp": removed_tmp,
+        "total_mb": round((total - freed) / 1024 ** 2, 2),
+    }
+
+def store_usage(store_dir=ARTIFACT_DIR):
+    """
+    데이터셋별 아티팩트 사용량
+
+    Returns:
+        data_key, files, size_mb, last_access 컬럼의 DataFrame (용량 큰 순)
+    """
+    columns = ["data_key", "files", "size_mb", "last_access"]
+    with closing(_connect(store_dir)) as conn:
+        rows = conn.execute(
+            "SELECT COALESCE(data_key, '(unknown)'), COUNT(*), SUM(size_bytes), MAX(last_access)"
+            " FROM artifacts GROUP BY 1 ORDER BY 3 DESC"
+        ).fetchall()
+    usage = pd.DataFrame(rows, columns=columns)
+    # 인덱스가 비어 있으면 컬럼이 object 타입이 되므로 수치로 변환 후 계산
+    usage["size_mb"] = (pd.to_numeric(usage["size_mb"]).fillna(0) / 1024 ** 2).round(2)
+    usage["last_access"] = pd.to_datetime(pd.to_numeric(usage["last_access"]), unit="s")
+    return usage
+
+def start_background_compaction(interval=COMPACTION_INTERVAL, max_mb=None, store_dir=ARTIFACT_DIR):
+    """
+    주기적으로 compact_store를 실행하는 데몬 스레드 시작 (저장소별로 한 번만 시작)
+
+    Returns:
+        정리 스레드
+    """
+    with _lock:
+        thread = _compaction_threads.get(store_dir)
+        if thread is not None and thread.is_alive():
+            return thread
+
+        def run():
+            while True:
+                try:
+                    compact_store(max_mb, store_dir)
+                except (OSError, sqlite3.Error) as e:
+                    print(f"아티팩트 저장소 정리 실패: {e}")
+                time.sleep(interval)
+
+        thread = threading.Thread(target=run, name="artifact-compaction", daemon=True)
+        thread.start()
+        _compaction_threads[store_dir] = thread
+        return thread
@@ -0,0 +1,244 @@
+# eda_modules/batch_report.py
+"""
+대시보드 그림(아티팩트)을 미리 생성하는 배치 리포트
+
+대시보드와 같은 데이터셋 캐시(data/)와 같은 작업 생성 함수를 사용하므로,
+여기서 만든 그림은 대시보드에서 같은 설정을 선택했을 때 캐시 적중으로 바로 표시된다.
+이미 있는 그림은 건너뛰므로 중간에 멈춘 뒤 다시 실행하면 남은 그림만 생성한다.
+
+사용 예:
+    python -m eda_modules.batch_report data.csv --config batch_config.json --workers 4
+
+설정 파일(JSON, 모든 항목 선택):
+    {
+        "compact": true,                       # 대시보드 '메모리 절약 모드'와 같게
+        "sheet": null,                         # 엑셀 시트 이름
+        "filter": null,                        # 제외 컬럼 설정 파일 (기본: feature_filters/filter_config_<파일명>.json)
+        "group_cols": ["ITEM_CD"],             # 그룹별 그림을 만들 범주형 컬럼 (전체 데이터 그림은 항상 생성)
+        "outlier_methods": ["boxplot"],        # 'boxplot', 'zscore', 'iqr'
+        "z_threshold": 3.0, "q1": 25, "q3": 75, "k": 1.5,
+        "colors": {"outlier": "skyblue", "kde": "skyblue"},
+        "exact": null,                         # 분위수 정확 계산 (null=행 수로 자동, 대시보드 기본값)
+        "distributions": true,
+        "heatmap_pairs": [["LINE", "ITEM_CD"]],
+        "null_zero": {"cat_cols": ["ITEM_CD"], "checks": ["0", "Null"]},
+        "correlation": ["pearson"]
+    }
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+
+import pandas as pd
+import matplotlib  # type: ignore
+
+from eda_modules.dataset_cache import load_dataset
+from eda_modules.group_index import get_group_index
+from eda_modules.render_pool import render_streaming, RENDER_WORKERS
+from eda_modules.artifact_cache import ARTIFACT_DIR, artifact_task, lookup_artifact
+from eda_modules.outlier_detection import outlier_jobs
+from eda_modules.value_distribution import distribution_jobs
+from eda_modules.categorical_heatmap import cat_matrix_jobs
+from eda_modules.null_0_value_check import check_0_value, check_null_value
+from eda_modules.correlation_matrix import plot_correlation_matrix
+
+DEFAULT_CONFIG = {
+    "compact": True,
+    "sheet": None,
+    "filter": None,
+    "group_cols": [],
+    "outlier_methods": ["boxplot"],
+    "z_threshold": 3.0,
+    "q1": 25,
+    "q3": 75,
+    "k": 1.5,
+    "colors": {"outlier": "skyblue", "kde": "skyblue"},
+    "exact": None,
+    "distributions": True,
+    "heatmap_pairs": [],
+    "null_zero": {"cat_cols": [], "checks": ["0", "Null"]},
+    "correlation": ["pearson"],
+}
+# 배치 실행 요약 저장 폴더
+SUMMARY_DIR = os.path.join("reports", "batch")
+
+
+def load_config(path=None):
+    """설정 파일을 읽어 기본값과 합침"""
+    config = json.loads(json.dumps(DEFAULT_CONFIG))
+    if path:
+        with open(path, "r", encoding="utf-8") as f:
+            user_config = json.load(f)
+        for key, value in user_config.items():
+            if isinstance(value, dict) and isinstance(config.get(key), dict):
+                config[key].update(value)
+            else:
+                config[key] = value
+    return config
+
+def _filtered_var_types(var_types, filter_path):
+    """대시보드의 제외 컬럼 설정(filter_config_*.json)을 적용한 변수 유형"""
+    excluded = {"datetime": [], "categorical": [], "numerical": []}
+    if filter_path and os.path.exists(filter_path):
+        with open(filter_path, "r", encoding="utf-8") as f:
+            excluded.update(json.load(f))
+    return {kind: [c for c in cols if c not in excluded.get(kind, [])] for kind, cols in var_types.items()}
+
+def build_jobs(df, data_key, var_types, config, store_dir=ARTIFACT_DIR):
+    """
+    모듈별 (이미지 경로, 작업) 목록과 목록을 만드는 데 걸린 시간
+
+    Returns:
+        {모듈 이름: (jobs, 초)} 딕셔너리
+    """
+    num_cols = var_types["numerical"]
+    dist_cols = var_types["numerical"] + var_types["categorical"]
+    colors = config["colors"]
+    exact = config["exact"]
+    modules = {}
+
+    def timed(name, build):
+        start = time.perf_counter()
+        jobs = build()
+        modules[name] = (jobs, time.perf_counter() - start)
+
+    def outliers():
+        jobs = []
+        options = dict(z_threshold=config["z_threshold"], q1=config["q1"], q3=config["q3"], k=config["k"])
+        for method in config["outlier_methods"]:
+            jobs += outlier_jobs(df, num_cols, method, color=colors["outlier"], exact=exact,
+                                 data_key=data_key, store_dir=store_dir, **options)
+            for group_col in config["group_cols"]:
+                for value in get_group_index(df, group_col, data_key).values():
+                    jobs += outlier_jobs(df, num_cols, method, group_col=group_col, group_value=value,
+                                         color=colors["outlier"], exact=exact, data_key=data_key,
+                                         store_dir=store_dir, **options)
+        return jobs
+
+    def distributions():
+        if not config["distributions"]:
+            return []
+        jobs = distribution_jobs(df, dist_cols, None, colors["kde"], data_key, store_dir)
+        for group_col in config["group_cols"]:
+            jobs += distribution_jobs(df, dist_cols, group_col, colors["kde"], data_key, store_dir)
+        return jobs
+
+    def cat_heatmaps():
+        jobs = []
+        for cat_cols in config["heatmap_pairs"]:
+            jobs += cat_matrix_jobs(df, list(cat_cols), num_cols, exact=exact, data_key=data_key, store_dir=store_dir)
+        return jobs
+
+    def null_zero():
+        jobs = []
+        renderers = {"0": check_0_value, "Null": check_null_value}
+        for cat_col in config["null_zero"]["cat_cols"]:
+            for check in config["null_zero"]["checks"]:
+                renderer = renderers[check]
+                img_path, hit = lookup_artifact(data_key, renderer, {"cols": num_cols, "cat_col": cat_col},
+                                                store_dir=store_dir)
+                jobs.append((img_path, None if hit else artifact_task(renderer, img_path, dict(
+                    df=df[num_cols + [cat_col]], cols=num_cols, cat_col=cat_col, data_key=data_key), store_dir)))
+        return jobs
+
+    def correlation():
+        jobs = []
+        for method in config["correlation"]:
+            img_path, hit = lookup_artifact(data_key, plot_correlation_matrix, {"cols": num_cols, "method": method},
+                                            store_dir=store_dir)
+            jobs.append((img_path, None if hit else artifact_task(plot_correlation_matrix, img_path, dict(
+                df=df[num_cols], num_cols=num_cols, method=method, data_key=data_key), store_dir)))
+        return jobs
+
+    timed("outliers", outliers)
+    timed("distributions", distributions)
+    timed("cat_heatmaps", cat_heatmaps)
+    timed("null_zero", null_zero)
+    if num_cols:
+        timed("correlation", correlation)
+    return modules
+
+def _timed_task(fn, kwargs):
+    """렌더링 워커에서 작업 하나를 실행하고 (결과, 걸린 시간, 오류)를 반환 (오류가 나도 배치는 계속)"""
+    start = time.perf_counter()
+    try:
+        return fn(**kwargs), time.perf_counter() - start, None
+    except Exception as e:
+        return None, time.perf_counter() - start, f"{type(e).__name__}: {e}"
+
+def run_batch(path, config, max_workers=None, store_dir=ARTIFACT_DIR, log=print):
+    """
+    데이터셋 하나에 대해 설정된 모든 그림을 생성
+
+    Returns:
+        모듈별 jobs, cached, rendered, failed, build_s, render_s 요약 DataFrame
+    """
+    start = time.perf_counter()
+    file_name = os.path.basename(path)
+    ext = file_name.split(".")[-1].lower()
+    with open(path, "rb") as f:
+        data = f.read()
+    # 대시보드 업로드와 같은 방식(내용 해시, sanitize, 메모리 절약 모드)으로 적재해야 같은 데이터셋 키가 나옴
+    data_key, df, var_types = load_dataset(
+        data, ext, sanitize=True, compact=config["compact"], sheet_name=config["sheet"],
+        name=file_name if config["sheet"] is None else f"{file_name} [{config['sheet']}]",
+    )
+    data_name = file_name.split(".")[0]
+    filter_path = config["filter"] or os.path.join("feature_filters", f"filter_config_{data_name}.json")
+    var_types = _filtered_var_types(var_types, filter_path)
+    log(f"데이터셋 {file_name} ({len(df):,}행, 키 {data_key}) 적재: {time.perf_counter() - start:.1f}초")
+
+    modules = build_jobs(df, data_key, var_types, config, store_dir)
+    summary = {
+        name: {"jobs": len(jobs), "cached": sum(task is None for _, task in jobs), "rendered": 0,
+               "failed": 0, "build_s": round(build_s, 2), "render_s": 0.0}
+        for name, (jobs, build_s) in modules.items()
+    }
+
+    # 모든 모듈의 남은 작업을 한 번에 렌더링 프로세스 풀로
+    pending = [(name, task) for name, (jobs, _) in modules.items() for _, task in jobs if task is not None]
+    log(f"그림 {sum(s['jobs'] for s in summary.values()):,}개 중 {len(pending):,}개 생성 시작")
+    tasks = [(_timed_task, dict(fn=fn, kwargs=kwargs)) for _, (fn, kwargs) in pending]
+    for done, (idx, (result, seconds, error)) in enumerate(render_streaming(tasks, max_workers), start=1):
+        name = pending[idx][0]
+        summary[name]["render_s"] += seconds
+        if error:
+            summary[name]["failed"] += 1
+            log(f"[{name}] 실패: {error}")
+        else:
+            summary[name]["rendered"] += 1
+        if done % 50 == 0 or done == len(tasks):
+            log(f"  {done:,}/{len(tasks):,} 완료")
+
+    summary_df = pd.DataFrame.from_dict(summary, orient="index").rename_axis("module")
+    summary_df["render_s"] = summary_df["render_s"].round(2)
+    wall_s = round(time.perf_counter() - start, 2)
+
+    os.makedirs(SUMMARY_DIR, exist_ok=True)
+    with open(os.path.join(SUMMARY_DIR, f"{data_key}.json"), "w", encoding="utf-8") as f:
+        json.dump({"file": file_name, "data_key": data_key, "finished": time.time(), "wall_s": wall_s,
+                   "config": config, "modules": summary}, f, ensure_ascii=False, indent=2)
+    log(f"전체 {wall_s:.1f}초 (render_s는 워커 프로세스에서 걸린 시간의 합)")
+    return summary_df
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="대시보드 그림을 미리 생성하는 배치 리포트")
+    parser.add_argument("path", help="데이터 파일 (CSV / Excel)")
+    parser.add_argument("--config", help="설정 JSON 파일")
+    parser.add_argument("--workers", type=int, default=RENDER_WORKERS, help="동시 렌더링 프로세스 수")
+    args = parser.parse_args(argv)
+
+    # 대시보드와 같은 폰트 설정 (렌더링 워커도 이 설정을 물려받음)
+    matplotlib.use("Agg")
+    matplotlib.rcParams["font.family"] = "Malgun Gothic"
+    matplotlib.rcParams["axes.unicode_minus"] = False
+
+    summary = run_batch(args.path, load_config(args.config), max_workers=args.workers)
+    print(summary.to_string())
+    return 1 if summary["failed"].sum() else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,27 +6,57 @@ from scipy import stats  # type: ignore
 from statsmodels.formula.api import ols  # type: ignore
 import statsmodels.api as sm  # type: ignore
 from statsmodels.stats.multicomp import pairwise_tukeyhsd  # type: ignore
-from itertools import combinations
+from eda_modules.group_index import get_group_index
+from eda_modules.normality_engine import grouped_normality
+from eda_modules.outlier_mask import outlier_keep_mask
+from eda_modules.sparse_anova import sparse_type2_anova
+from eda_modules.group_summary import group_summary, pairwise_tests, oneway_anova, tukey_hsd
 
-def remove_outliers_zscore(df, col, threshold=7.0):
-    z_scores = np.abs(stats.zscore(df[col].dropna()))
-    return df[df[col].isin(df[col].dropna()[z_scores < threshold])]
-
-def perform_multivariate_anova(df, cat_cols, num_col, z_threshold=7.0):
-    """
-    다변량 ANOVA (범주형 변수들 vs 수치형 변수) 분석 수행
+def _keep_mask(df, cat_cols, num_col, threshold=7.0, outlier_method='zscore', outlier_within=False, data_key=None):
     """
-    df_clean = df.dropna(subset=[num_col] + cat_cols)
-    df_clean = remove_outliers_zscore(df_clean, num_col, threshold=z_threshold)
+    검정에 사용할 행의 불리언 마스크 (df 행 기준)
 
-    # 범주형 변수는 문자열로 변환
+    공유 이상치 마스크(수치형 컬럼 기준, 캐시) 중 범주형 값이 모두 있는 행.
+    outlier_within이면 첫 번째 범주형 변수의 그룹 안에서 이상치 기준을 계산한다.
+    """
+    group_col = cat_cols[0] if outlier_within else None
+    keep = outlier_keep_mask(df, num_col, outlier_method, threshold, group_col=group_col, data_key=data_key).copy()
     for col in cat_cols:
-        df_clean[col] = df_clean[col].astype(str)
+        keep &= df[col].notna().to_numpy()
+    return keep
+
+def _clean_frame(df, cat_cols, num_col, threshold=7.0, outlier_method='zscore', outlier_within=False, data_key=None):
+    """이상치 / 결측을 제외하고 범주형 변수를 문자열로 바꾼 [num_col] + cat_cols 데이터프레임"""
+    keep = _keep_mask(df, cat_cols, num_col, threshold, outlier_method, outlier_within, data_key)
+    df_clean = df[[num_col] + cat_cols].iloc[np.flatnonzero(keep)]
+    return df_clean.assign(**{col: df_clean[col].astype(str) for col in cat_cols})
+
+def perform_multivariate_anova(df, cat_cols, num_col, z_threshold=7.0, outlier_method='zscore', data_key=None,
+                               method='sparse'):
+    """
+    다변량 ANOVA (범주형 변수들 vs 수치형 변수) 분석 수행
 
-    formula = f"{num_col} ~ " + " + ".join(cat_cols)
+    이상치는 전체 데이터 기준 공유 마스크로 제거 (outlier_method: 'zscore', 'iqr', 'mad', 임계값은 z_threshold)
+    method: 'sparse' (희소 원-핫 설계행렬 + 희소 최소제곱으로 Type II 제곱합, 수준이 많은 범주형 변수용) 또는
+            'statsmodels' (OLS + anova_lm(typ=2), 교차 검증용 — 밀집 더미 행렬을 만듦)
+    """
     try:
-        model = ols(formula, data=df_clean).fit()
-        anova_table = sm.stats.anova_lm(model, typ=2)
+        if method == 'statsmodels':
+            # 범주형 변수는 문자열로 변환
+            df_clean = _clean_frame(df, cat_cols, num_col, z_threshold, outlier_method, data_key=data_key)
+            formula = f"{num_col} ~ " + " + ".join(cat_cols)
+            model = ols(formula, data=df_clean).fit()
+            anova_table = sm.stats.anova_lm(model, typ=2)
+        else:
+            # 범주형 변수는 문자열 이름 기준 코드로 (astype(str)과 같은 그룹), 실제로 남은 수준만 사용
+            rows = np.flatnonzero(_keep_mask(df, cat_cols, num_col, z_threshold, outlier_method, data_key=data_key))
+            factors = []
+            for col in cat_cols:
+                _, codes = get_group_index(df, col, data_key).label_row_codes(len(df))
+                levels, codes = np.unique(codes[rows], return_inverse=True)
+                factors.append((col, codes, len(levels)))
+            values = df[num_col].to_numpy(dtype=np.float64, na_value=np.nan)[rows]
+            anova_table = sparse_type2_anova(values, factors)
         result_df = anova_table[['F', 'PR(>F)']].rename(columns={'F': 'F-statistic', 'PR(>F)': 'p-value'})
         result_df["Significant (<0.05)"] = result_df["p-value"] < 0.05
         return result_df.reset_index().rename(columns={'index': 'Variable'})
@@ -34,7 +64,7 @@ def perform_multivariate_anova(df, cat_cols, num_col, z_threshold=7.0):
         print(f"ANOVA 분석 실패: {e}")
         return None
 
-def perform_normality_test(df, num_col, cat_col=None, method='shapiro'):
+def perform_normality_test(df, num_col, cat_col=None, method='shapiro', data_key=None, seed=42, max_workers=None):
     """
     정규성 검정 수행
     
@@ -42,97 +72,40 @@ def perform_normality_test(df, num_col, cat_col=None, method='shapiro'):
         df: 데이터프레임
         num_col: 수치형 변수명
         cat_col: 범주형 변수명 (None이면 전체 데이터에 대해 검정)
-        method: 'shapiro' 또는 'ks' (Kolmogorov-Smirnov)
+        method: 'shapiro', 'ks' (Kolmogorov-Smirnov), 'anderson' (Anderson-Darling),
+                'dagostino' (D'Agostino-Pearson, 큰 표본에서 가벼움)
+        data_key: 데이터셋 키 (있으면 그룹 인덱스와 검정 결과를 캐시해서 재사용)
+        seed: Shapiro-Wilk 표본 추출(5000개 초과 시) seed
+        max_workers: 그룹별 검정 스레드 수
     
     Returns:
         결과 딕셔너리
     """
-    results = {}
-    
-    if cat_col is None:
-        # 전체 데이터에 대한 정규성 검정
-        data = df[num_col].dropna()
-        if len(data) < 3:
-            return {"error": "데이터가 너무 적습니다 (최소 3개 필요)"}
-        
-        if method == 'shapiro':
-            # Shapiro-Wilk 검정 (샘플 크기 제한: 5000)
-            if len(data) > 5000:
-                data = data.sample(5000, random_state=42)
-            stat, p_value = stats.shapiro(data)
-            test_name = "Shapiro-Wilk"
-        else:  # ks
-            # Kolmogorov-Smirnov 검정 (정규분포와 비교)
-            stat, p_value = stats.kstest(data, 'norm', args=(data.mean(), data.std()))
-            test_name = "Kolmogorov-Smirnov"
-        
-        results = {
-            "test": test_name,
-            "group": "전체",
-            "statistic": stat,
-            "p_value": p_value,
-            "is_normal": p_value > 0.05,
-            "sample_size": len(data)
-        }
-    else:
-        # 그룹별 정규성 검정
-        groups = df[cat_col].dropna().unique()
-        group_results = []
-        
-        for group in groups:
-            group_data = df[df[cat_col] == group][num_col].dropna()
-            if len(group_data) < 3:
-                group_results.append({
-                    "test": method,
-                    "group": str(group),
-                    "statistic": None,
-                    "p_value": None,
-                    "is_normal": None,
-                    "sample_size": len(group_data),
-                    "error": "데이터가 너무 적습니다"
-                })
-                continue
-            
-            if method == 'shapiro':
-                if len(group_data) > 5000:
-                    group_data = group_data.sample(5000, random_state=42)
-                stat, p_value = stats.shapiro(group_data)
-                test_name = "Shapiro-Wilk"
-            else:  # ks
-                stat, p_value = stats.kstest(group_data, 'norm', args=(group_data.mean(), group_data.std()))
-                test_name = "Kolmogorov-Smirnov"
-            
-            group_results.append({
-                "test": test_name,
-                "group": str(group),
-                "statistic": stat,
-                "p_value": p_value,
-                "is_normal": p_value > 0.05,
-                "sample_size": len(group_data)
-            })
-        
-        results = {"groups": group_results}
-    
-    return results
+    # 그룹별 검정은 컬럼을 그룹별 배열로 한 번에 나눈 뒤 스레드 풀에서 동시에 수행
+    return grouped_normality(df, num_col, cat_col, method=method, seed=seed, data_key=data_key,
+                             max_workers=max_workers)
 
-def perform_anova_with_posthoc(df, cat_col, num_col, z_threshold=7.0):
+def _summary_by_label(df, cat_col, num_col, z_threshold=7.0, outlier_method='zscore', outlier_within=False, data_key=None):
     """
-    ANOVA 검정 및 사후검정 (Tukey HSD) 수행
-    
-    Parameters:
-        df: 데이터프레임
-        cat_col: 범주형 변수명 (단일 변수만)
-        num_col: 수치형 변수명
-        z_threshold: 이상치 제거 임계값
-    
+    이상치 제거 후 문자열 그룹 이름별 충분통계량
+
+    이상치 제거는 행 마스크로, 그룹은 캐시된 그룹 인덱스의 행별 코드로 처리한다.
+    그룹 이름은 문자열로 변환 (같은 문자열이 되는 값은 한 그룹)하고 이름 순으로 코드를 재배정한다.
+
     Returns:
-        (anova_result, posthoc_result) 튜플
+        (그룹 이름 리스트, group_summary 결과)
     """
-    df_clean = df.dropna(subset=[num_col, cat_col])
-    df_clean = remove_outliers_zscore(df_clean, num_col, threshold=z_threshold)
+    groups, label_codes = get_group_index(df, cat_col, data_key).label_row_codes(len(df))
+    keep = _keep_mask(df, [cat_col], num_col, z_threshold, outlier_method, outlier_within, data_key)
+    row_codes = np.where(keep, label_codes, -1)
     
+    summary = group_summary(df[num_col].to_numpy(dtype=np.float64, na_value=np.nan), row_codes, len(groups))
+    return groups, summary
+
+def _anova_statsmodels(df, cat_col, num_col, z_threshold=7.0, outlier_method='zscore', outlier_within=False, data_key=None):
+    """statsmodels OLS(C(범주) 더미) + pairwise_tukeyhsd로 계산하는 ANOVA / Tukey HSD (교차 검증용)"""
     # 범주형 변수는 문자열로 변환
-    df_clean[cat_col] = df_clean[cat_col].astype(str)
+    df_clean = _clean_frame(df, [cat_col], num_col, z_threshold, outlier_method, outlier_within, data_key)
     
     # 그룹별 데이터 추출
     groups = df_clean[cat_col].unique()
@@ -182,7 +155,62 @@ def perform_anova_with_posthoc(df, cat_col, num_col, z_threshold=7.0):
     
     return anova_result, posthoc_result
 
-def perform_independent_ttest(df, cat_col, num_col, z_threshold=7.0):
+def perform_anova_with_posthoc(df, cat_col, num_col, z_threshold=7.0, method='summary', data_key=None,
+                               outlier_method='zscore', outlier_within=False):
+    """
+    ANOVA 검정 및 사후검정 (Tukey HSD) 수행
+    
+    Parameters:
+        df: 데이터프레임
+        cat_col: 범주형 변수명 (단일 변수만)
+        num_col: 수치형 변수명
+        z_threshold: 이상치 제거 임계값
+        method: 'summary' (그룹별 합/제곱합으로 F와 Tukey HSD를 바로 계산) 또는
+                'statsmodels' (OLS + pairwise_tukeyhsd, 교차 검증용 — 행 수 x 그룹 수 크기의 설계행렬을 만듦)
+        data_key: 데이터셋 키 (있으면 그룹 인덱스와 이상치 마스크를 캐시해서 재사용)
+        outlier_method: 이상치 제거 방식 ('zscore', 'iqr', 'mad')
+        outlier_within: True면 범주형 변수의 그룹 안에서 이상치 기준을 계산
+    
+    Returns:
+        (anova_result, posthoc_result) 튜플 (두 방식의 결과 형식은 같음)
+    """
+    if method == 'statsmodels':
+        return _anova_statsmodels(df, cat_col, num_col, z_threshold, outlier_method, outlier_within, data_key)
+    
+    groups, summary = _summary_by_label(df, cat_col, num_col, z_threshold, outlier_method, outlier_within, data_key)
+    if (summary["n"] > 0).sum() < 2:
+        return None, {"error": "최소 2개 이상의 그룹이 필요합니다"}
+    
+    anova = oneway_anova(summary)
+    anova_result = {
+        "F-statistic": anova["F"],
+        "p-value": anova["p"],
+        "Significant (<0.05)": anova["p"] < 0.05
+    }
+    
+    # 사후검정 (Tukey HSD) — 같은 그룹 요약에서 스튜던트화 범위 분포로 계산
+    posthoc_result = None
+    if anova_result["p-value"] < 0.05:  # 유의한 경우에만 사후검정
+        tukey = tukey_hsd(summary, alpha=0.05)
+        # pairwise_tukeyhsd 요약표와 같은 컬럼 / 반올림
+        posthoc_df = pd.DataFrame({
+            "group1": [groups[k] for k in tukey["i"]],
+            "group2": [groups[k] for k in tukey["j"]],
+            "meandiff": tukey["meandiff"].round(4),
+            "p-adj": tukey["p_adj"].round(4),
+            "lower": tukey["lower"].round(4),
+            "upper": tukey["upper"].round(4),
+            "reject": tukey["reject"],
+        })
+        posthoc_result = {
+            "summary": posthoc_df,
+            "reject": tukey["reject"].to_numpy()
+        }
+    
+    return anova_result, posthoc_result
+
+def perform_independent_ttest(df, cat_col, num_col, z_threshold=7.0, outlier_method='zscore', outlier_within=False,
+                              data_key=None):
     """
     독립표본 t검정 수행 (두 그룹 간 비교)
     
@@ -191,15 +219,15 @@ def perform_independent_ttest(df, cat_col, num_col, z_threshold=7.0):
         cat_col: 범주형 변수명 (2개의 그룹만 있어야 함)
         num_col: 수치형 변수명
         z_threshold: 이상치 제거 임계값
+        outlier_method: 이상치 제거 방식 ('zscore', 'iqr', 'mad')
+        outlier_within: True면 범주형 변수의 그룹 안에서 이상치 기준을 계산
+        data_key: 데이터셋 키 (있으면 이상치 마스크를 캐시해서 재사용)
     
     Returns:
         결과 딕셔너리
     """
-    df_clean = df.dropna(subset=[num_col, cat_col])
-    df_clean = remove_outliers_zscore(df_clean, num_col, threshold=z_threshold)
-    
     # 범주형 변수는 문자열로 변환
-    df_clean[cat_col] = df_clean[cat_col].astype(str)
+    df_clean = _clean_frame(df, [cat_col], num_col, z_threshold, outlier_method, outlier_within, data_key)
     
     # 그룹별 데이터 추출
     groups = df_clean[cat_col].unique()
@@ -245,7 +273,8 @@ def perform_independent_ttest(df, cat_col, num_col, z_threshold=7.0):
     
     return result
 
-def perform_ttest_posthoc(df, cat_col, num_col, z_threshold=7.0, alpha=0.05, correction='bonferroni'):
+def perform_ttest_posthoc(df, cat_col, num_col, z_threshold=7.0, alpha=0.05, correction='bonferroni', data_key=None,
+                          outlier_method='zscore', outlier_within=False):
     """
     독립표본 t검정 사후검정 (여러 그룹 간 쌍별 비교)
     
@@ -256,60 +285,36 @@ def perform_ttest_posthoc(df, cat_col, num_col, z_threshold=7.0, alpha=0.05, cor
         z_threshold: 이상치 제거 임계값
         alpha: 유의수준
         correction: 다중비교 보정 방법 ('bonferroni', 'holm', 'fdr_bh', 'none')
+        data_key: 데이터셋 키 (있으면 그룹 인덱스와 이상치 마스크를 캐시해서 재사용)
+        outlier_method: 이상치 제거 방식 ('zscore', 'iqr', 'mad')
+        outlier_within: True면 범주형 변수의 그룹 안에서 이상치 기준을 계산
     
     Returns:
         결과 데이터프레임
     """
-    df_clean = df.dropna(subset=[num_col, cat_col])
-    df_clean = remove_outliers_zscore(df_clean, num_col, threshold=z_threshold)
-    
-    # 범주형 변수는 문자열로 변환
-    df_clean[cat_col] = df_clean[cat_col].astype(str)
-    
-    # 그룹별 데이터 추출
-    groups = sorted(df_clean[cat_col].unique())
-    if len(groups) < 2:
+    # 그룹별 n, 평균, 분산, 중앙값 기준 절대편차를 한 번에 계산
+    groups, summary = _summary_by_label(df, cat_col, num_col, z_threshold, outlier_method, outlier_within, data_key)
+    if (summary["n"] > 0).sum() < 2:
         return pd.DataFrame({"error": ["최소 2개 이상의 그룹이 필요합니다"]})
     
-    # 모든 그룹 쌍에 대해 t검정 수행
-    results = []
-    for group1, group2 in combinations(groups, 2):
-        data1 = df_clean[df_clean[cat_col] == group1][num_col].dropna()
-        data2 = df_clean[df_clean[cat_col] == group2][num_col].dropna()
-        
-        if len(data1) < 2 or len(data2) < 2:
-            continue
-        
-        # 등분산성 검정
-        levene_stat, levene_p = stats.levene(data1, data2)
-        equal_var = levene_p > 0.05
-        
-        # t검정
-        t_stat, p_value = stats.ttest_ind(data1, data2, equal_var=equal_var)
-        
-        # 효과 크기
-        numerator = (len(data1) - 1) * data1.std()**2 + (len(data2) - 1) * data2.std()**2
-        denominator = len(data1) + len(data2) - 2
-        pooled_std = np.sqrt(numerator / denominator)
-        cohens_d = (data1.mean() - data2.mean()) / pooled_std if pooled_std > 0 else 0
-        
-        results.append({
-            "Group1": group1,
-            "Group2": group2,
-            "Group1_Mean": data1.mean(),
-            "Group2_Mean": data2.mean(),
-            "Group1_N": len(data1),
-            "Group2_N": len(data2),
-            "t-statistic": t_stat,
-            "p-value": p_value,
-            "Equal_Variance": equal_var,
-            "Cohen's_d": cohens_d
-        })
-    
-    if not results:
+    # 모든 그룹 쌍의 Levene / t검정 / 효과 크기를 배열 연산으로 계산
+    pairs = pairwise_tests(summary, min_n=2, levene_alpha=0.05)
+    if pairs.empty:
         return pd.DataFrame({"error": ["유효한 그룹 쌍이 없습니다"]})
     
-    result_df = pd.DataFrame(results)
+    i, j = pairs["i"].to_numpy(), pairs["j"].to_numpy()
+    result_df = pd.DataFrame({
+        "Group1": [groups[k] for k in i],
+        "Group2": [groups[k] for k in j],
+        "Group1_Mean": summary["mean"].to_numpy()[i],
+        "Group2_Mean": summary["mean"].to_numpy()[j],
+        "Group1_N": summary["n"].to_numpy()[i],
+        "Group2_N": summary["n"].to_numpy()[j],
+        "t-statistic": pairs["t"].to_numpy(),
+        "p-value": pairs["p"].to_numpy(),
+        "Equal_Variance": pairs["equal_var"].to_numpy(),
+        "Cohen's_d": pairs["cohens_d"].to_numpy(),
+    })
     
     # 다중비교 보정
     if correction != 'none':
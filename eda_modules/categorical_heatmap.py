@@ -1,36 +1,83 @@
-import matplotlib.pyplot as plt
-import seaborn as sns
-import os
-import numpy as np
-
-
-def plot_cat_matrix(df, cat_cols, num_cols, save_path):
-    img_paths = []
-
-    for col in num_cols:
-        pivot_df = df.pivot_table(
-            index=cat_cols[0],
-            columns=cat_cols[1],
-            values=col,
-            aggfunc='median'
-        )
-        # if mfr == "woojin":
-        #     param = 0.8
-        # elif mfr == "engel":
-        #     param = 0.4
-
-        plt.figure(figsize=(12, 10))
-        sns.heatmap(pivot_df, annot=True, fmt=".1f", cmap='coolwarm', cbar_kws={'label': f'{col} 중앙값'})
-        plt.title(f'{cat_cols[0]} : {cat_cols[1]} - {col} Median Heatmap')
-        plt.xlabel(cat_cols[1])
-        plt.ylabel(cat_cols[0])
-        plt.tight_layout()
-
-        filename = f"{col}_median_heatmap.png"
-        img_path = os.path.join(save_path, filename)
-        plt.savefig(img_path, facecolor="white")
-        plt.close()
-
-        img_paths.append(img_path)
-
-    return img_paths
+import matplotlib.pyplot as plt
+import seaborn as sns
+import numpy as np
+import pandas as pd
+from eda_modules.quantile_sketch import build_group_sketches, use_exact
+from eda_modules.render_pool import render_all
+from eda_modules.artifact_cache import ARTIFACT_DIR, artifact_task, frame_key, lookup_artifact
+
+# 그림 모양이 바뀌면 올려서 이전 캐시 무효화
+RENDERER_VERSION = 1
+
+
+def median_pivot(df, cat_cols, col, exact=None):
+    """
+    두 범주형 변수 조합별 중앙값 피벗
+
+    exact: True=pivot_table(정확), False=조합별 분위수 스케치, None=행 수로 자동 선택
+    """
+    if use_exact(len(df), exact):
+        return df.pivot_table(
+            index=cat_cols[0],
+            columns=cat_cols[1],
+            values=col,
+            aggfunc='median',
+            observed=True
+        )
+    grouped = df.groupby(cat_cols, observed=True)
+    # 범주형 값이 결측인 행은 ngroup이 NaN → -1로 두고 스케치에서 제외
+    codes = grouped.ngroup().fillna(-1).to_numpy(dtype=np.intp)
+    keys = grouped.size().index
+    values = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+    sketches = build_group_sketches(values, codes, len(keys))
+    medians = pd.Series([s.quantile(0.5) for s in sketches], index=keys)
+    return medians.dropna().unstack(cat_cols[1])
+
+def plot_median_heatmap(df, cat_cols, col, save_path, exact=None):
+    """두 범주형 변수 조합별 col 중앙값 히트맵 한 장 저장 (렌더링 워커에서 실행)"""
+    pivot_df = median_pivot(df, cat_cols, col, exact=exact)
+    # if mfr == "woojin":
+    #     param = 0.8
+    # elif mfr == "engel":
+    #     param = 0.4
+
+    plt.figure(figsize=(12, 10))
+    sns.heatmap(pivot_df, annot=True, fmt=".1f", cmap='coolwarm', cbar_kws={'label': f'{col} 중앙값'})
+    plt.title(f'{cat_cols[0]} : {cat_cols[1]} - {col} Median Heatmap')
+    plt.xlabel(cat_cols[1])
+    plt.ylabel(cat_cols[0])
+    plt.tight_layout()
+    plt.savefig(save_path, facecolor="white")
+    plt.close()
+    return save_path
+
+def cat_matrix_jobs(df, cat_cols, num_cols, exact=None, data_key=None, store_dir=ARTIFACT_DIR):
+    """
+    수치형 컬럼별 중앙값 히트맵 작업 목록
+
+    Returns:
+        (이미지 경로, 작업) 리스트 — 캐시에 있으면 작업이 None
+    """
+    data_key = data_key or frame_key(df, list(cat_cols) + list(num_cols))
+    jobs = []
+    for col in num_cols:
+        params = {"cat_cols": list(cat_cols), "col": col, "exact": exact}
+        img_path, hit = lookup_artifact(data_key, plot_median_heatmap, params, store_dir=store_dir)
+        if hit:
+            jobs.append((img_path, None))
+            continue
+        # 워커로는 범주형 두 컬럼과 해당 수치형 컬럼만 전달
+        jobs.append((img_path, artifact_task(plot_median_heatmap, img_path, dict(
+            df=df[list(cat_cols) + [col]], cat_cols=list(cat_cols), col=col, exact=exact), store_dir)))
+    return jobs
+
+def plot_cat_matrix(df, cat_cols, num_cols, exact=None, data_key=None, max_workers=None):
+    jobs = cat_matrix_jobs(df, cat_cols, num_cols, exact=exact, data_key=data_key)
+    rendered = render_all([task for _, task in jobs if task is not None], max_workers)
+    rendered = iter(rendered)
+    img_paths = []
+    for img_path, task in jobs:
+        path = img_path if task is None else next(rendered)
+        if path:
+            img_paths.append(path)
+    return img_paths
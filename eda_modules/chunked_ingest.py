@@ -0,0 +1,121 @@
+# eda_modules/chunked_ingest.py
+
+import os
+import pandas as pd
+import pyarrow as pa  # type: ignore
+
+DEFAULT_CHUNK_ROWS = 200_000
+SCHEMA_SAMPLE_ROWS = 10_000
+
+# pandas 청크 dtype -> Arrow 저장 타입
+_ARROW_TYPES = {
+    "Int64": pa.int64(),
+    "float64": pa.float64(),
+    "boolean": pa.bool_(),
+    "str": pa.string(),
+}
+
+
+class _SchemaWidening(Exception):
+    """청크에서 스키마보다 넓은 타입이 나와 컬럼 타입을 넓혀 다시 읽어야 하는 경우"""
+
+    def __init__(self, col, dtype):
+        super().__init__(f"{col} -> {dtype}")
+        self.col = col
+        self.dtype = dtype
+
+
+def infer_csv_schema(source, sample_rows=SCHEMA_SAMPLE_ROWS):
+    """
+    CSV 앞부분 샘플로 컬럼별 명시적 dtype 추론
+
+    Parameters:
+        source: 파일 경로 또는 seek 가능한 바이너리 버퍼
+        sample_rows: 샘플로 읽을 행 수
+
+    Returns:
+        {컬럼명: 'Int64' | 'float64' | 'boolean' | 'str'} 딕셔너리 (컬럼 순서 유지)
+    """
+    sample = pd.read_csv(source, nrows=sample_rows)
+    if hasattr(source, "seek"):
+        source.seek(0)
+
+    schema = {}
+    for col in sample.columns:
+        dtype = sample[col].dtype
+        if pd.api.types.is_bool_dtype(dtype):
+            schema[col] = "boolean"
+        elif pd.api.types.is_integer_dtype(dtype):
+            schema[col] = "Int64"
+        elif pd.api.types.is_float_dtype(dtype):
+            schema[col] = "float64"
+        else:
+            schema[col] = "str"
+    return schema
+
+def _conform_chunk(chunk, schema):
+    """청크를 스키마 타입으로 맞추고, 맞출 수 없으면 _SchemaWidening 발생"""
+    for col, dtype in schema.items():
+        if dtype == "str":
+            continue
+        values = chunk[col]
+        if dtype == "float64" and pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+            chunk[col] = values.astype("float64")
+            continue
+        if dtype == "Int64" and pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+            try:
+                chunk[col] = values.astype("Int64")
+                continue
+            except (TypeError, ValueError):
+                raise _SchemaWidening(col, "float64")
+        if dtype == "boolean" and (pd.api.types.is_bool_dtype(values) or values.isna().all()):
+            chunk[col] = values.astype("boolean")
+            continue
+        raise _SchemaWidening(col, "str")
+    return chunk
+
+def ingest_csv(source, store_path, chunk_rows=DEFAULT_CHUNK_ROWS, schema=None, progress_callback=None):
+    """
+    CSV를 고정 크기 청크로 읽어 Arrow IPC(Feather v2) 컬럼형 저장소에 기록
+
+    메모리에는 한 번에 청크 하나만 올라가며, 청크 중간에 스키마보다 넓은 타입이
+    나오면 해당 컬럼만 넓혀 처음부터 다시 기록한다.
+
+    Parameters:
+        source: 파일 경로 또는 seek 가능한 바이너리 버퍼 (BytesIO 등)
+        store_path: 저장할 .arrow 파일 경로
+        chunk_rows: 청크당 행 수
+        schema: infer_csv_schema 결과 (None이면 샘플로 추론)
+        progress_callback: 진행률(0.0~1.0)을 받는 함수
+
+    Returns:
+        (총 행 수, 최종 schema) 튜플
+    """
+    schema = dict(schema or infer_csv_schema(source))
+    total_bytes = None
+    if hasattr(source, "getbuffer"):
+        total_bytes = source.getbuffer().nbytes
+    elif isinstance(source, (str, os.PathLike)):
+        total_bytes = os.path.getsize(source)
+
+    while True:
+        arrow_schema = pa.schema([(col, _ARROW_TYPES[dtype]) for col, dtype in schema.items()])
+        read_dtypes = {col: str for col, dtype in schema.items() if dtype == "str"}
+        n_rows = 0
+        try:
+            with pa.OSFile(store_path, "wb") as sink, pa.ipc.new_file(sink, arrow_schema) as writer:
+                for chunk in pd.read_csv(source, chunksize=chunk_rows, dtype=read_dtypes):
+                    chunk = _conform_chunk(chunk, schema)
+                    writer.write_table(pa.Table.from_pandas(chunk, schema=arrow_schema, preserve_index=False))
+                    n_rows += len(chunk)
+                    if progress_callback and total_bytes and hasattr(source, "tell"):
+                        progress_callback(min(source.tell() / total_bytes, 1.0))
+            break
+        except _SchemaWidening as widen:
+            schema[widen.col] = widen.dtype
+            if hasattr(source, "seek"):
+                source.seek(0)
+
+    if progress_callback:
+        progress_callback(1.0)
+    return n_rows, schema
@@ -0,0 +1,204 @@
+# eda_modules/column_profile.py
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from eda_modules.quantile_sketch import build_group_sketches, use_exact
+
+PROFILE_QUANTILES = (0.25, 0.5, 0.75)
+PROFILE_CACHE_SIZE = 32
+
+_profile_cache = OrderedDict()   # (data_key, group_col, quantiles, exact) -> profile DataFrame
+_lock = threading.Lock()
+
+
+def quantile_label(q):
+    """분위수 컬럼 이름 (describe()와 같은 '25%' 형식)"""
+    return f"{q * 100:g}%"
+
+def _as_float(values):
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        values = values.astype(float)
+    return values.to_numpy(dtype=np.float64, na_value=np.nan)
+
+def _group_codes(values):
+    """그룹 컬럼을 정렬된 정수 코드로 변환 (결측은 -1, groupby 기본 동작과 같이 제외)"""
+    codes, uniques = pd.factorize(values, sort=True)
+    return codes, pd.Index(uniques, name=values.name)
+
+def _order_stats_exact(x, codes, count, quantiles):
+    """그룹 코드와 값으로 한 번 정렬한 뒤 구간 인덱스로 min/max/분위수 계산"""
+    n_groups = len(count)
+    # 그룹 코드 → 값 순으로 정렬: 그룹별 유효값이 오름차순 연속 구간이 됨
+    order = np.lexsort((x, codes))
+    sorted_x = x[order]
+    starts = np.concatenate(([0], np.cumsum(count)[:-1]))
+    has_data = count > 0
+    last = np.where(has_data, starts + count - 1, 0)
+
+    stats = {
+        "min": np.where(has_data, sorted_x[np.where(has_data, starts, 0)] if len(sorted_x) else np.nan, np.nan),
+        "max": np.where(has_data, sorted_x[last] if len(sorted_x) else np.nan, np.nan),
+    }
+    for q in quantiles:
+        # numpy/pandas 기본(linear) 보간과 동일
+        pos = q * (count - 1)
+        lo = np.floor(pos).astype(np.int64)
+        hi = np.ceil(pos).astype(np.int64)
+        if len(sorted_x):
+            lo_val = sorted_x[np.where(has_data, starts + lo, 0)]
+            hi_val = sorted_x[np.where(has_data, starts + hi, 0)]
+            value = lo_val + (pos - lo) * (hi_val - lo_val)
+        else:
+            value = np.full(n_groups, np.nan)
+        stats[quantile_label(q)] = np.where(has_data, value, np.nan)
+    return stats
+
+def _order_stats_sketch(x, codes, count, quantiles):
+    """정렬 없이 그룹별 분위수 스케치로 min/max/분위수 계산 (min/max는 정확값)"""
+    sketches = build_group_sketches(x, codes, len(count))
+    stats = {
+        "min": np.array([s.min for s in sketches]),
+        "max": np.array([s.max for s in sketches]),
+    }
+    values = np.array([s.quantiles(quantiles) for s in sketches]).reshape(len(count), len(quantiles))
+    for i, q in enumerate(quantiles):
+        stats[quantile_label(q)] = values[:, i]
+    return stats
+
+def _profile_one(x, codes, n_groups, quantiles, exact=None):
+    """
+    한 컬럼에 대해 그룹별 통계를 한 번에 계산
+
+    합계/제곱합은 bincount로, min/max/분위수는 정렬(정확) 또는 분위수 스케치(근사)로 구한다.
+    """
+    is_null = np.isnan(x)
+    in_group = codes >= 0
+    valid = ~is_null & in_group
+
+    rows = np.bincount(codes[in_group], minlength=n_groups)
+    count = np.bincount(codes[valid], minlength=n_groups)
+    null_count = np.bincount(codes[is_null & in_group], minlength=n_groups)
+    zero_count = np.bincount(codes[valid & (x == 0)], minlength=n_groups)
+    total = np.bincount(codes[valid], weights=x[valid], minlength=n_groups)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = total / count
+        # 평균을 뺀 뒤 제곱합 (큰 값에서 sum(x^2) 방식보다 수치적으로 안정적)
+        dev = x[valid] - mean[codes[valid]]
+        var = np.bincount(codes[valid], weights=dev * dev, minlength=n_groups) / (count - 1)
+    var[count < 2] = np.nan
+    has_data = count > 0
+
+    stats = {
+        "rows": rows,
+        "count": count,
+        "null_count": null_count,
+        "zero_count": zero_count,
+        "mean": np.where(has_data, mean, np.nan),
+        "var": var,
+        "std": np.sqrt(var),
+    }
+    if use_exact(len(x), exact):
+        stats.update(_order_stats_exact(x[valid], codes[valid], count, quantiles))
+    else:
+        stats.update(_order_stats_sketch(x[valid], codes[valid], count, quantiles))
+    return stats
+
+def compute_profile(df, cols, group_col=None, quantiles=PROFILE_QUANTILES, exact=None):
+    """
+    수치형 컬럼들의 기초 통계를 (그룹별로) 한 번에 계산
+
+    Parameters:
+        df: 데이터프레임
+        cols: 수치형 컬럼 목록
+        group_col: 그룹화할 컬럼 (None이면 전체)
+        quantiles: 계산할 분위수 (0~1)
+        exact: min/max/분위수 계산 방식 (True=정렬 기반 정확, False=분위수 스케치, None=행 수로 자동)
+               스케치의 분위수 순위 오차는 quantile_sketch.rank_error() 이내
+
+    Returns:
+        DataFrame
+        - 그룹 없음: index=컬럼명
+        - 그룹 있음: index=(그룹값, 컬럼명) MultiIndex
+        - columns: rows, count, null_count, zero_count, mean, var, std, min, max, 분위수('25%' 등)
+    """
+    if group_col is None:
+        codes = np.zeros(len(df), dtype=np.int64)
+        groups = None
+        n_groups = 1
+    else:
+        codes, groups = _group_codes(df[group_col])
+        n_groups = len(groups)
+
+    frames = []
+    for col in cols:
+        stats = _profile_one(_as_float(df[col]), codes, n_groups, quantiles, exact)
+        frame = pd.DataFrame(stats)
+        frame["column"] = col
+        if groups is not None:
+            frame[group_col] = groups
+        frames.append(frame)
+
+    if not frames:
+        return pd.DataFrame()
+    profile = pd.concat(frames, ignore_index=True)
+    if groups is None:
+        return profile.set_index("column").rename_axis(None)
+    return profile.set_index([group_col, "column"])
+
+def get_profile(df, cols, group_col=None, quantiles=PROFILE_QUANTILES, data_key=None, exact=None):
+    """
+    compute_profile 결과를 데이터셋 키 기준으로 캐시해서 반환
+
+    같은 (데이터셋, 그룹 컬럼, 분위수) 조합에 대해 이미 계산된 컬럼은 재사용하고
+    없는 컬럼만 추가로 계산한다. data_key가 None이면 캐시하지 않는다.
+    """
+    cols = list(cols)
+    quantiles = tuple(quantiles)
+    if data_key is None:
+        return compute_profile(df, cols, group_col, quantiles, exact)
+
+    cache_key = (data_key, group_col, quantiles, exact)
+    with _lock:
+        cached = _profile_cache.get(cache_key)
+        if cached is not None:
+            _profile_cache.move_to_end(cache_key)
+
+    known = set(cached.index.get_level_values(-1)) if cached is not None else set()
+    missing = [col for col in cols if col not in known]
+    if missing:
+        computed = compute_profile(df, missing, group_col, quantiles, exact)
+        cached = computed if cached is None else pd.concat([cached, computed])
+        with _lock:
+            _profile_cache[cache_key] = cached
+            _profile_cache.move_to_end(cache_key)
+            while len(_profile_cache) > PROFILE_CACHE_SIZE:
+                _profile_cache.popitem(last=False)
+
+    if group_col is None:
+        return cached.loc[cols]
+    return cached[cached.index.get_level_values(-1).isin(cols)]
+
+def profile_row(df, col, profile=None, quantiles=PROFILE_QUANTILES, exact=None):
+    """한 컬럼의 통계 Series (profile이 주어지면 그대로 사용, 없으면 df로 계산)"""
+    if profile is not None:
+        return profile
+    return compute_profile(df, [col], quantiles=quantiles, exact=exact).loc[col]
+
+def describe_from_profile(profile, cols, group_col=None):
+    """
+    프로파일을 DataFrame.describe()와 같은 모양으로 변환
+
+    - 그룹 없음: index=통계명, columns=컬럼
+    - 그룹 있음: index=그룹값, columns=(컬럼, 통계명) MultiIndex (groupby().describe()와 동일)
+    """
+    stat_cols = ["count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+    if group_col is None:
+        return profile.loc[cols, stat_cols].T.astype(float)
+    wide = profile[stat_cols].astype(float).unstack("column")
+    wide = wide.swaplevel(0, 1, axis=1)
+    return wide.reindex(columns=pd.MultiIndex.from_product([cols, stat_cols]))
@@ -0,0 +1,200 @@
+# eda_modules/correlation_engine.py
+
+import threading
+import warnings
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from scipy.stats import kendalltau, rankdata
+
+# 행렬곱 누적 시 한 번에 처리하는 행 수 (메모리 상한)
+CORR_CHUNK_ROWS = 200_000
+CORR_CACHE_SIZE = 16
+RANK_CACHE_SIZE = 256
+
+_corr_cache = OrderedDict()   # (data_key, method) -> 상관계수 DataFrame (계산된 컬럼들의 전체 행렬)
+_rank_cache = OrderedDict()   # (data_key, col) -> 평균 순위 배열 (결측은 NaN)
+_lock = threading.Lock()
+
+
+def _column_values(df, col):
+    values = df[col]
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        values = values.astype(float)
+    return values.to_numpy(dtype=np.float64, na_value=np.nan)
+
+def _lru_get(cache, key):
+    with _lock:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+def _lru_put(cache, key, value, max_size):
+    with _lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > max_size:
+            cache.popitem(last=False)
+
+def column_ranks(df, col, data_key=None):
+    """
+    컬럼의 평균 순위 (동률은 평균 순위, 결측은 NaN) — 데이터셋 키별로 한 번만 계산
+
+    Spearman(순위의 Pearson)과 Kendall(순위 비교) 모두 같은 순위를 재사용한다.
+    """
+    key = (data_key, col)
+    if data_key is not None:
+        ranks = _lru_get(_rank_cache, key)
+        if ranks is not None:
+            return ranks
+    ranks = pd.Series(_column_values(df, col)).rank(method="average").to_numpy()
+    if data_key is not None:
+        _lru_put(_rank_cache, key, ranks, RANK_CACHE_SIZE)
+    return ranks
+
+def _masked_pearson(X, Y, chunk_rows=CORR_CHUNK_ROWS):
+    """
+    결측을 쌍별로 제외한 Pearson 상관계수 블록 (X: n×a, Y: n×b → a×b)
+
+    쌍별 유효 행 수, 합, 제곱합, 곱의 합을 마스크 행렬곱으로 청크마다 누적한다.
+    (컬럼 평균을 먼저 빼서 제곱합 차이 계산의 자릿수 손실을 줄임)
+    """
+    with warnings.catch_warnings():
+        # 값이 하나도 없는 컬럼은 평균이 NaN → 해당 쌍은 결과도 NaN
+        warnings.simplefilter("ignore", RuntimeWarning)
+        X = X - np.nanmean(X, axis=0) if X.shape[0] else X
+        Y = Y - np.nanmean(Y, axis=0) if Y.shape[0] else Y
+    a, b = X.shape[1], Y.shape[1]
+    n = np.zeros((a, b)); sx = np.zeros((a, b)); sy = np.zeros((a, b))
+    sxx = np.zeros((a, b)); syy = np.zeros((a, b)); sxy = np.zeros((a, b))
+    for start in range(0, X.shape[0], chunk_rows):
+        x = X[start:start + chunk_rows]
+        y = Y[start:start + chunk_rows]
+        mx = (~np.isnan(x)).astype(np.float64)
+        my = (~np.isnan(y)).astype(np.float64)
+        x0 = np.nan_to_num(x)
+        y0 = np.nan_to_num(y)
+        n += mx.T @ my
+        sx += x0.T @ my
+        sy += mx.T @ y0
+        sxx += (x0 * x0).T @ my
+        syy += mx.T @ (y0 * y0)
+        sxy += x0.T @ y0
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cov = sxy - sx * sy / n
+        vx = sxx - sx * sx / n
+        vy = syy - sy * sy / n
+        r = cov / np.sqrt(vx * vy)
+    r[(n < 2) | (vx <= 0) | (vy <= 0)] = np.nan
+    return np.clip(r, -1.0, 1.0)
+
+def _null_mask_ids(ranks):
+    """컬럼별 결측 위치 패턴 번호 (결측 위치가 같은 컬럼끼리 같은 번호)"""
+    patterns = {}
+    return {c: patterns.setdefault(np.packbits(np.isnan(r)).tobytes(), len(patterns)) for c, r in ranks.items()}
+
+def _spearman_pair(rx, ry):
+    """두 컬럼 모두 값이 있는 행에서만 다시 순위를 매긴 Spearman 상관계수"""
+    valid = ~(np.isnan(rx) | np.isnan(ry))
+    if valid.sum() < 2:
+        return np.nan
+    # 전체 순위의 부분집합을 다시 순위화 (동률은 전체 순위에서도 같으므로 평균 순위가 그대로 유지됨)
+    return _masked_pearson(rankdata(rx[valid])[:, None], rankdata(ry[valid])[:, None])[0, 0]
+
+def _kendall_pair(rx, ry):
+    valid = ~(np.isnan(rx) | np.isnan(ry))
+    if valid.sum() < 2:
+        return np.nan
+    # scipy kendalltau: 정렬 + 병합 기반 O(n log n), 동률 보정(tau-b) — pandas와 동일한 정의
+    return kendalltau(rx[valid], ry[valid]).statistic
+
+def _corr_block(df, cols_x, cols_y, method, data_key):
+    """cols_x × cols_y 상관계수 블록 계산"""
+    if method == "pearson":
+        X = np.column_stack([_column_values(df, c) for c in cols_x])
+        Y = np.column_stack([_column_values(df, c) for c in cols_y])
+        return _masked_pearson(X, Y)
+
+    ranks = {c: column_ranks(df, c, data_key) for c in dict.fromkeys(list(cols_x) + list(cols_y))}
+    if method == "spearman":
+        # 컬럼별 순위를 한 번 계산한 뒤 순위의 Pearson 상관
+        X = np.column_stack([ranks[c] for c in cols_x])
+        Y = np.column_stack([ranks[c] for c in cols_y])
+        block = _masked_pearson(X, Y)
+        # 결측 위치가 다른 쌍은 전체 순위가 쌍별 유효 행의 순위와 다르므로 그 쌍만 다시 순위를 매겨 계산
+        mask_ids = _null_mask_ids(ranks)
+        done = {}
+        for i, cx in enumerate(cols_x):
+            for j, cy in enumerate(cols_y):
+                if mask_ids[cx] != mask_ids[cy]:
+                    pair = tuple(sorted((cx, cy)))
+                    if pair not in done:
+                        done[pair] = _spearman_pair(ranks[cx], ranks[cy])
+                    block[i, j] = done[pair]
+        return block
+
+    if method == "kendall":
+        block = np.full((len(cols_x), len(cols_y)), np.nan)
+        done = {}
+        for i, cx in enumerate(cols_x):
+            for j, cy in enumerate(cols_y):
+                pair = tuple(sorted((cx, cy)))
+                if pair in done:
+                    pass
+                elif cx == cy:
+                    # pandas와 같이 값이 있는 컬럼의 자기 자신 상관은 (상수 컬럼이어도) 1
+                    done[pair] = 1.0 if (~np.isnan(ranks[cx])).any() else np.nan
+                else:
+                    done[pair] = _kendall_pair(ranks[cx], ranks[cy])
+                block[i, j] = done[pair]
+        return block
+
+    raise ValueError(f"지원하지 않는 상관계수 방식입니다: {method}")
+
+def compute_correlation(df, cols, method="pearson", data_key=None):
+    """
+    상관계수 행렬 (결측은 쌍별 제외)
+
+    - pearson: 마스크 행렬곱으로 모든 쌍을 한 번에 계산
+    - spearman: 컬럼별 순위(캐시)를 만든 뒤 pearson과 같은 방식으로 계산하고,
+      결측 위치가 서로 다른 쌍만 쌍별 유효 행에서 다시 순위를 매겨 계산 (pandas와 같은 결과)
+    - kendall: 캐시된 순위로 쌍마다 O(n log n) tau-b 계산
+    """
+    cols = list(cols)
+    block = _corr_block(df, cols, cols, method, data_key)
+    corr = pd.DataFrame(block, index=cols, columns=cols)
+    for c in cols:
+        if not np.isnan(corr.at[c, c]):
+            corr.at[c, c] = 1.0
+    return corr
+
+def get_correlation(df, cols, method="pearson", data_key=None):
+    """
+    상관계수 행렬을 (데이터셋, 방식)별로 캐시해서 반환
+
+    이미 계산된 컬럼 집합 안에서 고르면 캐시된 전체 행렬을 잘라서 반환하고,
+    새 컬럼이 추가되면 새 컬럼과 관련된 쌍만 추가로 계산한다.
+    data_key가 None이면 캐시하지 않는다.
+    """
+    cols = list(cols)
+    if data_key is None:
+        return compute_correlation(df, cols, method)
+
+    cache_key = (data_key, method)
+    cached = _lru_get(_corr_cache, cache_key)
+    known = list(cached.columns) if cached is not None else []
+    missing = [c for c in cols if c not in known]
+    if missing:
+        new_new = compute_correlation(df, missing, method, data_key)
+        if known:
+            old_new = pd.DataFrame(_corr_block(df, known, missing, method, data_key), index=known, columns=missing)
+            top = pd.concat([cached, old_new], axis=1)
+            bottom = pd.concat([old_new.T, new_new], axis=1)
+            cached = pd.concat([top, bottom], axis=0)
+        else:
+            cached = new_new
+        _lru_put(_corr_cache, cache_key, cached, CORR_CACHE_SIZE)
+    return cached.loc[cols, cols]
@@ -1,12 +1,23 @@
 # eda_modules/correlation_matrix.py
 
 import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 import os
+import plotly.graph_objects as go  # type: ignore
+from scipy.cluster.hierarchy import linkage, leaves_list
+from scipy.spatial.distance import squareform
+from eda_modules.correlation_engine import get_correlation
 
-def plot_correlation_matrix(df, num_cols, save_path, method='pearson'):
-    corr = df[num_cols].corr(method=method)
+# 그림 모양이 바뀌면 올려서 이전 캐시 무효화
+RENDERER_VERSION = 1
+# 이 컬럼 수를 넘으면 주석 달린 이미지 대신 넓은 테이블 모드(인터랙티브 히트맵 + 상위 쌍 표) 사용
+WIDE_TABLE_COLS = 30
+
+def plot_correlation_matrix(df, num_cols, save_path, method='pearson', data_key=None):
+    # 데이터셋별로 캐시된 전체 상관행렬에서 선택한 컬럼만 잘라서 사용
+    corr = get_correlation(df, num_cols, method=method, data_key=data_key)
 
     n = len(num_cols) #엥겔 15 / 우진 25
     fig_size = max(16, n * 1.2) #max(8, n * 0.5)
@@ -22,3 +33,88 @@ def plot_correlation_matrix(df, num_cols, save_path, method='pearson'):
     plt.close()
 
     return save_path
+
+def cluster_order(corr):
+    """
+    계층적 군집(평균 연결, 거리 = 1 - |r|)으로 정렬한 컬럼 순서
+
+    상관이 강한 변수끼리 붙어 있도록 해서 큰 행렬에서도 블록 구조가 보이게 한다.
+    (상관을 계산할 수 없는 쌍(NaN)은 거리 1로 취급)
+    """
+    cols = list(corr.columns)
+    if len(cols) < 3:
+        return cols
+    dist = 1 - np.abs(np.nan_to_num(corr.to_numpy(dtype=float), nan=0.0))
+    dist = np.clip((dist + dist.T) / 2, 0, 1)
+    np.fill_diagonal(dist, 0)
+    order = leaves_list(linkage(squareform(dist, checks=False), method="average"))
+    return [cols[i] for i in order]
+
+def top_correlation_pairs(corr, threshold=None, top_k=None):
+    """
+    상관계수 절댓값이 큰 변수 쌍 목록 (대각/중복 쌍 제외)
+
+    Parameters:
+        corr: 상관계수 행렬 DataFrame
+        threshold: |r|이 이 값 이상인 쌍만 (None이면 제한 없음)
+        top_k: 절댓값 기준 상위 k개만 (None이면 전부)
+
+    Returns:
+        var1, var2, corr, abs_corr 컬럼의 DataFrame (|r| 큰 순)
+    """
+    cols = list(corr.columns)
+    values = corr.to_numpy(dtype=float)
+    i, j = np.triu_indices(len(cols), k=1)
+    r = values[i, j]
+    keep = ~np.isnan(r)
+    if threshold is not None:
+        keep &= np.abs(r) >= threshold
+    i, j, r = i[keep], j[keep], r[keep]
+    order = np.argsort(-np.abs(r), kind="stable")
+    if top_k is not None:
+        order = order[:top_k]
+    return pd.DataFrame({
+        "var1": [cols[k] for k in i[order]],
+        "var2": [cols[k] for k in j[order]],
+        "corr": r[order].round(4),
+        "abs_corr": np.abs(r[order]).round(4),
+    })
+
+def plot_correlation_heatmap(df, num_cols, method='pearson', threshold=None, cluster=True, data_key=None):
+    """
+    넓은 테이블용 인터랙티브 상관 히트맵 (Plotly)
+
+    숫자 주석 없이 색으로만 표시하고(값은 마우스 오버로 확인), |r|이 threshold보다 작은
+    칸은 비워서 강한 상관만 보이게 한다. 이미지 파일을 만들지 않으므로 컬럼 수와 무관하게 가볍다.
+
+    Returns:
+        (fig, corr) 튜플 — corr은 표시 순서로 정렬된 상관계수 행렬
+    """
+    corr = get_correlation(df, num_cols, method=method, data_key=data_key)
+    if cluster:
+        order = cluster_order(corr)
+        corr = corr.loc[order, order]
+
+    z = corr.to_numpy(dtype=float).copy()
+    if threshold:
+        mask = np.abs(z) < threshold
+        np.fill_diagonal(mask, False)
+        z[mask] = np.nan
+
+    n = len(corr.columns)
+    size = int(min(900, max(450, n * 12 + 150)))
+    fig = go.Figure(go.Heatmap(
+        z=z, x=list(corr.columns), y=list(corr.index),
+        zmin=-1, zmax=1, colorscale="RdBu_r",
+        colorbar=dict(title=method.capitalize()),
+        hovertemplate="%{y} × %{x}<br>r = %{z:.3f}<extra></extra>",
+        hoverongaps=False,
+    ))
+    fig.update_layout(
+        title=f"{method.capitalize()} Correlation ({n} columns)",
+        width=size, height=size,
+        xaxis=dict(showticklabels=n <= 80, tickfont=dict(size=9)),
+        yaxis=dict(showticklabels=n <= 80, tickfont=dict(size=9), autorange="reversed"),
+        margin=dict(l=40, r=40, t=60, b=40),
+    )
+    return fig, corr
@@ -0,0 +1,284 @@
+# eda_modules/dataset_cache.py
+
+import os
+import io
+import json
+import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict
+
+import pandas as pd
+
+from eda_modules import dataset_store
+from eda_modules.dataset_store import STORE_DIR, write_atomic
+from eda_modules.variable_type_splitter import split_variable_types, parse_datetime_columns
+from eda_modules.chunked_ingest import ingest_csv, DEFAULT_CHUNK_ROWS
+from eda_modules.memory_optimizer import compact_dataframe, memory_usage_mb, ARROW_STRING_DTYPE
+
+# 전처리 방식(sanitize, 타입 분류 등)이 바뀌면 올려서 기존 캐시를 무효화
+PIPELINE_VERSION = "4"
+MEMORY_CACHE_SIZE = 4
+
+_memory_cache = OrderedDict()   # cache_key -> (df, var_types)
+_upload_keys = {}               # 업로드 파일 id -> content hash
+_dataset_info = {}              # cache_key -> 메타 정보 (행 수, 메모리 사용량 등)
+_sheet_names = {}               # 워크북 content hash -> 시트 이름 목록
+_lock = threading.Lock()
+
+
+# Object 컬럼 streamlit에서 불필요한 충돌을 막기 위해 문자열로 모두 변경 처리
+def sanitize_object_columns(df):
+    for col in df.select_dtypes(include='object').columns:
+        # 컬럼형 저장소에서 읽은 결측은 None이므로 먼저 빈 문자열로 채움
+        df[col] = df[col].fillna("").astype(str).replace("nan", "")
+    return df
+
+def hash_bytes(data) -> str:
+    """업로드된 바이트의 내용 기반 해시 (복사 없이 memoryview로 계산)"""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(memoryview(data))
+    return h.hexdigest()
+
+def read_uploaded(data, ext, sheet_name=0):
+    """
+    업로드 바이트를 DataFrame으로 읽기 (CSV, xlsx, xls 지원, 엑셀은 지정한 시트만 읽음)
+
+    지원하지 않는 형식이거나 읽기에 실패하면 ValueError 발생
+    """
+    buffer = io.BytesIO(data)
+    if ext == "csv":
+        return pd.read_csv(buffer)
+    if ext in ["xlsx", "xls"]:
+        # 엑셀 파일의 경우 엔진 자동 선택 (openpyxl 또는 xlrd)
+        try:
+            return pd.read_excel(buffer, sheet_name=sheet_name, engine='openpyxl' if ext == "xlsx" else 'xlrd')
+        except Exception:
+            try:
+                # 대체 엔진 시도
+                buffer.seek(0)
+                return pd.read_excel(buffer, sheet_name=sheet_name)
+            except Exception as e:
+                raise ValueError(f"엑셀 파일 읽기 실패: {e}") from e
+    raise ValueError(f"지원하지 않는 파일 형식입니다: {ext}")
+
+def list_excel_sheets(data, ext, store_dir=STORE_DIR, content_hash=None):
+    """
+    워크북의 시트 이름 목록 (시트 내용은 읽지 않으며, 워크북 해시 기준으로 캐시)
+    """
+    content_hash = content_hash or hash_bytes(data)
+    if content_hash in _sheet_names:
+        return _sheet_names[content_hash]
+
+    sheets_path = os.path.join(store_dir, f"{content_hash}.sheets.json")
+    if os.path.exists(sheets_path):
+        with open(sheets_path, "r", encoding="utf-8") as f:
+            sheet_names = json.load(f)
+    else:
+        try:
+            with pd.ExcelFile(io.BytesIO(data), engine='openpyxl' if ext == "xlsx" else 'xlrd') as book:
+                sheet_names = list(book.sheet_names)
+        except Exception as e:
+            raise ValueError(f"엑셀 파일 읽기 실패: {e}") from e
+        os.makedirs(store_dir, exist_ok=True)
+
+        def write_sheets(p):
+            with open(p, "w", encoding="utf-8") as f:
+                json.dump(sheet_names, f, ensure_ascii=False)
+        write_atomic(sheets_path, write_sheets)
+
+    _sheet_names[content_hash] = sheet_names
+    return sheet_names
+
+def _remember(cache_key, entry):
+    with _lock:
+        _memory_cache[cache_key] = entry
+        _memory_cache.move_to_end(cache_key)
+        while len(_memory_cache) > MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+
+def _ingest_csv(data, cache_key, store_dir, chunk_rows, progress_callback):
+    """CSV를 청크 단위로 저장소의 데이터셋 파일에 바로 적재 (메모리에는 청크 하나만 올라감)"""
+    write_atomic(dataset_store.dataset_path(cache_key, store_dir),
+                 lambda p: ingest_csv(io.BytesIO(data), p, chunk_rows=chunk_rows, progress_callback=progress_callback))
+
+def _finish_frame(df, sanitize, compact):
+    """
+    파싱한 DataFrame에 sanitize / 날짜 변환 / 압축과 변수 유형 분류 적용
+
+    Returns:
+        (df, var_types, 변환 전 메모리 MB, 변환 후 메모리 MB) 튜플
+    """
+    if not compact and sanitize:
+        df = sanitize_object_columns(df)
+    # 날짜 컬럼은 파싱한 결과로 바꿔 두어 이후 다시 파싱하지 않음 (압축은 나머지 컬럼에만 적용)
+    for col, parsed in parse_datetime_columns(df).items():
+        df[col] = parsed
+    var_types = split_variable_types(df)
+    if compact:
+        df, before_mb, after_mb = compact_dataframe(df)
+    else:
+        before_mb = after_mb = memory_usage_mb(df)
+    return df, var_types, before_mb, after_mb
+
+def load_dataset(data, ext, store_dir=STORE_DIR, content_hash=None, sanitize=True, compact=False,
+                 sheet_name=None, name=None, chunk_rows=DEFAULT_CHUNK_ROWS, progress_callback=None):
+    """
+    업로드 데이터를 메모리 캐시 → 데이터셋 저장소 → 새로 적재 순으로 찾아 DataFrame으로 반환
+
+    - 메모리 캐시: 같은 프로세스에서 같은 내용 / 모드로 불러온 DataFrame 객체를 그대로 반환
+    - 저장소 적중: store_dir의 <cache_key>.arrow를 메모리 매핑으로 열어 복사한 DataFrame
+    - 새로 적재: CSV는 스키마 추론 후 청크 단위로 <cache_key>.arrow에 바로 기록한 뒤 메모리 매핑으로 열고,
+      엑셀은 지정한 시트를 읽어 변환한 결과를 저장소에 기록한 뒤 다시 연다.
+    변환은 sanitize(compact면 생략) → 날짜 컬럼 파싱 → 변수 유형 분류 → compact(압축 형식) 순서.
+    CSV 저장소 파일은 파싱한 값 그대로이므로 저장소에서 열 때마다 같은 변환을 다시 적용한다.
+    반환하는 DataFrame은 쓰기 가능하지만 메모리 캐시로 여러 세션이 같은 객체를 공유하므로 값을 바꾸려면 사본에서 바꿔야 한다.
+
+    Parameters:
+        data: 업로드된 파일의 바이트
+        ext: 파일 확장자 ('csv', 'xlsx', 'xls')
+        store_dir: 데이터셋 저장소 경로 (Arrow IPC 파일 + 카탈로그)
+        content_hash: 이미 계산된 내용 해시 (None이면 data로 계산)
+        sanitize: object 컬럼 문자열 변환 여부 (False면 원본 값 유지)
+        compact: True면 sanitize 대신 category / Arrow 문자열 / 수치 downcast로 메모리 절약
+        sheet_name: 엑셀 시트 이름 (None이면 첫 번째 시트, 시트별로 따로 변환/캐시)
+        name: 카탈로그에 표시할 데이터셋 이름
+        chunk_rows: CSV 청크 적재 시 청크당 행 수
+        progress_callback: CSV 적재 진행률(0.0~1.0)을 받는 함수
+
+    Returns:
+        (cache_key, df, var_types) 튜플
+    """
+    content_hash = content_hash or hash_bytes(data)
+    mode = "compact" if compact else ("sanitized" if sanitize else "raw")
+    cache_key = f"{content_hash}_v{PIPELINE_VERSION}_{mode}"
+    if sheet_name is not None:
+        cache_key += "_sheet" + hashlib.md5(str(sheet_name).encode("utf-8")).hexdigest()[:8]
+
+    # 1. 메모리 캐시 (같은 프로세스의 rerun / 다른 세션)
+    with _lock:
+        entry = _memory_cache.get(cache_key)
+        if entry is not None:
+            _memory_cache.move_to_end(cache_key)
+    if entry is not None:
+        dataset_store.touch(cache_key, store_dir)
+        return (cache_key,) + entry
+
+    string_dtype = ARROW_STRING_DTYPE if compact else None
+
+    # 2. 데이터셋 저장소 (재시작 이후 세션 / 다른 프로세스, 메모리 매핑으로 페이지 공유)
+    if dataset_store.exists(cache_key, store_dir):
+        meta = dataset_store.read_meta(cache_key, store_dir)
+        var_types = meta["var_types"]
+        _dataset_info[cache_key] = meta
+        if meta.get("finish_on_open"):
+            # 청크 적재한 CSV는 파싱한 값 그대로 저장되어 있으므로 열 때마다 변환 적용
+            df = _finish_frame(dataset_store.open_dataset(cache_key, store_dir=store_dir), sanitize, compact)[0]
+        else:
+            df = dataset_store.open_dataset(cache_key, string_dtype=string_dtype, store_dir=store_dir)
+        _remember(cache_key, (df, var_types))
+        return cache_key, df, var_types
+
+    # 3. 새로 파싱
+    os.makedirs(store_dir, exist_ok=True)
+    if ext == "csv":
+        # 스키마 추론 후 청크 단위로 저장소 파일에 바로 적재하고, 메모리 매핑으로 연 DataFrame에만 변환 적용
+        _ingest_csv(data, cache_key, store_dir, chunk_rows, progress_callback)
+        df = dataset_store.open_dataset(cache_key, store_dir=store_dir)
+    else:
+        df = read_uploaded(data, ext, sheet_name=0 if sheet_name is None else sheet_name)
+    df, var_types, before_mb, after_mb = _finish_frame(df, sanitize, compact)
+
+    meta = {
+        "var_types": var_types,
+        "rows": len(df),
+        "ext": ext,
+        "mode": mode,
+        "memory_before_mb": before_mb,
+        "memory_after_mb": after_mb,
+    }
+    if ext == "csv":
+        # 저장소 파일은 그대로 두고 (다시 쓰지 않음) 메타 정보만 등록
+        meta["finish_on_open"] = True
+        _dataset_info[cache_key] = meta
+        dataset_store.register_dataset(cache_key, meta, name=name, store_dir=store_dir)
+    else:
+        _dataset_info[cache_key] = meta
+        dataset_store.write_dataset(cache_key, df, meta, name=name, store_dir=store_dir)
+        # 파싱한 사본 대신 저장소 파일을 다시 연 DataFrame을 보관 (저장소 적중 때와 같은 dtype / 쓰기 가능)
+        del df
+        df = dataset_store.open_dataset(cache_key, string_dtype=string_dtype, store_dir=store_dir)
+    _remember(cache_key, (df, var_types))
+    return cache_key, df, var_types
+
+def get_dataset_info(cache_key):
+    """load_dataset으로 불러온 데이터셋의 메타 정보 (행 수, 적재 모드, 변환 전/후 메모리 MB)"""
+    return _dataset_info.get(cache_key, {})
+
+def _uploaded_content(uploaded_file):
+    """업로드 바이트와 내용 해시 (같은 업로드에 대한 rerun에서는 해시 계산을 생략)"""
+    file_id = getattr(uploaded_file, "file_id", None)
+    content_hash = _upload_keys.get(file_id) if file_id else None
+    data = uploaded_file.getvalue()
+    if content_hash is None:
+        content_hash = hash_bytes(data)
+        if file_id:
+            _upload_keys[file_id] = content_hash
+    return data, content_hash
+
+def list_uploaded_sheets(uploaded_file, store_dir=STORE_DIR):
+    """Streamlit UploadedFile(엑셀)의 시트 이름 목록"""
+    ext = uploaded_file.name.split(".")[-1].lower()
+    data, content_hash = _uploaded_content(uploaded_file)
+    return list_excel_sheets(data, ext, store_dir=store_dir, content_hash=content_hash)
+
+def load_uploaded_file(uploaded_file, store_dir=STORE_DIR, sanitize=True, compact=False,
+                       sheet_name=None, progress_callback=None):
+    """
+    Streamlit UploadedFile용 load_dataset 래퍼
+
+    Returns:
+        (cache_key, df, var_types) 튜플
+    """
+    ext = uploaded_file.name.split(".")[-1].lower()
+    data, content_hash = _uploaded_content(uploaded_file)
+    name = uploaded_file.name if sheet_name is None else f"{uploaded_file.name} [{sheet_name}]"
+    return load_dataset(data, ext, store_dir=store_dir, content_hash=content_hash, sanitize=sanitize,
+                        compact=compact, sheet_name=sheet_name, name=name, progress_callback=progress_callback)
+
+def load_uploaded_files(uploaded_files, max_workers=None, store_dir=STORE_DIR, sanitize=False,
+                        compact=False, progress_callback=None):
+    """
+    여러 업로드 파일을 스레드 풀에서 동시에 파싱 (업로드 바이트를 디코딩/복사 없이 그대로 사용)
+
+    Parameters:
+        uploaded_files: Streamlit UploadedFile 리스트
+        max_workers: 동시에 파싱할 파일 수 (None이면 CPU 수와 파일 수 중 작은 값)
+        progress_callback: 완료된 파일 비율(0.0~1.0)을 받는 함수 (호출한 스레드에서 실행)
+
+    Returns:
+        (data_dict, timings) 튜플
+        - data_dict: {파일명(확장자 제외): DataFrame} (업로드 순서 유지)
+        - timings: 파일별 {'file', 'key', 'rows', 'seconds'} 딕셔너리 리스트 (key는 데이터셋 캐시 키)
+    """
+    def load_one(file):
+        start = time.perf_counter()
+        key, df, _ = load_uploaded_file(file, store_dir=store_dir, sanitize=sanitize, compact=compact)
+        return key, df, time.perf_counter() - start
+
+    max_workers = max_workers or min(len(uploaded_files), os.cpu_count() or 1)
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as pool:
+        futures = {pool.submit(load_one, file): file for file in uploaded_files}
+        for done, future in enumerate(as_completed(futures), start=1):
+            results[futures[future].name] = future.result()
+            if progress_callback:
+                progress_callback(done / len(futures))
+
+    data_dict, timings = {}, []
+    for file in uploaded_files:
+        key, df, seconds = results[file.name]
+        data_dict[os.path.splitext(file.name)[0]] = df
+        timings.append({"file": file.name, "key": key, "rows": len(df), "seconds": round(seconds, 3)})
+    return data_dict, timings
@@ -0,0 +1,157 @@
+# eda_modules/dataset_store.py
+
+import os
+import json
+import time
+import threading
+
+import pandas as pd
+import pyarrow as pa  # type: ignore
+import pyarrow.feather as feather  # type: ignore
+
+STORE_DIR = "data"
+CATALOG_FILE = "catalog.json"
+# 같은 데이터셋의 마지막 접근 시각은 이 간격(초)보다 자주 기록하지 않음
+TOUCH_INTERVAL = 60
+
+_catalog_lock = threading.Lock()
+_last_touch = {}
+
+
+def dataset_path(key, store_dir=STORE_DIR):
+    return os.path.join(store_dir, f"{key}.arrow")
+
+def meta_path(key, store_dir=STORE_DIR):
+    return os.path.join(store_dir, f"{key}.json")
+
+def write_atomic(path, write_fn):
+    """임시 파일에 쓴 뒤 rename으로 교체 (읽는 쪽이 쓰다 만 파일을 보지 않도록)"""
+    tmp_path = f"{path}.tmp{os.getpid()}_{threading.get_ident()}"
+    try:
+        write_fn(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def _read_catalog(store_dir):
+    path = os.path.join(store_dir, CATALOG_FILE)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _update_catalog(store_dir, key, create=True, **fields):
+    with _catalog_lock:
+        catalog = _read_catalog(store_dir)
+        if key not in catalog and not create:
+            return
+        catalog.setdefault(key, {}).update(fields)
+
+        def write_catalog(p):
+            with open(p, "w", encoding="utf-8") as f:
+                json.dump(catalog, f, ensure_ascii=False, indent=2)
+        write_atomic(os.path.join(store_dir, CATALOG_FILE), write_catalog)
+
+def exists(key, store_dir=STORE_DIR):
+    return os.path.exists(dataset_path(key, store_dir)) and os.path.exists(meta_path(key, store_dir))
+
+def write_dataset(key, df, meta, name=None, store_dir=STORE_DIR):
+    """
+    DataFrame을 Arrow IPC(Feather v2) 파일로 저장하고 카탈로그에 등록
+
+    메모리 매핑으로 열었을 때 복사 없이 공유되도록 압축 없이, 컬럼당 하나의 청크로 저장
+    """
+    os.makedirs(store_dir, exist_ok=True)
+    table = pa.Table.from_pandas(df, preserve_index=False).combine_chunks()
+    path = dataset_path(key, store_dir)
+    write_atomic(path, lambda p: feather.write_feather(table, p, compression="uncompressed",
+                                                        chunksize=max(table.num_rows, 1)))
+    register_dataset(key, meta, name=name, store_dir=store_dir)
+
+def register_dataset(key, meta, name=None, store_dir=STORE_DIR):
+    """
+    이미 기록된 데이터셋 파일(dataset_path)의 메타 정보를 저장하고 카탈로그에 등록
+
+    청크 단위 적재처럼 파일을 직접 기록한 경우에 사용한다. 메타 파일이 생긴 뒤에야 exists()가 True.
+    """
+    path = dataset_path(key, store_dir)
+
+    def write_meta(p):
+        with open(p, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+    write_atomic(meta_path(key, store_dir), write_meta)
+
+    # 메모리 매핑으로 열어 행/컬럼 수만 확인 (데이터는 읽지 않음)
+    table = feather.read_table(path, memory_map=True)
+    now = time.time()
+    _update_catalog(store_dir, key, name=name or key, rows=table.num_rows, columns=table.num_columns,
+                    size_bytes=os.path.getsize(path), created=now, last_access=now)
+
+def read_meta(key, store_dir=STORE_DIR):
+    with open(meta_path(key, store_dir), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def _column_to_pandas(column, string_dtype, copy):
+    if not copy and column.num_chunks == 1 and column.null_count == 0:
+        try:
+            # 결측 없는 수치형 컬럼은 매핑된 페이지를 그대로 사용 (읽기 전용, 복사 없음)
+            return pd.Series(column.chunk(0).to_numpy(zero_copy_only=True), copy=False)
+        except (pa.ArrowInvalid, NotImplementedError):
+            pass
+    if string_dtype is not None and (pa.types.is_string(column.type) or pa.types.is_large_string(column.type)):
+        return pd.Series(column.to_pandas(types_mapper={column.type: string_dtype}.get))
+    series = column.to_pandas()
+    # pyarrow가 버퍼를 그대로 넘긴 읽기 전용 배열이면 복사해서 쓰기 가능하게
+    return series.copy() if copy and not series.to_numpy().flags.writeable else series
+
+def open_dataset(key, columns=None, string_dtype=None, store_dir=STORE_DIR, copy=True):
+    """
+    저장된 데이터셋을 메모리 매핑으로 열어 DataFrame으로 반환
+
+    기본(copy=True)은 매핑된 파일에서 읽은 값을 복사한 일반 (쓰기 가능한) DataFrame.
+    copy=False면 결측 없는 수치형 컬럼이 매핑된 파일 페이지를 복사 없이 참조하므로,
+    여러 프로세스가 같은 데이터셋을 열어도 OS 페이지 캐시를 공유한다.
+    이때 그 컬럼들은 읽기 전용이라 값을 바꾸면 ValueError가 나므로 읽기만 하는 작업(워커 등)에서만 사용한다.
+
+    Parameters:
+        key: 데이터셋 키
+        columns: 읽을 컬럼 목록 (None이면 전체)
+        string_dtype: 문자열 컬럼을 읽을 dtype (None이면 object)
+        copy: False면 결측 없는 수치형 컬럼을 복사 없이 읽기 전용으로 참조
+    """
+    table = feather.read_table(dataset_path(key, store_dir), columns=columns, memory_map=True)
+    df = pd.DataFrame(
+        {name: _column_to_pandas(table.column(name), string_dtype, copy) for name in table.column_names},
+        copy=False,
+    )
+    touch(key, store_dir)
+    return df
+
+def touch(key, store_dir=STORE_DIR):
+    """카탈로그의 마지막 접근 시각 갱신 (TOUCH_INTERVAL 이내 재호출은 무시)"""
+    now = time.time()
+    if now - _last_touch.get((store_dir, key), 0) < TOUCH_INTERVAL:
+        return
+    _last_touch[(store_dir, key)] = now
+    _update_catalog(store_dir, key, create=False, last_access=now)
+
+def list_datasets(store_dir=STORE_DIR):
+    """
+    저장소 카탈로그: 데이터셋별 이름, 행/컬럼 수, 파일 크기, 마지막 접근 시각
+
+    Returns:
+        최근 접근 순으로 정렬된 DataFrame
+    """
+    catalog = _read_catalog(store_dir)
+    if not catalog:
+        return pd.DataFrame(columns=["key", "name", "rows", "columns", "size_mb", "last_access"])
+    catalog_df = pd.DataFrame([{"key": key, **entry} for key, entry in catalog.items()])
+    catalog_df["size_mb"] = (catalog_df["size_bytes"] / 1024 ** 2).round(2)
+    catalog_df["last_access"] = pd.to_datetime(catalog_df["last_access"], unit="s")
+    return (catalog_df[["key", "name", "rows", "columns", "size_mb", "last_access"]]
+            .sort_values("last_access", ascending=False)
+            .reset_index(drop=True))
@@ -1,6 +1,7 @@
 import pandas as pd
+from eda_modules.column_profile import get_profile, describe_from_profile
 
-def describe_by_type(df: pd.DataFrame, var_types: dict, save_path: str = None):
+def describe_by_type(df: pd.DataFrame, var_types: dict, save_path: str = None, group_col: str = None, data_key: str = None):
     """
     범주형, 수치형 변수 각각에 대해 describe() 통계 출력
 
@@ -8,13 +9,17 @@ def describe_by_type(df: pd.DataFrame, var_types: dict, save_path: str = None):
         df (pd.DataFrame): 전체 데이터프레임
         var_types (dict): {'categorical': [...], 'numerical': [...], 'datetime': [...]}
         save_path (str): 저장 경로 지정 시 CSV로 저장
+        group_col (str): 그룹별 통계를 낼 범주형 컬럼 (None이면 전체)
+        data_key (str): 데이터셋 캐시 키 (지정 시 수치형 통계를 프로파일 캐시에서 재사용)
     """
     results = {}
 
-    # 1. 수치형 변수
-    if var_types.get("numerical"):
+    # 1. 수치형 변수 (describe()와 같이 bool 컬럼은 제외)
+    num_cols = [col for col in var_types.get("numerical", []) if not pd.api.types.is_bool_dtype(df[col])]
+    if num_cols:
         print("\n📊 수치형 변수 describe()")
-        desc_num = df[var_types["numerical"]].describe()
+        profile = get_profile(df, num_cols, group_col=group_col, data_key=data_key)
+        desc_num = describe_from_profile(profile, num_cols, group_col=group_col)
         print(desc_num)
         results["numerical"] = desc_num
         if save_path:
@@ -23,7 +28,8 @@ def describe_by_type(df: pd.DataFrame, var_types: dict, save_path: str = None):
     # 2. 범주형 변수
     if var_types.get("categorical"):
         print("\n🧩 범주형 변수 describe()")
-        desc_cat = df[var_types["categorical"]].describe(include="all")
+        cat_source = df if group_col is None else df.groupby(group_col, observed=True)
+        desc_cat = cat_source[var_types["categorical"]].describe(include="all")
         print(desc_cat)
         results["categorical"] = desc_cat
         if save_path:
@@ -0,0 +1,158 @@
+# eda_modules/feature_screening.py
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+from eda_modules import dataset_store
+from eda_modules.group_index import get_group_index
+from eda_modules.group_summary import group_summary, oneway_anova, kruskal_wallis
+from eda_modules.outlier_mask import keep_mask, outlier_keep_mask
+from eda_modules.process_pool import DEFAULT_WORKERS, get_process_pool, run_streaming
+
+SCREENING_TESTS = ("anova", "kruskal")
+# 기본 동시 스크리닝 프로세스 수 (환경변수 EDA_SCREENING_WORKERS로 조정, 렌더링 풀과 따로 둠)
+SCREENING_WORKERS = int(os.environ.get("EDA_SCREENING_WORKERS", DEFAULT_WORKERS))
+
+
+def screen_categorical(cat_col, codes, n_groups, num_cols, tests=("anova",), z_threshold=7.0,
+                       outlier_method="zscore", outlier_within=False,
+                       df=None, data_key=None, store_dir=dataset_store.STORE_DIR):
+    """
+    범주형 컬럼 하나와 여러 수치형 컬럼의 검정 (워커 프로세스에서 실행되는 작업 단위)
+
+    df를 주지 않으면 데이터셋 저장소에서 수치형 컬럼만 메모리 매핑으로 복사 없이 (읽기 전용) 연다.
+    (프로세스 사이에 컬럼 값이나 이상치 마스크를 복사해서 보내지 않고, 그룹 코드 배열 하나만 보냄)
+    전체 기준 이상치 마스크는 outlier_keep_mask로 만들어 data_key별로 캐시한다.
+    (현재 프로세스에서는 다른 통계 검정과 같은 캐시를, 워커에서는 워커별 캐시를 사용)
+
+    Parameters:
+        cat_col: 범주형 변수명 (결과 표시용)
+        codes: 행별 그룹 코드 배열 (결측은 -1)
+        n_groups: 그룹 수
+        num_cols: 수치형 변수명 리스트
+        tests: 'anova', 'kruskal' 중 수행할 검정
+        z_threshold: 이상치 제거 임계값
+        outlier_method: 이상치 제거 방식 ('zscore', 'iqr', 'mad', outlier_mask와 같은 기준)
+        outlier_within: True면 범주형 변수의 그룹 안에서 이상치 기준을 계산
+        data_key: 데이터셋 키 (df가 없으면 저장소에서 열 데이터셋, 이상치 마스크 캐시 키)
+
+    Returns:
+        (결과 딕셔너리 리스트, 걸린 시간(초))
+    """
+    start = time.perf_counter()
+    if df is None:
+        df = dataset_store.open_dataset(data_key, columns=list(num_cols), store_dir=store_dir, copy=False)
+    codes = np.asarray(codes, dtype=np.int64)
+
+    rows = []
+    for num_col in num_cols:
+        values = df[num_col].to_numpy(dtype=np.float64, na_value=np.nan)
+        if outlier_within:
+            keep = keep_mask(values, outlier_method, z_threshold, codes)
+        else:
+            keep = outlier_keep_mask(df, num_col, outlier_method, z_threshold, data_key=data_key)
+        row_codes = np.where(keep, codes, -1)
+        summary = group_summary(values, row_codes, n_groups)
+        n_present = int((summary["n"] > 0).sum())
+        base = {"cat_col": cat_col, "num_col": num_col, "n": int(summary["n"].sum()), "groups": n_present}
+        for test in tests:
+            # 그룹이 하나뿐이거나 모든 그룹이 한 행씩이면(ID 같은 컬럼) 검정할 수 없음
+            if n_present < 2 or base["n"] <= n_present:
+                rows.append({**base, "test": test, "statistic": np.nan, "p-value": np.nan, "effect_size": np.nan})
+            elif test == "anova":
+                result = oneway_anova(summary)
+                rows.append({**base, "test": test, "statistic": result["F"], "p-value": result["p"],
+                             "effect_size": result["eta_squared"]})
+            else:
+                result = kruskal_wallis(values, row_codes, n_groups)
+                rows.append({**base, "test": test, "statistic": result["H"], "p-value": result["p"],
+                             "effect_size": result["epsilon_squared"]})
+    return rows, time.perf_counter() - start
+
+def get_screening_pool(max_workers=None):
+    """동시 작업 수별로 하나씩 만들어 재사용하는 스크리닝 프로세스 풀 (matplotlib 초기화 없음)"""
+    return get_process_pool("screening", max_workers or SCREENING_WORKERS)
+
+def screen_features(df, cat_cols, num_cols, tests=("anova",), z_threshold=7.0, correction="fdr_bh",
+                    alpha=0.05, outlier_method="zscore", outlier_within=False, data_key=None,
+                    max_workers=None, store_dir=dataset_store.STORE_DIR):
+    """
+    범주형 x 수치형 모든 조합의 일원분산분석 / Kruskal-Wallis 스크리닝
+
+    범주형 컬럼마다 캐시된 그룹 인덱스로 행별 그룹 코드를 한 번 만들고,
+    범주형 컬럼 단위 작업을 스크리닝 전용 프로세스 풀에 나눠 실행한다. (그림 생성 풀과 워커를 공유하지 않음)
+    각 조합은 그룹별 충분통계량(group_summary)으로 계산하므로 데이터프레임을 그룹별로 나누지 않는다.
+    데이터셋이 저장소에 없거나, 동시 프로세스가 1개이거나, 범주형 컬럼이 하나면 현재 프로세스에서 실행한다.
+
+    Parameters:
+        df: 데이터프레임
+        cat_cols: 범주형 변수명 리스트
+        num_cols: 수치형 변수명 리스트
+        tests: 'anova'(효과 크기 eta²), 'kruskal'(효과 크기 epsilon²) 중 수행할 검정
+        z_threshold: 이상치 제거 임계값 (수치형 변수별)
+        outlier_method: 이상치 제거 방식 ('zscore', 'iqr', 'mad')
+        outlier_within: True면 범주형 변수의 그룹 안에서 이상치 기준을 계산
+        correction: 다중비교 보정 방법 ('bonferroni', 'holm', 'fdr_bh', 'none', 전체 조합 기준)
+        alpha: 유의수준
+        data_key: 데이터셋 키 (그룹 인덱스 캐시 + 워커가 저장소에서 컬럼을 읽을 때 사용)
+        max_workers: 동시 프로세스 수 (None이면 SCREENING_WORKERS)
+
+    Returns:
+        (결과 데이터프레임, 시간 딕셔너리) 튜플
+        - 결과: 효과 크기 내림차순, 보정 p-value 오름차순으로 정렬
+        - 시간: wall_s(전체), index_s(그룹 코드 준비), compute_s(작업별 계산 시간의 합), tasks
+    """
+    start = time.perf_counter()
+    tests = tuple(test for test in tests if test in SCREENING_TESTS)
+    num_cols = [col for col in num_cols if col not in cat_cols]
+
+    tasks = []
+    max_workers = max(1, int(max_workers or SCREENING_WORKERS))
+    in_process = (max_workers == 1 or len(cat_cols) < 2 or data_key is None
+                  or not dataset_store.exists(data_key, store_dir))
+    for cat_col in cat_cols:
+        groups, codes = get_group_index(df, cat_col, data_key).label_row_codes(len(df))
+        kwargs = dict(cat_col=cat_col, codes=codes.astype(np.int32), n_groups=len(groups), num_cols=num_cols,
+                      tests=tests, z_threshold=z_threshold, outlier_method=outlier_method,
+                      outlier_within=outlier_within, data_key=data_key)
+        if in_process:
+            kwargs["df"] = df
+        else:
+            kwargs["store_dir"] = store_dir
+        tasks.append((screen_categorical, kwargs))
+    index_s = time.perf_counter() - start
+
+    rows, compute_s = [], 0.0
+    for _, (task_rows, seconds) in run_streaming(tasks, 1 if in_process else max_workers, get_screening_pool):
+        rows += task_rows
+        compute_s += seconds
+
+    columns = ["cat_col", "num_col", "test", "n", "groups", "statistic", "p-value", "effect_size"]
+    result_df = pd.DataFrame(rows, columns=columns)
+
+    # 다중비교 보정 (검정할 수 없었던 조합은 제외)
+    tested = result_df["p-value"].notna().to_numpy()
+    result_df["p-value_corrected"] = np.nan
+    result_df["Significant"] = False
+    if tested.any():
+        if correction != "none":
+            from statsmodels.stats.multitest import multipletests  # type: ignore
+            reject, corrected, _, _ = multipletests(result_df.loc[tested, "p-value"], alpha=alpha, method=correction)
+        else:
+            corrected = result_df.loc[tested, "p-value"].to_numpy()
+            reject = corrected < alpha
+        result_df.loc[tested, "p-value_corrected"] = corrected
+        result_df.loc[tested, "Significant"] = reject
+
+    result_df = result_df.sort_values(["effect_size", "p-value_corrected"], ascending=[False, True],
+                                      na_position="last", kind="stable").reset_index(drop=True)
+    timing = {
+        "wall_s": time.perf_counter() - start,
+        "index_s": index_s,
+        "compute_s": compute_s,
+        "tasks": len(tasks),
+        "in_process": in_process,
+    }
+    return result_df, timing
@@ -16,7 +16,7 @@ def filter_dataframe(df: pd.DataFrame) -> pd.DataFrame:
                 selected_range = st.slider(f"{col} 범위 선택", float(min_val), float(max_val), (float(min_val), float(max_val)))
                 filtered_df = filtered_df[filtered_df[col].between(*selected_range)]
 
-            elif pd.api.types.is_categorical_dtype(df[col]) or df[col].dtype == object:
+            elif isinstance(df[col].dtype, (pd.CategoricalDtype, pd.StringDtype)) or df[col].dtype == object:
                 unique_vals = df[col].dropna().unique().tolist()
                 selected_vals = st.multiselect(f"{col} 값 선택", options=unique_vals, default=unique_vals)
                 filtered_df = filtered_df[filtered_df[col].isin(selected_vals)]
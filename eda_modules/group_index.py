@@ -0,0 +1,181 @@
+# eda_modules/group_index.py
+
+import os
+import json
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from eda_modules.dataset_store import write_atomic
+
+GROUP_INDEX_CACHE_SIZE = 64
+
+_index_cache = OrderedDict()   # (data_key, col) -> GroupIndex
+_lock = threading.Lock()
+
+
+class GroupIndex:
+    """
+    범주형 컬럼 값별 행 위치 인덱스
+
+    컬럼을 한 번 factorize + 안정 정렬해서 값(코드)별 행 위치를 연속 구간으로 저장한다.
+    그룹 하나를 꺼낼 때 df[df[col] == value]처럼 전체 행을 비교하지 않고 O(그룹 크기)로 가져온다.
+    행 위치는 그룹 안에서 원래 순서를 유지한다.
+    """
+
+    def __init__(self, values=None):
+        if values is None:
+            return
+        codes, uniques = pd.factorize(values, sort=False)   # 등장 순서 = dropna().unique() 순서
+        valid = np.flatnonzero(codes >= 0)
+        self._set(list(uniques), valid[np.argsort(codes[valid], kind="stable")],
+                  np.bincount(codes[valid], minlength=len(uniques)))
+
+    def _set(self, uniques, order, counts):
+        self.uniques = uniques
+        self._code_of = {value: code for code, value in enumerate(self.uniques)}
+        self._order = order
+        self.counts = counts
+        self._bounds = np.concatenate(([0], np.cumsum(self.counts)))
+
+    def save(self, path):
+        """행 위치/그룹별 개수를 npz로 저장 (그룹 값은 JSON으로 같이 저장해서 타입 유지)"""
+        uniques = json.dumps([v.item() if isinstance(v, np.generic) else v for v in self.uniques], ensure_ascii=False)
+
+        def write_index(p):
+            with open(p, "wb") as f:
+                np.savez(f, order=self._order, counts=self.counts, uniques=np.array(uniques))
+        write_atomic(path, write_index)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            index = cls()
+            index._set(json.loads(str(data["uniques"])), data["order"], data["counts"])
+        return index
+
+    def __len__(self):
+        return len(self.uniques)
+
+    def values(self):
+        """결측을 제외한 그룹 값 목록 (처음 등장한 순서)"""
+        return list(self.uniques)
+
+    def code(self, value):
+        """그룹 값의 코드 (없는 값이면 -1)"""
+        return self._code_of.get(value, -1)
+
+    def positions_of_code(self, code):
+        if code < 0:
+            return self._order[:0]
+        return self._order[self._bounds[code]:self._bounds[code + 1]]
+
+    def positions(self, value):
+        """그룹 값에 해당하는 행 위치 배열 (원래 행 순서)"""
+        return self.positions_of_code(self.code(value))
+
+    def take(self, df, value, columns=None):
+        """그룹 값에 해당하는 행만 꺼낸 DataFrame (df[df[col] == value]와 같은 결과)"""
+        data = df if columns is None else df[columns]
+        return data.iloc[self.positions(value)]
+
+    def size(self, value):
+        code = self.code(value)
+        return int(self.counts[code]) if code >= 0 else 0
+
+    def split(self, values):
+        """행 순서 값 배열을 그룹 코드 순서의 배열 리스트로 나눔 (한 번에 재배열, 그룹 안에서는 원래 행 순서)"""
+        return np.split(np.asarray(values)[self._order], self._bounds[1:-1])
+
+    def row_codes(self, n_rows):
+        """행별 그룹 코드 배열 (결측은 -1) — 행 위치 인덱스에서 복원"""
+        codes = np.full(n_rows, -1, dtype=np.int64)
+        codes[self._order] = np.repeat(np.arange(len(self.uniques)), self.counts)
+        return codes
+
+    def label_row_codes(self, n_rows):
+        """
+        그룹 값을 문자열로 바꾼 이름 기준의 (정렬된 이름 리스트, 행별 코드 배열)
+
+        같은 문자열이 되는 값은 한 그룹으로 묶고, 코드는 이름 순으로 다시 매긴다. (결측은 -1)
+        """
+        labels = [str(value) for value in self.uniques]
+        groups = sorted(set(labels))
+        code_of = {label: code for code, label in enumerate(groups)}
+        label_codes = np.array([code_of[label] for label in labels] + [-1], dtype=np.int64)
+        return groups, label_codes[self.row_codes(n_rows)]
+
+
+def index_path(data_key, col, store_dir):
+    """데이터셋 저장소에 데이터셋 파일과 나란히 저장되는 그룹 인덱스 경로"""
+    safe_col = "".join(c if c.isalnum() or c in "-_" else "_" for c in str(col))
+    return os.path.join(store_dir, f"{data_key}.{safe_col}.groups.npz")
+
+def _load_or_build(df, col, data_key, store_dir):
+    if store_dir is None:
+        return GroupIndex(df[col])
+    path = index_path(data_key, col, store_dir)
+    if os.path.exists(path):
+        try:
+            return GroupIndex.load(path)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"그룹 인덱스 읽기 실패, 다시 생성합니다: {e}")
+    index = GroupIndex(df[col])
+    try:
+        os.makedirs(store_dir, exist_ok=True)
+        index.save(path)
+    except (OSError, TypeError) as e:
+        # 저장은 재사용을 위한 부가 기능 (JSON으로 표현할 수 없는 값 등은 메모리 인덱스만 사용)
+        print(f"그룹 인덱스 저장 실패: {e}")
+    return index
+
+def get_group_index(df, col, data_key=None, store_dir=None):
+    """
+    (데이터셋, 범주형 컬럼)별로 한 번만 만드는 그룹 인덱스
+
+    data_key가 None이면 캐시하지 않는다.
+    store_dir(데이터셋 저장소)를 주면 데이터셋 파일 옆에 인덱스를 저장해 두고,
+    서버 재시작이나 다른 세션에서도 컬럼을 다시 읽지 않고 불러온다.
+    """
+    if data_key is None:
+        return GroupIndex(df[col])
+    key = (data_key, col)
+    with _lock:
+        index = _index_cache.get(key)
+        if index is not None:
+            _index_cache.move_to_end(key)
+            return index
+    index = _load_or_build(df, col, data_key, store_dir)
+    with _lock:
+        _index_cache[key] = index
+        _index_cache.move_to_end(key)
+        while len(_index_cache) > GROUP_INDEX_CACHE_SIZE:
+            _index_cache.popitem(last=False)
+    return index
+
+def group_coverage(indexes):
+    """
+    여러 파일의 그룹 인덱스를 합친 그룹 값별 행 수 표 (데이터를 다시 읽지 않음)
+
+    Parameters:
+        indexes: {파일 이름: GroupIndex} 딕셔너리
+
+    Returns:
+        value, total_rows, files, 파일별 행 수 컬럼의 DataFrame (값 순서)
+    """
+    per_file = {
+        name: pd.Series(index.counts, index=pd.Index(index.values(), dtype=object), dtype="int64")
+        for name, index in indexes.items()
+    }
+    if not per_file:
+        return pd.DataFrame(columns=["value", "total_rows", "files"])
+    counts = pd.concat(per_file, axis=1).fillna(0).astype("int64")
+    counts = counts.loc[sorted(counts.index, key=lambda v: (str(type(v)), v))]
+    coverage = pd.DataFrame({
+        "value": counts.index,
+        "total_rows": counts.sum(axis=1).to_numpy(),
+        "files": (counts > 0).sum(axis=1).to_numpy(),
+    })
+    return pd.concat([coverage, counts.reset_index(drop=True)], axis=1)
@@ -0,0 +1,197 @@
+# eda_modules/group_summary.py
+
+import numpy as np
+import pandas as pd
+from scipy import stats  # type: ignore
+
+
+def group_summary(values, codes, n_groups):
+    """
+    그룹별 충분통계량 (정렬 한 번 + bincount)
+
+    Parameters:
+        values: float 배열
+        codes: 그룹 코드 배열 (0~n_groups-1, 음수와 NaN 값은 제외)
+        n_groups: 그룹 수
+
+    Returns:
+        n, mean, var(ddof=1), median, dev_mean, dev_ss 컬럼의 DataFrame (그룹 코드 순서)
+        - dev_mean, dev_ss: 그룹 중앙값 기준 절대편차 |x - median|의 평균과 편차제곱합 (Levene 검정용)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    codes = np.asarray(codes)
+    valid = (codes >= 0) & ~np.isnan(values)
+    x, c = values[valid], codes[valid].astype(np.int64)
+
+    n = np.bincount(c, minlength=n_groups).astype(np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.bincount(c, weights=x, minlength=n_groups) / n
+        # 평균을 뺀 뒤 제곱합 (자릿수 손실 방지)
+        var = np.bincount(c, weights=(x - mean[c]) ** 2, minlength=n_groups) / (n - 1)
+
+        # 그룹 코드, 값 순으로 한 번 정렬해서 그룹별 중앙값
+        order = np.lexsort((x, c))
+        sorted_x = x[order]
+        starts = np.concatenate(([0], np.cumsum(n[:-1]))).astype(np.int64)
+        counts = n.astype(np.int64)
+        lo = starts + np.maximum(counts - 1, 0) // 2
+        hi = starts + counts // 2
+        median = np.where(counts > 0, (sorted_x[np.minimum(lo, len(x) - 1)] + sorted_x[np.minimum(hi, len(x) - 1)]) / 2
+                          if len(x) else np.nan, np.nan)
+
+        dev = np.abs(x - median[c])
+        dev_mean = np.bincount(c, weights=dev, minlength=n_groups) / n
+        dev_ss = np.bincount(c, weights=(dev - dev_mean[c]) ** 2, minlength=n_groups)
+
+    return pd.DataFrame({
+        "n": counts, "mean": mean, "var": var, "median": median,
+        "dev_mean": dev_mean, "dev_ss": dev_ss,
+    })
+
+def pairwise_tests(summary, min_n=2, levene_alpha=0.05):
+    """
+    모든 그룹 쌍의 Levene 검정 + 독립표본 t검정 + Cohen's d를 배열 연산으로 계산
+
+    그룹별 충분통계량만 사용하므로 쌍마다 데이터를 다시 읽지 않는다.
+    - Levene: 중앙값 기준 (scipy.stats.levene 기본값과 같음)
+    - t검정: Levene p > levene_alpha면 Student(등분산), 아니면 Welch
+    - Cohen's d: 합동 표준편차 기준
+
+    Parameters:
+        summary: group_summary 결과
+        min_n: 쌍에 포함할 그룹의 최소 표본 수
+
+    Returns:
+        i, j(그룹 코드), t, p, equal_var, levene_stat, levene_p, cohens_d 컬럼의 DataFrame
+        (combinations(그룹, 2) 순서, 표본이 부족한 그룹의 쌍은 제외)
+    """
+    i, j = np.triu_indices(len(summary), k=1)
+    n, mean, var = (summary[c].to_numpy(dtype=np.float64) for c in ("n", "mean", "var"))
+    keep = (n[i] >= min_n) & (n[j] >= min_n)
+    i, j = i[keep], j[keep]
+    n1, n2, m1, m2, v1, v2 = n[i], n[j], mean[i], mean[j], var[i], var[j]
+    zbar1, zbar2 = summary["dev_mean"].to_numpy()[i], summary["dev_mean"].to_numpy()[j]
+    zss = summary["dev_ss"].to_numpy()[i] + summary["dev_ss"].to_numpy()[j]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Levene (k=2): W = (N-2) * Σ n_g (Zbar_g - Zbar)^2 / Σ Σ (Z - Zbar_g)^2
+        total = n1 + n2
+        zbar = (n1 * zbar1 + n2 * zbar2) / total
+        levene_stat = (total - 2) * (n1 * (zbar1 - zbar) ** 2 + n2 * (zbar2 - zbar) ** 2) / zss
+        levene_p = stats.f.sf(levene_stat, 1, total - 2)
+        equal_var = levene_p > levene_alpha
+
+        pooled_var = ((n1 - 1) * v1 + (n2 - 1) * v2) / (total - 2)
+        se_student = np.sqrt(pooled_var * (1 / n1 + 1 / n2))
+        se_welch = np.sqrt(v1 / n1 + v2 / n2)
+        df_welch = (v1 / n1 + v2 / n2) ** 2 / ((v1 / n1) ** 2 / (n1 - 1) + (v2 / n2) ** 2 / (n2 - 1))
+        se = np.where(equal_var, se_student, se_welch)
+        dof = np.where(equal_var, total - 2, df_welch)
+        t = (m1 - m2) / se
+        p = 2 * stats.t.sf(np.abs(t), dof)
+
+        pooled_std = np.sqrt(pooled_var)
+        cohens_d = np.where(pooled_std > 0, (m1 - m2) / pooled_std, 0.0)
+
+    return pd.DataFrame({
+        "i": i, "j": j, "t": t, "p": p, "equal_var": equal_var,
+        "levene_stat": levene_stat, "levene_p": levene_p, "cohens_d": cohens_d,
+    })
+
+def oneway_anova(summary):
+    """
+    그룹별 충분통계량으로 계산한 일원분산분석 (더미 변수 설계행렬 없이)
+
+    SSB = Σ n_g (mean_g - mean)^2, SSW = Σ (n_g - 1) var_g
+    (statsmodels OLS + anova_lm(typ=2)의 C(범주) 행과 같은 F, p)
+
+    Parameters:
+        summary: group_summary 결과 (n이 0인 그룹은 무시)
+
+    Returns:
+        F, p, df_between, df_within, ms_within, eta_squared(SSB / SST) 딕셔너리
+    """
+    summary = summary[summary["n"] > 0]
+    n, mean, var = (summary[c].to_numpy(dtype=np.float64) for c in ("n", "mean", "var"))
+    total = n.sum()
+    grand_mean = (n * mean).sum() / total
+    ss_between = (n * (mean - grand_mean) ** 2).sum()
+    ss_within = np.where(n > 1, (n - 1) * var, 0.0).sum()
+    df_between, df_within = len(n) - 1, total - len(n)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ms_within = ss_within / df_within
+        f_stat = (ss_between / df_between) / ms_within
+        eta_squared = ss_between / (ss_between + ss_within)
+    return {
+        "F": float(f_stat), "p": float(stats.f.sf(f_stat, df_between, df_within)),
+        "df_between": int(df_between), "df_within": int(df_within), "ms_within": float(ms_within),
+        "eta_squared": float(eta_squared),
+    }
+
+def tukey_hsd(summary, alpha=0.05):
+    """
+    그룹별 충분통계량으로 계산한 Tukey HSD (Tukey-Kramer, 표본 수가 다른 그룹 허용)
+
+    q = |mean_j - mean_i| / sqrt(MSE / 2 * (1/n_i + 1/n_j)), p는 스튜던트화 범위 분포의 상측 확률
+    (statsmodels pairwise_tukeyhsd와 같은 정의)
+
+    Parameters:
+        summary: group_summary 결과 (n이 0인 그룹은 무시)
+        alpha: 유의수준 (신뢰구간과 reject 기준)
+
+    Returns:
+        i, j(그룹 코드), meandiff(mean_j - mean_i), p_adj, lower, upper, reject 컬럼의 DataFrame
+        (combinations(그룹, 2) 순서)
+    """
+    present = np.flatnonzero(summary["n"].to_numpy() > 0)
+    anova = oneway_anova(summary)
+    n, mean = (summary[c].to_numpy(dtype=np.float64)[present] for c in ("n", "mean"))
+    k, dof = len(present), anova["df_within"]
+
+    a, b = np.triu_indices(k, k=1)
+    meandiff = mean[b] - mean[a]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        std_pairs = np.sqrt(anova["ms_within"] / 2 * (1 / n[a] + 1 / n[b]))
+        q_stat = np.abs(meandiff) / std_pairs
+    q_crit = stats.studentized_range.ppf(1 - alpha, k, dof)
+    crit_int = std_pairs * q_crit
+
+    return pd.DataFrame({
+        "i": present[a], "j": present[b], "meandiff": meandiff,
+        "p_adj": stats.studentized_range.sf(q_stat, k, dof),
+        "lower": meandiff - crit_int, "upper": meandiff + crit_int,
+        "reject": q_stat > q_crit,
+    })
+
+def kruskal_wallis(values, codes, n_groups):
+    """
+    Kruskal-Wallis H 검정 (전체 순위 한 번 + 그룹별 순위합 bincount)
+
+    scipy.stats.kruskal과 같은 동순위 보정을 적용한다.
+
+    Parameters:
+        values, codes, n_groups: group_summary와 같음
+
+    Returns:
+        H, p, df, epsilon_squared(H / (N - 1)) 딕셔너리
+    """
+    values = np.asarray(values, dtype=np.float64)
+    codes = np.asarray(codes)
+    valid = (codes >= 0) & ~np.isnan(values)
+    x, c = values[valid], codes[valid].astype(np.int64)
+    n = np.bincount(c, minlength=n_groups).astype(np.float64)
+    present = n > 0
+    total, k = n.sum(), int(present.sum())
+
+    ranks = stats.rankdata(x)
+    rank_sums = np.bincount(c, weights=ranks, minlength=n_groups)[present]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        h = 12.0 / (total * (total + 1)) * (rank_sums ** 2 / n[present]).sum() - 3 * (total + 1)
+        _, ties = np.unique(x, return_counts=True)
+        h /= 1 - (ties ** 3 - ties).sum() / (total ** 3 - total)
+        epsilon_squared = h / (total - 1)
+    return {
+        "H": float(h), "p": float(stats.chi2.sf(h, k - 1)), "df": k - 1,
+        "epsilon_squared": float(epsilon_squared),
+    }
@@ -0,0 +1,101 @@
+# eda_modules/kde_engine.py
+
+import numpy as np
+
+# 공유 격자 점 개수
+KDE_GRID_SIZE = 1024
+# 데이터 범위 밖으로 bandwidth의 몇 배까지 곡선을 그릴지 (seaborn kdeplot 기본값과 같음)
+KDE_CUT = 3
+# 공유 격자에서 bandwidth가 이 칸 수보다 좁은 시리즈는 따로 촘촘한 격자로 계산
+MIN_BW_BINS = 2
+
+
+def scott_bandwidth(values, bw_adjust=1.0):
+    """
+    Scott 규칙 bandwidth (scipy gaussian_kde / seaborn kdeplot 기본값과 같은 정의)
+
+    값이 2개 미만이거나 모두 같으면 0
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) < 2:
+        return 0.0
+    return float(np.std(values, ddof=1) * len(values) ** (-1 / 5) * bw_adjust)
+
+def _linear_bin(values, series_ids, n_series, lo, delta, grid_size):
+    """모든 시리즈 값을 공유 격자에 선형 binning (이웃한 두 격자점에 거리 비율로 나눔) — bincount 한 번"""
+    pos = (values - lo) / delta
+    left = np.clip(np.floor(pos).astype(np.int64), 0, grid_size - 2)
+    frac = np.clip(pos - left, 0.0, 1.0)
+    base = series_ids * grid_size + left
+    size = n_series * grid_size
+    counts = np.bincount(base, weights=1.0 - frac, minlength=size)
+    counts += np.bincount(base + 1, weights=frac, minlength=size)
+    return counts.reshape(n_series, grid_size)
+
+def _kde_shared(arrays, bandwidths, grid_size, cut):
+    """같은 격자 위에서 여러 시리즈의 KDE를 한 번에 계산 (FFT 가우시안 평활)"""
+    lo = min(a.min() - cut * bw for a, bw in zip(arrays, bandwidths))
+    hi = max(a.max() + cut * bw for a, bw in zip(arrays, bandwidths))
+    grid = np.linspace(lo, hi, grid_size)
+    delta = grid[1] - grid[0]
+
+    values = np.concatenate(arrays)
+    series_ids = np.repeat(np.arange(len(arrays)), [len(a) for a in arrays])
+    counts = _linear_bin(values, series_ids, len(arrays), lo, delta, grid_size)
+
+    # 격자 길이만큼 0을 덧붙여 순환 합성곱의 겹침(wrap-around) 방지
+    n_fft = 2 * grid_size
+    freqs = np.fft.rfftfreq(n_fft)
+    sigma_bins = np.asarray(bandwidths)[:, None] / delta
+    # 가우시안 커널의 푸리에 변환은 해석적으로 계산 (시리즈마다 bandwidth가 달라도 한 번에 처리)
+    kernel_ft = np.exp(-2 * (np.pi * freqs[None, :] * sigma_bins) ** 2)
+    smoothed = np.fft.irfft(np.fft.rfft(counts, n=n_fft, axis=1) * kernel_ft, n=n_fft, axis=1)[:, :grid_size]
+
+    n = np.array([len(a) for a in arrays], dtype=np.float64)[:, None]
+    density = np.clip(smoothed, 0, None) / (n * delta)
+    return grid, density
+
+def kde_batch(series, grid_size=KDE_GRID_SIZE, cut=KDE_CUT, bw_adjust=1.0):
+    """
+    여러 시리즈의 가우시안 KDE를 공유 격자 하나에서 한 번에 계산
+
+    모든 값을 같은 격자에 선형 binning한 뒤, 시리즈별 bandwidth의 가우시안으로
+    FFT 합성곱을 한 번에 수행한다. (시리즈마다 gaussian_kde를 따로 돌리는 것보다 빠름)
+    bandwidth가 공유 격자 간격에 비해 너무 좁은 시리즈(거의 상수인 값 등)는
+    자기 범위의 격자로 따로 계산해서 뾰족한 봉우리가 뭉개지지 않게 한다.
+    공유 격자에서 계산한 곡선은 시리즈 자기 범위(최솟값 - cut * bw ~ 최댓값 + cut * bw)로 잘라서
+    다른 시리즈 범위까지 이어지는 0 꼬리 없이 반환한다. (seaborn kdeplot과 같은 곡선 범위)
+
+    Parameters:
+        series: 수치 배열 리스트 (NaN 무시)
+        grid_size: 격자 점 개수
+        cut: 데이터 범위 밖으로 bandwidth의 몇 배까지 계산할지
+        bw_adjust: bandwidth 배율
+
+    Returns:
+        series 순서의 (x, density) 튜플 리스트 (값이 2개 미만이거나 모두 같으면 None, x는 시리즈 범위의 격자점)
+    """
+    arrays = []
+    for values in series:
+        values = np.asarray(values, dtype=np.float64)
+        arrays.append(values[~np.isnan(values)])
+    bandwidths = [scott_bandwidth(a, bw_adjust) for a in arrays]
+    valid = [i for i, bw in enumerate(bandwidths) if bw > 0]
+    results = [None] * len(arrays)
+    if not valid:
+        return results
+
+    grid, density = _kde_shared([arrays[i] for i in valid], [bandwidths[i] for i in valid], grid_size, cut)
+    delta = grid[1] - grid[0]
+    for row, i in enumerate(valid):
+        if bandwidths[i] < MIN_BW_BINS * delta and len(valid) > 1:
+            x, d = _kde_shared([arrays[i]], [bandwidths[i]], grid_size, cut)
+            results[i] = (x, d[0])
+        else:
+            # 범위 양 끝을 감싸는 격자점까지 포함해서 자름
+            lo = arrays[i].min() - cut * bandwidths[i]
+            hi = arrays[i].max() + cut * bandwidths[i]
+            start = max(np.searchsorted(grid, lo, side="right") - 1, 0)
+            stop = min(np.searchsorted(grid, hi, side="left") + 1, grid_size)
+            results[i] = (grid[start:stop], density[row, start:stop])
+    return results
@@ -0,0 +1,59 @@
+# eda_modules/memory_optimizer.py
+
+import numpy as np
+import pandas as pd
+
+# 고유값 비율이 이 값 이하인 문자열 컬럼은 category(사전 인코딩)로 저장
+CATEGORY_RATIO = 0.5
+# Arrow 기반 문자열 (결측은 NaN으로 유지, 비교 결과는 numpy bool)
+ARROW_STRING_DTYPE = pd.StringDtype("pyarrow", na_value=np.nan)
+
+
+def memory_usage_mb(df: pd.DataFrame) -> float:
+    """문자열 객체까지 포함한 DataFrame 메모리 사용량 (MB)"""
+    return float(df.memory_usage(deep=True).sum()) / 1024 ** 2
+
+def _compact_text(values, category_ratio):
+    # 숫자/문자 혼합 컬럼은 문자열로 통일하되 실제 결측은 그대로 유지
+    non_null = values.dropna()
+    if len(non_null) and pd.api.types.infer_dtype(non_null, skipna=True) != "string":
+        values = values.where(values.isna(), values.astype(str))
+    n_unique = non_null.nunique()
+    if len(non_null) == 0 or n_unique / len(non_null) <= category_ratio:
+        return values.astype("category")
+    return values.astype(ARROW_STRING_DTYPE)
+
+def _downcast_numeric(values):
+    if pd.api.types.is_bool_dtype(values):
+        return values
+    if pd.api.types.is_integer_dtype(values):
+        return pd.to_numeric(values, downcast="integer")
+    if values.dtype == np.float64:
+        as_float32 = values.astype(np.float32)
+        # float32로 바꿔도 값이 그대로 복원되는 경우에만 (무손실) 변환
+        if np.array_equal(as_float32.to_numpy(dtype=np.float64), values.to_numpy(), equal_nan=True):
+            return as_float32
+    return values
+
+def compact_dataframe(df: pd.DataFrame, category_ratio=CATEGORY_RATIO):
+    """
+    컬럼별로 메모리 효율적인 저장 형식을 선택해 변환
+
+    - object 컬럼: 고유값 비율이 낮으면 category, 높으면 Arrow 문자열
+    - 수치형 컬럼: 값 손실이 없는 범위에서 더 작은 타입으로 downcast
+
+    Parameters:
+        df: 변환할 데이터프레임 (컬럼 단위로 제자리 변환)
+        category_ratio: category로 저장할 고유값 비율 상한
+
+    Returns:
+        (df, 변환 전 메모리 MB, 변환 후 메모리 MB) 튜플
+    """
+    before_mb = memory_usage_mb(df)
+    for col in df.columns:
+        values = df[col]
+        if values.dtype == object:
+            df[col] = _compact_text(values, category_ratio)
+        elif pd.api.types.is_numeric_dtype(values):
+            df[col] = _downcast_numeric(values)
+    return df, before_mb, memory_usage_mb(df)
@@ -0,0 +1,133 @@
+# eda_modules/normality_engine.py
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from scipy import stats  # type: ignore
+from statsmodels.stats.diagnostic import normal_ad  # type: ignore
+
+from eda_modules.group_index import get_group_index
+
+# 검정 방법별 표시 이름
+NORMALITY_METHODS = {
+    "shapiro": "Shapiro-Wilk",
+    "ks": "Kolmogorov-Smirnov",
+    "anderson": "Anderson-Darling",
+    "dagostino": "D'Agostino-Pearson",
+}
+# 방법별 최소 표본 수 (D'Agostino는 첨도 검정에 8개 이상 필요)
+MIN_SAMPLES = {"shapiro": 3, "ks": 3, "anderson": 3, "dagostino": 8}
+# Shapiro-Wilk 표본 크기 제한 (넘으면 seed로 무작위 추출)
+SHAPIRO_MAX_N = 5000
+# 그룹별 검정 스레드 수 (scipy 검정의 수치 계산 구간은 GIL을 놓으므로 스레드로 충분)
+NORMALITY_WORKERS = int(os.environ.get("EDA_NORMALITY_WORKERS", min(8, os.cpu_count() or 1)))
+NORMALITY_CACHE_SIZE = 64
+
+_result_cache = OrderedDict()   # (data_key, num_col, cat_col, method, seed) -> 결과 딕셔너리
+_lock = threading.Lock()
+
+
+def normality_test(values, method="shapiro", seed=42):
+    """
+    결측을 제외한 float 배열 하나의 정규성 검정
+
+    - shapiro: SHAPIRO_MAX_N개 초과면 seed로 비복원 추출 (pandas sample(random_state=seed)와 같은 표본)
+    - ks: 표본 평균 / 표준편차(ddof=1)의 정규분포와 비교
+    - anderson: 평균 / 분산을 추정한 경우의 Anderson-Darling (p는 Stephens 근사, statsmodels normal_ad)
+    - dagostino: 왜도 + 첨도 기반 D'Agostino-Pearson (scipy normaltest, 큰 n에서 가벼움)
+
+    Returns:
+        test, statistic, p_value, is_normal, sample_size 딕셔너리
+    """
+    if method == "shapiro":
+        if len(values) > SHAPIRO_MAX_N:
+            values = values[np.random.RandomState(seed).choice(len(values), SHAPIRO_MAX_N, replace=False)]
+        stat, p_value = stats.shapiro(values)
+    elif method == "ks":
+        stat, p_value = stats.kstest(values, "norm", args=(values.mean(), values.std(ddof=1)))
+    elif method == "anderson":
+        stat, p_value = normal_ad(values)
+    elif method == "dagostino":
+        stat, p_value = stats.normaltest(values)
+    else:
+        raise ValueError(f"지원하지 않는 정규성 검정 방법: {method}")
+
+    return {
+        "test": NORMALITY_METHODS[method],
+        "statistic": float(stat),
+        "p_value": float(p_value),
+        "is_normal": bool(p_value > 0.05),
+        "sample_size": len(values),
+    }
+
+def _group_result(group, values, method, seed):
+    values = values[~np.isnan(values)]
+    if len(values) < MIN_SAMPLES[method]:
+        return {
+            "test": method,
+            "group": group,
+            "statistic": None,
+            "p_value": None,
+            "is_normal": None,
+            "sample_size": len(values),
+            "error": "데이터가 너무 적습니다"
+        }
+    result = normality_test(values, method, seed)
+    return {"test": result.pop("test"), "group": group, **result}
+
+def grouped_normality(df, num_col, cat_col=None, method="shapiro", seed=42, data_key=None, max_workers=None):
+    """
+    전체 / 그룹별 정규성 검정 (perform_normality_test와 같은 결과 형식)
+
+    그룹별 검정은 수치형 컬럼을 그룹 인덱스로 한 번에 그룹별 배열로 나눈 뒤
+    (그룹마다 df[df[cat_col] == group]으로 전체 행을 다시 거르지 않음) 스레드 풀에서 동시에 검정한다.
+    data_key가 있으면 (데이터셋, 수치형 컬럼, 그룹 컬럼, 방법, seed)별 결과를 캐시한다.
+
+    Parameters:
+        df: 데이터프레임
+        num_col: 수치형 변수명
+        cat_col: 범주형 변수명 (None이면 전체 데이터)
+        method: 'shapiro', 'ks', 'anderson', 'dagostino'
+        seed: Shapiro-Wilk 표본 추출 seed
+        data_key: 데이터셋 키 (None이면 캐시하지 않음)
+        max_workers: 동시 검정 스레드 수 (None이면 NORMALITY_WORKERS)
+
+    Returns:
+        결과 딕셔너리 (전체: 검정 결과 + group='전체', 그룹별: {'groups': [...]}, 실패: {'error': ...})
+    """
+    cache_key = (data_key, num_col, cat_col, method, seed)
+    if data_key is not None:
+        with _lock:
+            cached = _result_cache.get(cache_key)
+            if cached is not None:
+                _result_cache.move_to_end(cache_key)
+                return cached
+
+    values = df[num_col].to_numpy(dtype=np.float64, na_value=np.nan)
+    if cat_col is None:
+        values = values[~np.isnan(values)]
+        if len(values) < MIN_SAMPLES[method]:
+            return {"error": f"데이터가 너무 적습니다 (최소 {MIN_SAMPLES[method]}개 필요)"}
+        result = normality_test(values, method, seed)
+        result = {"test": result.pop("test"), "group": "전체", **result}
+    else:
+        group_index = get_group_index(df, cat_col, data_key)
+        jobs = list(zip([str(group) for group in group_index.values()], group_index.split(values)))
+        max_workers = max(1, int(max_workers or NORMALITY_WORKERS))
+        if max_workers == 1 or len(jobs) < 2:
+            group_results = [_group_result(group, group_values, method, seed) for group, group_values in jobs]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as pool:
+                group_results = list(pool.map(lambda job: _group_result(job[0], job[1], method, seed), jobs))
+        result = {"groups": group_results}
+
+    if data_key is not None:
+        with _lock:
+            _result_cache[cache_key] = result
+            _result_cache.move_to_end(cache_key)
+            while len(_result_cache) > NORMALITY_CACHE_SIZE:
+                _result_cache.popitem(last=False)
+    return result
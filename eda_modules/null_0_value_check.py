@@ -2,17 +2,23 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import os
 import numpy as np
+from eda_modules.column_profile import get_profile
 
+# 그림 모양이 바뀌면 올려서 이전 캐시 무효화
+RENDERER_VERSION = 1
 
-def check_0_value(df, cols, cat_col, save_path):
+
+def _rate_table(df, cols, cat_col, count_col, data_key=None):
+    # 범주별 (count_col / 전체 행 수) 비율표 - 프로파일 캐시의 집계값 재사용
+    profile = get_profile(df, cols, group_col=cat_col, data_key=data_key)
+    rate = (profile[count_col] / profile["rows"]).unstack("column")
+    return rate[cols]
+
+def check_0_value(df, cols, cat_col, save_path, data_key=None):
     if cat_col not in df.columns:
         raise ValueError(f"{cat_col} is not in dataframe")
 
-    zero_rate_df = (
-        df[cols + [cat_col]]
-        .groupby(cat_col)
-        .apply(lambda x: (x[cols] == 0).mean())
-    )
+    zero_rate_df = _rate_table(df, cols, cat_col, "zero_count", data_key=data_key)
     num_cats = len(zero_rate_df)       # y축 (범주 개수)
     num_vars = len(zero_rate_df.columns)
     fig_width = min(0.6 * num_vars, 30)   # 변수 개수에 비례하되 최대 30
@@ -34,15 +40,11 @@ def check_0_value(df, cols, cat_col, save_path):
 
     return save_path
 
-def check_null_value(df, cols, cat_col, save_path):
+def check_null_value(df, cols, cat_col, save_path, data_key=None):
     if cat_col not in df.columns:
         raise ValueError(f"{cat_col} is not in dataframe")
 
-    null_rate_df = (
-        df[cols + [cat_col]]
-        .groupby(cat_col)
-        .apply(lambda x: x[cols].isnull().mean())
-    )
+    null_rate_df = _rate_table(df, cols, cat_col, "null_count", data_key=data_key)
 
     num_cats = len(null_rate_df)       # y축 (범주 개수)
     num_vars = len(null_rate_df.columns)
@@ -2,10 +2,54 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import os
 import numpy as np
+from eda_modules.column_profile import get_profile, profile_row, quantile_label, PROFILE_QUANTILES
+from eda_modules.quantile_sketch import approx_quantiles, use_exact
+from eda_modules.group_index import get_group_index
+from eda_modules.artifact_cache import ARTIFACT_DIR, artifact_task, frame_key, lookup_artifact
 
-def plot_outliers_boxplot(df, col, save_path, color="skyblue"):
+# 스케치 기반 boxplot에서 그릴 이상치 점의 최대 개수
+MAX_FLIER_POINTS = 5000
+# 그림 모양이 바뀌면 올려서 이전 캐시 무효화
+RENDERER_VERSION = 1
+
+def boxplot_stats(values, whis=1.5, exact=None):
+    """
+    boxplot 통계 (matplotlib Axes.bxp 입력 형식)
+
+    사분위수는 정확 계산 또는 분위수 스케치로 구하고, 수염 끝과 이상치는
+    구한 경계로 값을 한 번 걸러서 실제 데이터 값으로 정한다.
+    """
+    x = np.asarray(values, dtype=np.float64)
+    x = x[~np.isnan(x)]
+    q1, med, q3 = approx_quantiles(x, [0.25, 0.5, 0.75], exact=exact)
+    iqr = q3 - q1
+    lower, upper = q1 - whis * iqr, q3 + whis * iqr
+    inside = (x >= lower) & (x <= upper)
+    fliers = x[~inside]
+    if len(fliers) > MAX_FLIER_POINTS:
+        fliers = np.random.default_rng(0).choice(fliers, MAX_FLIER_POINTS, replace=False)
+    return {
+        "med": med, "q1": q1, "q3": q3,
+        "whislo": x[inside].min() if inside.any() else q1,
+        "whishi": x[inside].max() if inside.any() else q3,
+        "fliers": fliers,
+    }
+
+def plot_outliers_boxplot(df, col, save_path, color="skyblue", exact=None):
+    """
+    boxplot 시각화
+
+    exact: True=seaborn boxplot(전체 정렬), False=분위수 스케치 기반, None=행 수로 자동 선택
+    """
     plt.figure(figsize=(6, 4))
-    sns.boxplot(x=df[col], color=color)
+    if use_exact(len(df), exact):
+        sns.boxplot(x=df[col], color=color)
+    else:
+        stats = boxplot_stats(df[col].to_numpy(dtype=np.float64, na_value=np.nan), exact=False)
+        plt.gca().bxp([stats], vert=False, patch_artist=True, widths=0.8,
+                      boxprops={"facecolor": color}, medianprops={"color": "black"})
+        plt.gca().set_yticks([])
+        plt.xlabel(col)
     plt.title(f"Boxplot of {col}")
     plt.tight_layout()
     os.makedirs(os.path.dirname(save_path), exist_ok=True)
@@ -15,17 +59,23 @@ def plot_outliers_boxplot(df, col, save_path, color="skyblue"):
 
 
 
-def plot_outliers_zscore_custom(df, col, z_threshold, save_path, color="skyblue"):
+def plot_outliers_zscore_custom(df, col, z_threshold, save_path, color="skyblue", profile=None, exact=None):
+    """
+    Z-Score 기준 이상치 경계 시각화
+
+    profile: column_profile의 해당 컬럼 통계 Series (주어지면 평균/표준편차를 다시 계산하지 않음)
+    """
+    stats = profile_row(df, col, profile, exact=exact)
     plt.figure(figsize=(6, 4))
     
-    if df[col].nunique() == 1 or df[col].std() == 0:
+    if stats["min"] == stats["max"] or stats["std"] == 0:
         sns.countplot(x=df[col], color=color)
         plt.title(f"[{col}] 단일값 - 분산 0으로 이상치 판단 불가")
         plt.figtext(0.5, -0.1, "※ 이 컬럼은 단일값으로 Z-score 이상치 시각화가 불가능합니다.", 
                     ha="center", fontsize=9, color='red')
     else:
-        mean = df[col].mean()
-        std = df[col].std()
+        mean = stats["mean"]
+        std = stats["std"]
         lower = mean - z_threshold * std
         upper = mean + z_threshold * std
 
@@ -41,26 +91,97 @@ def plot_outliers_zscore_custom(df, col, z_threshold, save_path, color="skyblue"
     plt.close()
     return save_path
 
-def plot_outliers_iqr_custom(df, numerical_cols, save_path, q1: float = 25, q3: float = 75, k: float = 1.5, color="skyblue"):
+def plot_outliers_iqr_custom(df, numerical_cols, save_path, q1: float = 25, q3: float = 75, k: float = 1.5, color="skyblue", profile=None, exact=None):
     """
     IQR 커스텀 방식으로 이상치를 시각화
+
+    profile: column_profile의 해당 컬럼 통계 Series (q1/q3 분위수를 포함해야 하며, 단일 컬럼일 때만 사용)
+    exact: 분위수 계산 방식 (True=정확, False=분위수 스케치, None=행 수로 자동)
     """
+    if isinstance(numerical_cols, str):
+        numerical_cols = [numerical_cols]
+    quantiles = (q1 / 100, q3 / 100)
     for col in numerical_cols:
         if col not in df.columns:
             print(f"없는 컬럼 {col}컬럼이 들어왔습니다.")
             continue
+        stats = profile_row(df, col, profile if len(numerical_cols) == 1 else None, quantiles=quantiles, exact=exact)
         plt.figure(figsize=(8, 4))
-        q1_val = np.percentile(df[col], q1)
-        q3_val = np.percentile(df[col], q3)
+        q1_val = stats[quantile_label(q1 / 100)]
+        q3_val = stats[quantile_label(q3 / 100)]
         iqr = q3_val - q1_val
         lower_bound = q1_val - k * iqr
         upper_bound = q3_val + k * iqr
 
-        sns.histplot(df[col], bins=30, kde=True, color='lightgreen', label='Normal Range')
+        sns.histplot(df[col], bins=30, kde=True, color=color, label='Normal Range')
         plt.axvline(lower_bound, color='red', linestyle='--', label=f'Lower Bound ({round(lower_bound, 2)})')
         plt.axvline(upper_bound, color='red', linestyle='--', label=f'Upper Bound ({round(upper_bound, 2)})')
         plt.title(f"[{col}] IQR 이상치 (Q1={q1}, Q3={q3}, k={k})")
         plt.legend()
-    plt.tight_layout()
-    plt.close()
+        plt.tight_layout()
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        plt.savefig(save_path, facecolor="white")
+        plt.close()
     return save_path
+
+# 이상치 탐지 방식별 그림 함수
+OUTLIER_RENDERERS = {
+    "boxplot": plot_outliers_boxplot,
+    "zscore": plot_outliers_zscore_custom,
+    "iqr": plot_outliers_iqr_custom,
+}
+
+def outlier_jobs(df, cols, method="boxplot", group_col=None, group_value=None, color="skyblue", exact=None,
+                 z_threshold=3.0, q1=25, q3=75, k=1.5, data_key=None, store_dir=ARTIFACT_DIR):
+    """
+    컬럼별 이상치 그림 작업 목록 (대시보드와 배치 리포트가 같은 캐시 키를 쓰도록 공유)
+
+    Parameters:
+        df: 전체 데이터프레임 (그룹은 group_col/group_value로 지정)
+        method: 'boxplot', 'zscore', 'iqr'
+        group_col, group_value: 그룹 컬럼과 값 (group_col이 None이면 전체 데이터)
+        data_key: 데이터셋 키 (None이면 df 내용 해시)
+
+    Returns:
+        (이미지 경로, 작업) 리스트 — 캐시에 있으면 작업이 None
+    """
+    data_key = data_key or frame_key(df, list(cols) + ([group_col] if group_col else []))
+    renderer = OUTLIER_RENDERERS[method]
+    params = {
+        "group_col": group_col,
+        "group": str(group_value) if group_col else "all",
+        "color": color,
+        "exact": exact,
+    }
+    if method == "zscore":
+        params["z_threshold"] = z_threshold
+    elif method == "iqr":
+        params.update(q1=q1, q3=q3, k=k)
+
+    jobs = []
+    df_selected = profile = None
+    for col in cols:
+        img_path, hit = lookup_artifact(data_key, renderer, {**params, "col": col}, store_dir=store_dir)
+        if hit:
+            jobs.append((img_path, None))
+            continue
+
+        # 그릴 그림이 있을 때만 그룹 행 추출 / 통계 계산 (선택된 컬럼 전체를 한 번에 프로파일링)
+        if df_selected is None:
+            df_selected = get_group_index(df, group_col, data_key).take(df, group_value) if group_col else df
+        if method != "boxplot" and profile is None:
+            quantiles = (q1 / 100, q3 / 100) if method == "iqr" else PROFILE_QUANTILES
+            profile = get_profile(df, cols, group_col=group_col, quantiles=quantiles, data_key=data_key, exact=exact)
+
+        # 워커로는 해당 컬럼만 전달
+        col_df = df_selected[[col]]
+        if method == "boxplot":
+            kwargs = dict(df=col_df, col=col, color=color, exact=exact)
+        else:
+            col_stats = profile.loc[(group_value, col)] if group_col else profile.loc[col]
+            if method == "zscore":
+                kwargs = dict(df=col_df, col=col, z_threshold=z_threshold, color=color, profile=col_stats)
+            else:
+                kwargs = dict(df=col_df, numerical_cols=col, q1=q1, q3=q3, k=k, color=color, profile=col_stats)
+        jobs.append((img_path, artifact_task(renderer, img_path, kwargs, store_dir)))
+    return jobs
@@ -0,0 +1,127 @@
+# eda_modules/outlier_mask.py
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from eda_modules.group_index import get_group_index
+
+# 방법별 표시 이름과 기본 임계값
+OUTLIER_MASK_METHODS = {
+    "zscore": ("Z-Score", 7.0),
+    "iqr": ("IQR", 3.0),
+    "mad": ("MAD (수정 Z-Score)", 7.0),
+}
+# 정규분포에서 MAD를 표준편차로 환산하는 상수
+MAD_SCALE = 1.4826
+MASK_CACHE_SIZE = 32
+
+_mask_cache = OrderedDict()   # (data_key, col, method, threshold, group_col) -> 불리언 행 마스크
+_lock = threading.Lock()
+
+
+def _group_quantile(sorted_x, starts, counts, q):
+    """그룹별로 정렬된 값에서 그룹별 분위수 (선형 보간, numpy / pandas 기본값과 같음)"""
+    pos = starts + q * np.maximum(counts - 1, 0)
+    lo = np.floor(pos).astype(np.int64)
+    hi = np.minimum(lo + 1, starts + np.maximum(counts - 1, 0))
+    last = max(len(sorted_x) - 1, 0)
+    lo, hi = np.minimum(lo, last), np.minimum(hi, last)
+    if not len(sorted_x):
+        return np.full(len(counts), np.nan)
+    return np.where(counts > 0, sorted_x[lo] + (pos - lo) * (sorted_x[hi] - sorted_x[lo]), np.nan)
+
+def _sorted_by_group(x, c, n_groups):
+    """(그룹, 값) 순으로 한 번 정렬한 값과 그룹별 시작 위치 / 개수"""
+    order = np.lexsort((x, c))
+    counts = np.bincount(c, minlength=n_groups)
+    starts = np.concatenate(([0], np.cumsum(counts[:-1]))).astype(np.int64)
+    return x[order], starts, counts
+
+def keep_mask(values, method="zscore", threshold=7.0, codes=None):
+    """
+    이상치가 아닌 행의 불리언 마스크 (배열 단위, 캐시 없음)
+
+    - zscore: |x - 평균| / 표준편차(ddof=0) < threshold
+    - iqr: Q1 - threshold * IQR <= x <= Q3 + threshold * IQR
+    - mad: |x - 중앙값| / (1.4826 * MAD) < threshold (수정 Z-Score)
+    산포(표준편차 / IQR / MAD)가 0인 그룹은 이상치를 판단할 수 없으므로 모두 남긴다.
+
+    Parameters:
+        values: float 배열 (NaN 행은 항상 False)
+        method: 'zscore', 'iqr', 'mad'
+        threshold: 방법별 임계값 (z / IQR 배수 / 수정 z)
+        codes: 그룹 코드 배열 (주면 그룹 안에서 기준을 계산, 음수 코드 행은 False)
+
+    Returns:
+        values와 길이가 같은 불리언 배열
+    """
+    values = np.asarray(values, dtype=np.float64)
+    valid = ~np.isnan(values)
+    if codes is None:
+        codes = np.zeros(len(values), dtype=np.int64)
+    codes = np.asarray(codes, dtype=np.int64)
+    valid &= codes >= 0
+    keep = np.zeros(len(values), dtype=bool)
+    if not valid.any():
+        return keep
+
+    x, c = values[valid], codes[valid]
+    n_groups = int(c.max()) + 1
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if method == "zscore":
+            n = np.bincount(c, minlength=n_groups)
+            mean = np.bincount(c, weights=x, minlength=n_groups) / n
+            std = np.sqrt(np.bincount(c, weights=(x - mean[c]) ** 2, minlength=n_groups) / n)
+            inlier = (np.abs(x - mean[c]) / std[c] < threshold) | (std[c] == 0)
+        elif method == "iqr":
+            sorted_x, starts, counts = _sorted_by_group(x, c, n_groups)
+            q1 = _group_quantile(sorted_x, starts, counts, 0.25)
+            q3 = _group_quantile(sorted_x, starts, counts, 0.75)
+            iqr = q3 - q1
+            inlier = ((x >= q1[c] - threshold * iqr[c]) & (x <= q3[c] + threshold * iqr[c])) | (iqr[c] == 0)
+        elif method == "mad":
+            sorted_x, starts, counts = _sorted_by_group(x, c, n_groups)
+            median = _group_quantile(sorted_x, starts, counts, 0.5)
+            dev = np.abs(x - median[c])
+            sorted_dev, _, _ = _sorted_by_group(dev, c, n_groups)
+            mad = _group_quantile(sorted_dev, starts, counts, 0.5) * MAD_SCALE
+            inlier = (dev / mad[c] < threshold) | (mad[c] == 0)
+        else:
+            raise ValueError(f"지원하지 않는 이상치 방법: {method}")
+    keep[valid] = inlier
+    return keep
+
+def outlier_keep_mask(df, col, method="zscore", threshold=7.0, group_col=None, data_key=None):
+    """
+    (데이터셋, 컬럼, 방법, 임계값, 그룹 컬럼)별로 한 번만 계산하는 이상치 제거 행 마스크
+
+    모든 통계 검정이 같은 마스크를 공유한다. 기준(평균 / 분위수 등)은 컬럼의 결측이 아닌 전체 행으로 계산하고,
+    group_col을 주면 그룹 인덱스의 그룹별로 계산한다. (그룹 값이 결측인 행은 False)
+    data_key가 None이면 캐시하지 않는다.
+
+    Returns:
+        df 행 순서의 불리언 numpy 배열 (True = 남길 행, 읽기 전용)
+    """
+    cache_key = (data_key, col, method, float(threshold), group_col)
+    if data_key is not None:
+        with _lock:
+            mask = _mask_cache.get(cache_key)
+            if mask is not None:
+                _mask_cache.move_to_end(cache_key)
+                return mask
+
+    codes = None
+    if group_col is not None:
+        codes = get_group_index(df, group_col, data_key).row_codes(len(df))
+    mask = keep_mask(df[col].to_numpy(dtype=np.float64, na_value=np.nan), method, threshold, codes)
+    mask.flags.writeable = False
+
+    if data_key is not None:
+        with _lock:
+            _mask_cache[cache_key] = mask
+            _mask_cache.move_to_end(cache_key)
+            while len(_mask_cache) > MASK_CACHE_SIZE:
+                _mask_cache.popitem(last=False)
+    return mask
@@ -0,0 +1,86 @@
+# eda_modules/process_pool.py
+
+import os
+import atexit
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# 기본 동시 프로세스 수 (용도별 풀의 기본값, 각 모듈이 환경변수로 따로 조정)
+DEFAULT_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+
+_pools = {}   # 풀 이름 -> (max_workers, ProcessPoolExecutor)
+_lock = threading.Lock()
+
+
+def get_process_pool(name, max_workers, initializer=None, initargs=()):
+    """
+    용도별로 하나씩 만들어 재사용하는 spawn 프로세스 풀
+
+    스트림릿 재실행마다 프로세스를 새로 띄우지 않도록 모듈 수준에서 보관한다.
+    용도(name)가 다르면 워커 초기화와 워커 수가 섞이지 않도록 풀을 따로 만든다.
+    같은 용도에서 max_workers가 바뀌면 이전 풀을 종료하고 (제출된 작업은 마저 끝냄) 새 풀로 교체한다.
+
+    Parameters:
+        name: 풀 이름 ('render', 'screening' 등)
+        max_workers: 동시 프로세스 수
+        initializer: 워커 프로세스 초기화 함수 (풀을 처음 만들 때만 사용)
+        initargs: initializer 인자 튜플 또는 인자 튜플을 반환하는 함수 (풀을 처음 만들 때만 호출)
+    """
+    max_workers = max(1, int(max_workers))
+    with _lock:
+        current_workers, pool = _pools.get(name, (None, None))
+        if pool is not None and current_workers == max_workers:
+            return pool
+        if pool is not None:
+            pool.shutdown(wait=False)
+        # fork는 스레드가 있는 프로세스(스트림릿 서버)에서 안전하지 않으므로 spawn 사용
+        pool = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=initializer,
+            initargs=initargs() if callable(initargs) else initargs,
+        )
+        _pools[name] = (max_workers, pool)
+        return pool
+
+@atexit.register
+def shutdown_pools():
+    """모든 프로세스 풀 종료 (서버 종료 시 자동 호출)"""
+    with _lock:
+        pools = [pool for _, pool in _pools.values()]
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+def run_streaming(tasks, max_workers, get_pool):
+    """
+    작업을 워커 프로세스에 나눠 실행하고, 끝나는 순서대로 결과를 반환
+
+    Parameters:
+        tasks: (함수, kwargs) 리스트 (함수는 모듈 수준 함수여야 함)
+        max_workers: 동시 프로세스 수 (1이면 현재 프로세스에서 순서대로 실행)
+        get_pool: max_workers를 받아 프로세스 풀을 반환하는 함수
+
+    Yields:
+        (작업 인덱스, 반환값) 튜플
+    """
+    if not tasks:
+        return
+    if max_workers == 1 or len(tasks) == 1:
+        for idx, (fn, kwargs) in enumerate(tasks):
+            yield idx, fn(**kwargs)
+        return
+
+    pool = get_pool(max_workers)
+    futures = {}
+    for idx, (fn, kwargs) in enumerate(tasks):
+        try:
+            future = pool.submit(fn, **kwargs)
+        except RuntimeError:
+            # 다른 세션이 동시 프로세스 수를 바꿔 풀이 교체되었으면 새 풀에 이어서 제출
+            pool = get_pool(max_workers)
+            future = pool.submit(fn, **kwargs)
+        futures[future] = idx
+    for future in as_completed(futures):
+        yield futures[future], future.result()
@@ -0,0 +1,166 @@
+# eda_modules/quantile_sketch.py
+
+import math
+import numpy as np
+
+# 가장 위 단계 compactor 크기 (클수록 정확, 메모리는 대략 3k개 값)
+DEFAULT_K = 200
+# exact=None(자동)일 때 이 행 수 이하는 정렬 기반 정확 계산을 사용
+EXACT_MAX_ROWS = 1_000_000
+# 스케치를 만들 때 한 번에 처리하는 행 수
+SKETCH_CHUNK_ROWS = 1_000_000
+_CAPACITY_RATIO = 2 / 3
+
+
+def rank_error(k=DEFAULT_K):
+    """
+    스케치 분위수의 정규화 순위 오차 상한 (99% 신뢰, KLL 경험식)
+
+    예) k=200 → 약 0.013: 0.25 분위수 질의 결과의 실제 순위가 0.237~0.263 범위
+    """
+    return 2.296 / k ** 0.9723
+
+def use_exact(n_rows, exact=None):
+    """exact가 None이면 행 수로 정확 계산/스케치 여부를 결정"""
+    if exact is None:
+        return n_rows <= EXACT_MAX_ROWS
+    return bool(exact)
+
+
+class QuantileSketch:
+    """
+    병합 가능한 KLL 분위수 스케치
+
+    값을 청크 단위로 update()에 넣거나, 따로 만든 스케치(청크/그룹별)를 merge()로 합칠 수 있다.
+    전체 값을 메모리에 두거나 한 번에 정렬하지 않으며, quantile() 결과의 순위 오차는 rank_error(k) 이내.
+    최솟값/최댓값과 개수는 정확하게 유지한다.
+    """
+
+    def __init__(self, k=DEFAULT_K, seed=0):
+        self.k = k
+        self.n = 0
+        self.min = np.nan
+        self.max = np.nan
+        self._levels = [np.empty(0)]   # level h의 값은 가중치 2^h
+        # 같은 입력이면 항상 같은 결과가 나오도록 고정 seed 사용
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level):
+        depth = len(self._levels) - 1 - level
+        return max(int(math.ceil(self.k * _CAPACITY_RATIO ** depth)), 2)
+
+    def _compress(self):
+        level = 0
+        while level < len(self._levels):
+            items = self._levels[level]
+            if len(items) >= self._capacity(level):
+                if level + 1 == len(self._levels):
+                    self._levels.append(np.empty(0))
+                items = np.sort(items)
+                keep = items[:0]
+                if len(items) % 2:
+                    keep, items = items[:1], items[1:]
+                # 정렬된 값 중 짝수/홀수 번째만 가중치 2배로 위 단계에 올림
+                promoted = items[self._rng.integers(2)::2]
+                self._levels[level + 1] = np.concatenate([self._levels[level + 1], promoted])
+                self._levels[level] = keep
+            level += 1
+
+    def update(self, values):
+        """값 배열 추가 (NaN은 무시)"""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        self.n += len(values)
+        self.min = np.fmin(self.min, values.min())
+        self.max = np.fmax(self.max, values.max())
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """다른 스케치를 합침 (같은 k를 가정)"""
+        if other.n == 0:
+            return self
+        self.n += other.n
+        self.min = np.fmin(self.min, other.min)
+        self.max = np.fmax(self.max, other.max)
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+        for level, items in enumerate(other._levels):
+            self._levels[level] = np.concatenate([self._levels[level], items])
+        self._compress()
+        return self
+
+    def quantiles(self, qs):
+        """분위수 배열 (qs는 0~1, 값이 없으면 NaN)"""
+        qs = np.asarray(qs, dtype=np.float64)
+        if self.n == 0:
+            return np.full(qs.shape, np.nan)
+        items = np.concatenate(self._levels)
+        weights = np.concatenate([np.full(len(items_h), 2.0 ** h) for h, items_h in enumerate(self._levels)])
+        order = np.argsort(items, kind="stable")
+        cum_weight = np.cumsum(weights[order])
+        idx = np.searchsorted(cum_weight, qs * (self.n - 1), side="right")
+        result = items[order][np.minimum(idx, len(items) - 1)]
+        # 양 끝은 정확히 알고 있는 최솟값/최댓값 사용
+        result = np.where(qs <= 0, self.min, result)
+        return np.where(qs >= 1, self.max, result)
+
+    def quantile(self, q):
+        return float(self.quantiles([q])[0])
+
+
+def build_sketch(values, k=DEFAULT_K, chunk_rows=SKETCH_CHUNK_ROWS):
+    """배열을 청크 단위로 읽어 스케치 생성"""
+    sketch = QuantileSketch(k)
+    for start in range(0, len(values), chunk_rows):
+        sketch.update(values[start:start + chunk_rows])
+    return sketch
+
+def build_group_sketches(values, codes, n_groups, k=DEFAULT_K, chunk_rows=SKETCH_CHUNK_ROWS):
+    """
+    그룹별 스케치를 청크 단위로 생성
+
+    Parameters:
+        values: float 배열
+        codes: 그룹 코드 배열 (0~n_groups-1, 음수는 제외)
+        n_groups: 그룹 수
+
+    Returns:
+        그룹 코드 순서의 QuantileSketch 리스트
+    """
+    sketches = [QuantileSketch(k) for _ in range(n_groups)]
+    for start in range(0, len(values), chunk_rows):
+        x = values[start:start + chunk_rows]
+        c = codes[start:start + chunk_rows]
+        valid = (c >= 0) & ~np.isnan(x)
+        x, c = x[valid], c[valid]
+        # 청크 안에서만 그룹 코드로 모아서 그룹별로 전달
+        order = np.argsort(c, kind="stable")
+        x = x[order]
+        bounds = np.concatenate(([0], np.cumsum(np.bincount(c, minlength=n_groups))))
+        for g in np.flatnonzero(np.diff(bounds)):
+            sketches[g].update(x[bounds[g]:bounds[g + 1]])
+    return sketches
+
+def approx_quantiles(values, qs, exact=None, k=DEFAULT_K):
+    """
+    분위수 계산 (정확 계산 또는 스케치)
+
+    Parameters:
+        values: 수치 배열/Series (NaN 무시)
+        qs: 분위수 목록 (0~1)
+        exact: True=정렬 기반 정확 계산, False=스케치, None=행 수로 자동 선택
+
+    Returns:
+        qs 순서의 numpy 배열
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if use_exact(len(values), exact):
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return np.full(len(qs), np.nan)
+        return np.quantile(values, qs)
+    return build_sketch(values, k).quantiles(qs)
@@ -0,0 +1,46 @@
+# eda_modules/render_pool.py
+
+import os
+
+from eda_modules.process_pool import DEFAULT_WORKERS, get_process_pool, run_streaming
+
+# 기본 동시 렌더링 프로세스 수 (환경변수 EDA_RENDER_WORKERS로 조정)
+RENDER_WORKERS = int(os.environ.get("EDA_RENDER_WORKERS", DEFAULT_WORKERS))
+
+
+def _init_worker(rc_params):
+    """워커 프로세스마다 화면 없는 Agg 백엔드와 부모 프로세스의 폰트 설정 적용"""
+    import matplotlib  # type: ignore
+    matplotlib.use("Agg")
+    matplotlib.rcParams.update(rc_params)
+
+def _shared_rc_params():
+    import matplotlib  # type: ignore
+    keys = ["font.family", "font.sans-serif", "axes.unicode_minus"]
+    return ({key: matplotlib.rcParams[key] for key in keys},)
+
+def get_render_pool(max_workers=None):
+    """
+    동시 작업 수별로 하나씩 만들어 재사용하는 렌더링 프로세스 풀 (matplotlib 초기화 포함)
+    """
+    return get_process_pool("render", max_workers or RENDER_WORKERS, _init_worker, _shared_rc_params)
+
+def render_streaming(tasks, max_workers=None):
+    """
+    그림 생성 작업을 워커 프로세스에 나눠 실행하고, 끝나는 순서대로 결과를 반환
+
+    Parameters:
+        tasks: (함수, kwargs) 리스트 (함수는 모듈 수준 함수여야 하며, 저장한 이미지 경로나 None을 반환)
+        max_workers: 동시 렌더링 프로세스 수 (None이면 RENDER_WORKERS, 1이면 현재 프로세스에서 순서대로 실행)
+
+    Yields:
+        (작업 인덱스, 반환값) 튜플
+    """
+    yield from run_streaming(tasks, max_workers, get_render_pool)
+
+def render_all(tasks, max_workers=None):
+    """render_streaming 결과를 작업 순서대로 모은 리스트"""
+    results = [None] * len(tasks)
+    for idx, result in render_streaming(tasks, max_workers):
+        results[idx] = result
+    return results
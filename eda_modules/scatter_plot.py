@@ -1,62 +1,218 @@
 # eda_modules/scatter_plot.py
 
+import io
+import base64
 import pandas as pd
 import numpy as np
+from PIL import Image
 import plotly.express as px  # type: ignore
+import plotly.graph_objects as go  # type: ignore
 
-def plot_scatter(df, x_col, y_col, hue_col=None):
+# 이 행 수를 넘으면 SVG 대신 WebGL(scattergl)로 그림
+SCATTER_WEBGL_ROWS = 20_000
+# 이 행 수를 넘으면 점을 보내지 않고 서버에서 2D 밀도 격자로 집계해서 그림
+SCATTER_DENSITY_ROWS = 300_000
+# 밀도 격자 한 변의 칸 수
+DENSITY_BINS = 300
+# 색상 구분 그룹 최대 개수 (빈도 상위만 따로 표시, 나머지는 '기타')
+MAX_HUE_GROUPS = 10
+
+
+def scatter_mode(n_rows, mode="auto"):
+    """행 수로 그리기 방식 결정 ('svg', 'webgl', 'density')"""
+    if mode != "auto":
+        return mode
+    if n_rows > SCATTER_DENSITY_ROWS:
+        return "density"
+    if n_rows > SCATTER_WEBGL_ROWS:
+        return "webgl"
+    return "svg"
+
+def value_range(values):
+    """
+    표시 범위 슬라이더에 쓸 (최솟값, 최댓값)
+
+    결측 / 무한대를 제외한 값이 없거나 모든 값이 같으면 범위를 정할 수 없으므로 None
+    """
+    values = pd.Series(values).to_numpy(dtype=np.float64, na_value=np.nan)
+    values = values[np.isfinite(values)]
+    if len(values) == 0:
+        return None
+    lo, hi = float(values.min()), float(values.max())
+    return (lo, hi) if lo < hi else None
+
+def _hue_codes(values, max_groups=MAX_HUE_GROUPS):
+    """색상 그룹 코드와 그룹 이름 (빈도 상위 max_groups개 외에는 '기타'로 묶음)"""
+    codes, uniques = pd.factorize(values, sort=True)
+    counts = np.bincount(codes, minlength=len(uniques))
+    if len(uniques) <= max_groups:
+        return codes, [str(u) for u in uniques]
+    top = np.sort(np.argsort(-counts, kind="stable")[:max_groups - 1])
+    remap = np.full(len(uniques), max_groups - 1)
+    remap[top] = np.arange(len(top))
+    return remap[codes], [str(uniques[i]) for i in top] + ["기타"]
+
+def density_grid(x, y, codes=None, n_groups=1, bins=DENSITY_BINS, x_range=None, y_range=None):
+    """
+    2D 밀도 격자 (그룹별 칸 개수)
+
+    numpy bincount 한 번으로 (그룹, y칸, x칸) 개수를 모두 센다.
+
+    Parameters:
+        x, y: float 배열 (결측 없음)
+        codes: 그룹 코드 배열 (None이면 그룹 하나)
+        x_range, y_range: 집계할 범위 (None이면 데이터 최솟값~최댓값)
+
+    Returns:
+        (counts, x_edges, y_edges) — counts 모양은 (n_groups, bins, bins)
+    """
+    x_lo, x_hi = x_range if x_range is not None else (float(np.min(x)), float(np.max(x)))
+    y_lo, y_hi = y_range if y_range is not None else (float(np.min(y)), float(np.max(y)))
+    if x_hi <= x_lo:
+        x_lo, x_hi = x_lo - 0.5, x_hi + 0.5
+    if y_hi <= y_lo:
+        y_lo, y_hi = y_lo - 0.5, y_hi + 0.5
+
+    ix = np.clip(((x - x_lo) / (x_hi - x_lo) * bins).astype(np.int64), 0, bins - 1)
+    iy = np.clip(((y - y_lo) / (y_hi - y_lo) * bins).astype(np.int64), 0, bins - 1)
+    flat = iy * bins + ix
+    if codes is not None:
+        flat = codes.astype(np.int64) * bins * bins + flat
+    counts = np.bincount(flat, minlength=n_groups * bins * bins).reshape(n_groups, bins, bins)
+    return counts, np.linspace(x_lo, x_hi, bins + 1), np.linspace(y_lo, y_hi, bins + 1)
+
+def _hex_to_rgb(color):
+    color = color.lstrip("#")
+    return [int(color[i:i + 2], 16) for i in (0, 2, 4)]
+
+def _density_figure(counts, x_edges, y_edges, group_names):
+    """밀도 격자를 그림으로 (그룹 하나면 히트맵, 여러 개면 칸마다 가장 많은 그룹 색 + 밀도 명암)"""
+    x_centers = (x_edges[:-1] + x_edges[1:]) / 2
+    y_centers = (y_edges[:-1] + y_edges[1:]) / 2
+
+    if counts.shape[0] == 1:
+        z = counts[0].astype(float)
+        fig = go.Figure(go.Heatmap(
+            x=x_centers, y=y_centers, z=np.where(z > 0, np.log10(z + 1), np.nan).astype(np.float32),
+            colorscale="Viridis",
+            colorbar=dict(title="log10(개수+1)"),
+            hovertemplate="x=%{x:.4g}<br>y=%{y:.4g}<br>log10(개수+1)=%{z}<extra></extra>",
+            hoverongaps=False,
+        ))
+        return fig
+
+    palette = np.array([_hex_to_rgb(c) for c in px.colors.qualitative.Plotly], dtype=float)
+    total = counts.sum(axis=0)
+    dominant = counts.argmax(axis=0)
+    colors = palette[dominant % len(palette)]
+    # 밀도(로그 스케일)에 따라 흰 배경에서 그룹 색까지 명암을 줌
+    alpha = np.where(total > 0, 0.25 + 0.75 * np.log1p(total) / np.log1p(max(total.max(), 1)), 0.0)[..., None]
+    rgb = (255 - (255 - colors) * alpha).round().astype(np.uint8)
+
+    # 픽셀 배열 대신 PNG로 보내서 전송량을 줄임
+    buffer = io.BytesIO()
+    Image.fromarray(rgb).save(buffer, format="PNG")
+    source = "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode()
+
+    fig = go.Figure(go.Image(
+        source=source, x0=x_centers[0], dx=x_edges[1] - x_edges[0],
+        y0=y_centers[0], dy=y_edges[1] - y_edges[0], hoverinfo="x+y",
+    ))
+    # 범례용 빈 트레이스
+    for g, name in enumerate(group_names):
+        fig.add_trace(go.Scatter(
+            x=[None], y=[None], mode="markers", name=f"{name} ({int(counts[g].sum()):,})",
+            marker=dict(size=10, color=px.colors.qualitative.Plotly[g % len(palette)]),
+        ))
+    fig.update_layout(showlegend=True)
+    return fig
+
+def plot_scatter(df, x_col, y_col, hue_col=None, x_range=None, y_range=None, mode="auto", bins=DENSITY_BINS):
     """
     Plotly 산점도 (인터랙티브)
-    
+
+    행 수에 따라 그리기 방식을 자동으로 고름:
+        - SCATTER_WEBGL_ROWS 이하: 일반 산점도 (SVG)
+        - SCATTER_DENSITY_ROWS 이하: WebGL 산점도
+        - 그 이상: 서버에서 (색상 그룹별) 2D 밀도 격자로 집계한 이미지/히트맵
+    x_range/y_range로 보이는 범위를 좁히면 그 범위의 행만 다시 집계하므로,
+    범위 안의 행 수가 줄면 다시 개별 점으로 그려진다.
+
     Parameters:
         df: 데이터프레임
         x_col: X축 변수명
         y_col: Y축 변수명
         hue_col: 색상 구분 변수명 (선택사항)
-    
+        x_range, y_range: (최솟값, 최댓값) 표시 범위 (선택사항)
+        mode: 'auto', 'svg', 'webgl', 'density'
+        bins: 밀도 격자 한 변의 칸 수
+
     Returns:
         tuple: (fig, df_clean) 튜플을 반환
                - fig: Plotly Figure 객체 (데이터가 없으면 None)
-               - df_clean: 정제된 데이터프레임 (데이터가 없으면 None)
+               - df_clean: 정제된 데이터프레임 (표시 범위 안의 행, 데이터가 없으면 None)
     """
     # 입력 검증
     if df is None or df.empty:
         return None, None
-    
+
     if x_col not in df.columns or y_col not in df.columns:
         return None, None
-    
+
     if hue_col is not None and hue_col not in df.columns:
         return None, None
-    
+
     cols = [x_col, y_col] + ([hue_col] if hue_col else [])
-    
+
     # x, y, hue에 결측이 없는 row만 남기되, 나머지 컬럼은 그대로 유지
-    df_clean = df.dropna(subset=cols).copy()
-    
+    df_clean = df.dropna(subset=cols)
+
+    # 표시 범위 밖의 행 제외
+    if x_range is not None:
+        df_clean = df_clean[df_clean[x_col].between(*x_range)]
+    if y_range is not None:
+        df_clean = df_clean[df_clean[y_col].between(*y_range)]
+
     if df_clean.empty:
         return None, None
-    
-    # Plotly 산점도 생성
-    fig = px.scatter(
-        df_clean,
-        x=x_col,
-        y=y_col,
-        color=hue_col,
-        hover_data={x_col: True, y_col: True},  # hover에 x, y 값 표시
-        opacity=0.7,
-    )
-    
+
+    render_mode = scatter_mode(len(df_clean), mode)
+    if render_mode == "density":
+        x = df_clean[x_col].to_numpy(dtype=np.float64)
+        y = df_clean[y_col].to_numpy(dtype=np.float64)
+        if hue_col:
+            codes, group_names = _hue_codes(df_clean[hue_col])
+        else:
+            codes, group_names = None, [""]
+        counts, x_edges, y_edges = density_grid(x, y, codes, len(group_names), bins, x_range, y_range)
+        fig = _density_figure(counts, x_edges, y_edges, group_names)
+        title = f"Density: {x_col} vs {y_col} ({len(df_clean):,} rows)"
+    else:
+        # Plotly 산점도 생성
+        fig = px.scatter(
+            df_clean,
+            x=x_col,
+            y=y_col,
+            color=hue_col,
+            hover_data={x_col: True, y_col: True},  # hover에 x, y 값 표시
+            opacity=0.7,
+            render_mode="webgl" if render_mode == "webgl" else "svg",
+        )
+        # 마커 크기 설정 (점이 많으면 작게)
+        fig.update_traces(marker=dict(size=7 if render_mode == "svg" else 4))
+        title = f"Scatter Plot: {x_col} vs {y_col}"
+
     # 레이아웃 설정
     fig.update_layout(
-        title=f"Scatter Plot: {x_col} vs {y_col}",
+        title=title,
         xaxis_title=x_col,
         yaxis_title=y_col,
         font=dict(family="Malgun Gothic"),
         legend_title=hue_col if hue_col else "",
     )
-    
-    # 마커 크기 설정
-    fig.update_traces(marker=dict(size=7))
-    
+    if render_mode == "density":
+        # 이미지 트레이스는 기본적으로 y축이 뒤집히므로 범위를 직접 지정
+        fig.update_xaxes(range=[x_edges[0], x_edges[-1]])
+        fig.update_yaxes(range=[y_edges[0], y_edges[-1]], autorange=False)
+
     return fig, df_clean
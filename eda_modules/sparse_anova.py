@@ -0,0 +1,86 @@
+# eda_modules/sparse_anova.py
+
+import numpy as np
+import pandas as pd
+from scipy import sparse, stats  # type: ignore
+
+# 정규방정식 고유값 중 0으로 볼 상대 크기 (numpy matrix_rank 기본값보다 여유 있게)
+RANK_TOL = 1e3 * np.finfo(np.float64).eps
+
+
+def _one_hot(codes, n_levels, drop_first=True):
+    """그룹 코드 배열의 희소 원-핫 행렬 (CSR, drop_first면 첫 수준을 기준 수준으로 제외 — treatment 코딩)"""
+    n_rows = len(codes)
+    matrix = sparse.csr_matrix((np.ones(n_rows), (np.arange(n_rows), codes)), shape=(n_rows, n_levels))
+    return matrix[:, 1:] if drop_first else matrix
+
+def _residual_ss(y, factors):
+    """
+    범주형 주효과 모형(절편 + 요인들)의 잔차제곱합과 설계행렬 rank
+
+    수준이 가장 많은 요인은 그룹 평균을 빼는 방식으로 흡수하고 (Frisch-Waugh-Lovell),
+    나머지 요인의 희소 원-핫 행렬만 흡수된 공간에 투영해서 작은 정규방정식을 푼다.
+    정규방정식은 고유값 분해로 풀어서 요인이 교락(중첩)되어 rank가 부족해도 잔차와 rank가 정확하다.
+    """
+    if not factors:
+        residual = y - y.mean()
+        return float(residual @ residual), 1
+
+    absorbed = max(range(len(factors)), key=lambda i: factors[i][1])
+    codes_d, k_d = factors[absorbed]
+    counts = np.bincount(codes_d, minlength=k_d).astype(np.float64)
+
+    def demean(values):
+        # 흡수한 요인의 그룹 평균을 뺌 (절편 포함)
+        return values - (np.bincount(codes_d, weights=values, minlength=k_d) / counts)[codes_d]
+
+    y_tilde = demean(y)
+    others = [factor for i, factor in enumerate(factors) if i != absorbed]
+    if not others:
+        return float(y_tilde @ y_tilde), k_d
+
+    Z = sparse.hstack([_one_hot(codes, k) for codes, k in others], format="csr")
+    DZ = _one_hot(codes_d, k_d, drop_first=False).T @ Z                 # 흡수 요인 수준 x 나머지 수준 (희소)
+    ZtZ = (Z.T @ Z - DZ.T @ sparse.diags(1.0 / counts) @ DZ).toarray()  # 투영된 정규방정식 (나머지 수준 수 크기)
+    Zy = Z.T @ y_tilde
+
+    eigvals, eigvecs = np.linalg.eigh(ZtZ)
+    nonzero = eigvals > RANK_TOL * ZtZ.shape[0] * max(eigvals.max(), 0.0)
+    beta = eigvecs[:, nonzero] @ ((eigvecs[:, nonzero].T @ Zy) / eigvals[nonzero])
+
+    residual = y_tilde - demean(Z @ beta)
+    return float(residual @ residual), k_d + int(nonzero.sum())
+
+def sparse_type2_anova(y, factors):
+    """
+    범주형 주효과 모형의 Type II ANOVA (희소 원-핫 설계행렬 + 흡수 최소제곱)
+
+    주효과만 있는 모형에서 Type II 제곱합은 요인 하나를 뺀 모형과 전체 모형의 잔차제곱합 차이이고,
+    자유도는 두 설계행렬의 rank 차이. 밀집 더미 행렬(행 수 x 수준 수)을 만들지 않으므로
+    수준이 수천 개인 범주형 변수도 다룰 수 있다. (가장 큰 요인을 뺀 나머지 수준 수 크기의 행렬만 밀집)
+    설계가 완전한 rank면 statsmodels anova_lm(typ=2)와 같은 결과.
+
+    Parameters:
+        y: float 배열 (결측 없음)
+        factors: [(요인 이름, 그룹 코드 배열(0~k-1), 수준 수 k)] 리스트
+
+    Returns:
+        sum_sq, df, F, PR(>F) 컬럼의 DataFrame (요인 순서 + 'Residual' 행, anova_lm(typ=2)와 같은 형식)
+    """
+    y = np.asarray(y, dtype=np.float64)
+    coded = [(np.asarray(codes, dtype=np.int64), int(k)) for _, codes, k in factors]
+    rss_full, rank_full = _residual_ss(y, coded)
+    df_resid = len(y) - rank_full
+
+    rows = {}
+    for i, (name, _, _) in enumerate(factors):
+        rss_reduced, rank_reduced = _residual_ss(y, coded[:i] + coded[i + 1:])
+        rows[name] = {"sum_sq": max(rss_reduced - rss_full, 0.0), "df": float(rank_full - rank_reduced)}
+    rows["Residual"] = {"sum_sq": rss_full, "df": float(df_resid)}
+
+    table = pd.DataFrame.from_dict(rows, orient="index")
+    with np.errstate(invalid="ignore", divide="ignore"):
+        table["F"] = (table["sum_sq"] / table["df"]) / (rss_full / df_resid)
+    table.loc["Residual", "F"] = np.nan
+    table["PR(>F)"] = stats.f.sf(table["F"], table["df"], df_resid)
+    return table
@@ -27,7 +27,7 @@ def show_value_counts(df: pd.DataFrame):
 
     # ✅ 그룹별 개수 계산
     group_counts = (
-        df.groupby(selected_cols, dropna=False)
+        df.groupby(selected_cols, dropna=False, observed=True)
         .size()
         .reset_index(name="count")
         .sort_values(by=selected_cols)
@@ -41,7 +41,7 @@ def show_value_counts(df: pd.DataFrame):
             total = group_counts["count"].sum()
             group_counts["ratio (%)"] = (group_counts["count"] / total * 100).round(2)
         elif base_col:
-            base_totals = df.groupby(base_col).size().to_dict()
+            base_totals = df.groupby(base_col, observed=True).size().to_dict()
             group_counts["ratio (%)"] = group_counts[base_col].map(base_totals)
             group_counts["ratio (%)"] = (group_counts["count"] / group_counts["ratio (%)"] * 100).round(2)
 
@@ -1,46 +1,83 @@
-import os
 import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
-import re
+from eda_modules.render_pool import render_all
+from eda_modules.artifact_cache import ARTIFACT_DIR, artifact_task, frame_key, lookup_artifact
 
+# 그림 모양이 바뀌면 올려서 이전 캐시 무효화
+RENDERER_VERSION = 1
 
-def plot_value_distributions(df, cols, item_col=None, save_dir=None, color="skyblue"):
-    if save_dir:
-        os.makedirs(save_dir, exist_ok=True)
-    saved_paths = []
 
-    groups = [(None, df)] if item_col is None else df.groupby(item_col)
+def render_distribution(values, col, group_name, save_path, color="skyblue"):
+    """
+    한 그룹/컬럼의 분포 그림 저장 (렌더링 워커에서 실행)
+
+    Returns:
+        저장한 이미지 경로 (그릴 값이 없으면 None)
+    """
+    if pd.api.types.is_numeric_dtype(values):
+        if values.dropna().empty:
+            return None
+        plt.figure(figsize=(8, 4))
+        sns.histplot(values, kde=True, bins=30, color=color)
+    else:
+        value_counts = values.value_counts()
+        if value_counts.empty:
+            return None
+        plt.figure(figsize=(8, 4))
+        value_counts.plot(kind='bar', color=color)
+
+    plt.title(f"{group_name} - Distribution of {col}")
+    plt.tight_layout()
+    plt.savefig(save_path, facecolor='white')
+    plt.close()
+    return save_path
+
+def distribution_jobs(df, cols, item_col=None, color="skyblue", data_key=None, store_dir=ARTIFACT_DIR):
+    """
+    그룹 × 컬럼별 분포 그림 작업 목록
+
+    data_key: 데이터셋 키 (None이면 df 내용 해시)
+
+    Returns:
+        (이미지 경로, 작업) 리스트 — 아티팩트 캐시에 있는 이미지는 작업이 None,
+        없는 이미지는 render_pool에 넘길 (함수, kwargs)
+    """
+    data_key = data_key or frame_key(df, list(cols) + ([item_col] if item_col else []))
+    jobs = []
+
+    groups = [(None, df)] if item_col is None else df.groupby(item_col, observed=True)
 
     for item, group_df in groups:
         group_name = "all" if item is None else str(item)
-        group_name = re.sub(r'[\\/*?:"<>|]', "", str(group_name))
-        item_dir = os.path.join(save_dir, group_name)
-        os.makedirs(item_dir, exist_ok=True)
 
         for col in cols:
-            img_path = os.path.join(item_dir, f"{col}_distribution_{color}.png")
-
-            if os.path.exists(img_path):
-                saved_paths.append(img_path)
+            params = {"col": col, "group_col": item_col, "group": group_name, "color": color}
+            img_path, hit = lookup_artifact(data_key, render_distribution, params, store_dir=store_dir)
+            if hit:
+                jobs.append((img_path, None))
                 continue
 
-            plt.figure(figsize=(8, 4))
-            if pd.api.types.is_numeric_dtype(group_df[col]):
-                if group_df[col].dropna().empty:
-                    continue
-                sns.histplot(group_df[col], kde=True, bins=30, color=color)
-            else:
-                value_counts = group_df[col].value_counts()
-                if value_counts.empty:
-                    continue
-                value_counts.plot(kind='bar', color=color)
+            # 워커로는 그릴 컬럼 값만 전달
+            jobs.append((img_path, artifact_task(render_distribution, img_path, dict(
+                values=group_df[col], col=col, group_name=group_name, color=color), store_dir)))
 
-            plt.title(f"{group_name} - Distribution of {col}")
-            plt.tight_layout()
-            plt.savefig(img_path, facecolor='white')
-            plt.close()
+    return jobs
 
-            saved_paths.append(img_path)
+def plot_value_distributions(df, cols, item_col=None, color="skyblue", data_key=None, max_workers=None):
+    """
+    그룹 × 컬럼별 분포 그림을 렌더링 프로세스 풀에서 나눠 생성 (아티팩트 캐시 사용)
 
+    max_workers: 동시 렌더링 프로세스 수 (None이면 render_pool.RENDER_WORKERS)
+    """
+    jobs = distribution_jobs(df, cols, item_col, color, data_key)
+    pending = [idx for idx, (_, task) in enumerate(jobs) if task is not None]
+    rendered = render_all([jobs[idx][1] for idx in pending], max_workers)
+    results = {idx: path for idx, path in zip(pending, rendered)}
+
+    saved_paths = []
+    for idx, (img_path, task) in enumerate(jobs):
+        path = img_path if task is None else results[idx]
+        if path:
+            saved_paths.append(path)
     return saved_paths
@@ -1,38 +1,127 @@
-import pandas as pd
-
-def split_variable_types(df: pd.DataFrame, datetime_threshold=10):
-    datetime_cols = df.select_dtypes(include=["datetime64[ns]"]).columns.tolist()
-
-    # 문자열 타입 컬럼만 날짜로 변환 시도
-    for col in df.columns:
-        if col not in datetime_cols and df[col].dtype == "object":
-            # try:
-            #     parsed = pd.to_datetime(df[col], format="%Y-%m-%d", errors="raise")
-            # except Exception:
-            #     parsed = pd.to_datetime(df[col], errors="coerce")
-            # if parsed.nunique() > datetime_threshold:
-            #     datetime_cols.append(col)
-            try:
-                parsed = pd.to_datetime(df[col], errors="raise")
-                if parsed.nunique() > datetime_threshold:
-                    datetime_cols.append(col)
-            except:
-                continue
-            
-
-    # 순서 유지하면서 분류
-    categorical_cols = [col for col in df.columns 
-                        if col not in datetime_cols and df[col].dtype in ["object", "category"]]
-    
-    numerical_cols = [col for col in df.columns 
-                      if col not in datetime_cols and df[col].dtype not in ["object", "category", "datetime64[ns]"]]
-
-    return {
-        "datetime": datetime_cols,
-        "categorical": categorical_cols,
-        "numerical": numerical_cols
-    }
-
-
-
-
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.api import guess_datetime_format
+
+DATETIME_SAMPLE_SIZE = 200
+DATETIME_FORMAT_CACHE_SIZE = 1024
+
+_datetime_format_cache = OrderedDict()   # 컬럼 fingerprint -> 추론된 날짜 포맷 (날짜가 아니면 None)
+_lock = threading.Lock()
+
+
+def _probe_sample(values, sample_size=DATETIME_SAMPLE_SIZE):
+    """컬럼 전체 구간에서 고르게 뽑은 결측 아닌 샘플 (앞/중간/뒤 구간 모두 포함)"""
+    n = len(values)
+    if n == 0:
+        return values
+    positions = np.unique(np.linspace(0, n - 1, min(sample_size, n)).astype(np.int64))
+    sample = values.iloc[positions]
+    sample = sample[sample.notna() & (sample != "")]
+    if len(sample) < min(10, sample_size):
+        # 결측이 많은 컬럼은 결측 아닌 값에서 다시 샘플링
+        non_null = values[values.notna() & (values != "")]
+        if len(non_null) == 0:
+            return non_null
+        positions = np.unique(np.linspace(0, len(non_null) - 1, min(sample_size, len(non_null))).astype(np.int64))
+        sample = non_null.iloc[positions]
+    return sample
+
+def _column_fingerprint(col, values, sample):
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr((col, len(values), str(values.dtype))).encode())
+    h.update(pd.util.hash_pandas_object(sample.astype(str), index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+def _infer_datetime_format(sample):
+    """샘플 전체를 파싱할 수 있는 단일 날짜 포맷 추론 (없으면 None)"""
+    if len(sample) == 0:
+        return None
+    sample = sample.astype(str)
+    candidates = []
+    for value in sample.iloc[:5]:
+        fmt = guess_datetime_format(value)
+        if fmt and fmt not in candidates:
+            candidates.append(fmt)
+    for fmt in candidates:
+        parsed = pd.to_datetime(sample, format=fmt, errors="coerce")
+        if parsed.notna().all():
+            return fmt
+    return None
+
+def _cached_format(key, sample):
+    with _lock:
+        if key in _datetime_format_cache:
+            _datetime_format_cache.move_to_end(key)
+            return _datetime_format_cache[key]
+    fmt = _infer_datetime_format(sample)
+    _remember_format(key, fmt)
+    return fmt
+
+def _remember_format(key, fmt):
+    with _lock:
+        _datetime_format_cache[key] = fmt
+        _datetime_format_cache.move_to_end(key)
+        while len(_datetime_format_cache) > DATETIME_FORMAT_CACHE_SIZE:
+            _datetime_format_cache.popitem(last=False)
+
+def detect_datetime_column(values, col=None):
+    """
+    문자열 컬럼이 날짜형인지 샘플로 먼저 확인하고, 통과한 경우에만 전체를 파싱
+
+    Returns:
+        datetime64로 파싱된 Series (날짜형이 아니면 None)
+    """
+    sample = _probe_sample(values)
+    key = _column_fingerprint(col, values, sample)
+    fmt = _cached_format(key, sample)
+    if fmt is None:
+        return None
+
+    missing = values.isna() | (values == "")
+    parsed = pd.to_datetime(values.where(~missing), format=fmt, errors="coerce")
+    # 샘플 밖에서 포맷이 맞지 않는 값이 있으면 날짜형으로 보지 않음
+    if parsed.notna().sum() != (~missing).sum():
+        _remember_format(key, None)
+        return None
+    return parsed
+
+def parse_datetime_columns(df: pd.DataFrame, datetime_threshold=10):
+    """
+    문자열 컬럼 중 날짜형 컬럼을 샘플 기반으로 찾아 파싱 (df는 바꾸지 않음)
+
+    Returns:
+        {컬럼명: datetime64로 파싱된 Series} 딕셔너리 (호출한 쪽에서 df에 대입하면 이후 다시 파싱하지 않음)
+    """
+    parsed_cols = {}
+    for col in df.columns:
+        if df[col].dtype == "object":
+            parsed = detect_datetime_column(df[col], col)
+            if parsed is not None and parsed.nunique() > datetime_threshold:
+                parsed_cols[col] = parsed
+    return parsed_cols
+
+def split_variable_types(df: pd.DataFrame, datetime_threshold=10):
+    datetime_cols = df.select_dtypes(include=["datetime", "datetimetz"]).columns.tolist()
+
+    # 문자열 타입 컬럼만 샘플 기반으로 날짜 여부 확인 (df는 바꾸지 않음)
+    datetime_cols += list(parse_datetime_columns(df, datetime_threshold))
+
+    # 순서 유지하면서 분류 (category / Arrow 문자열 컬럼도 범주형으로 취급)
+    def is_text(dtype):
+        return dtype == "object" or isinstance(dtype, (pd.CategoricalDtype, pd.StringDtype))
+
+    categorical_cols = [col for col in df.columns
+                        if col not in datetime_cols and is_text(df[col].dtype)]
+
+    numerical_cols = [col for col in df.columns
+                      if col not in datetime_cols and not is_text(df[col].dtype)]
+
+    return {
+        "datetime": datetime_cols,
+        "categorical": categorical_cols,
+        "numerical": numerical_cols
+    }
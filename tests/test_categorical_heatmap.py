@@ -0,0 +1,29 @@
+# tests/test_categorical_heatmap.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda_modules.categorical_heatmap import median_pivot
+
+
+def _frame(categorical):
+    """조합마다 홀수 개 행(스케치 중앙값이 정확)인 데이터 + 범주형 값이 결측인 행"""
+    rng = np.random.default_rng(3)
+    a, b = np.meshgrid(["x", "y", "z"], ["p", "q"], indexing="ij")
+    a, b = np.repeat(a.ravel(), 7), np.repeat(b.ravel(), 7)
+    a = np.concatenate([a, [None, None, "x"]]).astype(object)
+    b = np.concatenate([b, ["p", None, None]]).astype(object)
+    df = pd.DataFrame({"a": a, "b": b, "v": rng.normal(size=len(a))})
+    if categorical:
+        df["a"] = df["a"].astype("category")
+        df["b"] = df["b"].astype("category")
+    return df
+
+@pytest.mark.parametrize("categorical", [False, True])
+def test_sketch_pivot_skips_missing_categories(categorical):
+    df = _frame(categorical)
+    expected = median_pivot(df, ["a", "b"], "v", exact=True)
+    result = median_pivot(df, ["a", "b"], "v", exact=False)
+    pd.testing.assert_frame_equal(result, expected, check_names=False, check_index_type=False,
+                                  check_column_type=False, check_categorical=False)
@@ -0,0 +1,51 @@
+# tests/test_correlation_engine.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda_modules.correlation_engine import compute_correlation, get_correlation
+
+
+def _frame(missing):
+    """상관이 있는 수치형 컬럼 5개 (missing=True면 컬럼마다 결측 비율이 다름)"""
+    rng = np.random.default_rng(0)
+    n = 500
+    base = rng.normal(size=n)
+    df = pd.DataFrame({
+        "a": base + rng.normal(scale=0.5, size=n),
+        "b": -base + rng.normal(scale=1.0, size=n),
+        "c": rng.integers(0, 5, size=n).astype(float),   # 동률이 많은 컬럼
+        "d": rng.exponential(size=n),
+        "e": base * 3 + 1,
+    })
+    if missing:
+        for col, frac in zip(df.columns, (0.0, 0.1, 0.3, 0.05, 0.5)):
+            df.loc[rng.random(n) < frac, col] = np.nan
+    return df
+
+@pytest.mark.parametrize("missing", [False, True])
+@pytest.mark.parametrize("method", ["pearson", "spearman", "kendall"])
+def test_matches_pandas(method, missing):
+    df = _frame(missing)
+    expected = df.corr(method=method)
+    pd.testing.assert_frame_equal(compute_correlation(df, df.columns, method), expected, rtol=1e-10, atol=1e-12)
+
+def test_spearman_reranks_pairs_with_different_missing_rows():
+    df = _frame(missing=False)
+    # 결측 위치가 같은 쌍(b, c)과 다른 쌍(a, b)이 섞인 경우
+    df.loc[::3, ["b", "c"]] = np.nan
+    df.loc[1::7, "a"] = np.nan
+    result = compute_correlation(df, df.columns, "spearman")
+    pd.testing.assert_frame_equal(result, df.corr(method="spearman"), rtol=1e-10, atol=1e-12)
+    assert not np.isclose(result.at["a", "b"], df.rank().corr().at["a", "b"])
+
+@pytest.mark.parametrize("missing", [False, True])
+@pytest.mark.parametrize("method", ["pearson", "spearman", "kendall"])
+def test_cached_matrix_grows_with_new_columns(method, missing):
+    df = _frame(missing)
+    data_key = f"test_{method}_{missing}"
+    expected = compute_correlation(df, df.columns, method)
+    get_correlation(df, ["a", "c"], method, data_key)
+    result = get_correlation(df, ["e", "a", "b", "c", "d"], method, data_key)
+    pd.testing.assert_frame_equal(result, expected.loc[result.index, result.columns], rtol=1e-12, atol=1e-12)
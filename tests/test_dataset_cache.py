@@ -0,0 +1,34 @@
+# tests/test_dataset_cache.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda_modules import dataset_cache
+
+
+def _csv_bytes():
+    rng = np.random.default_rng(4)
+    n = 500
+    df = pd.DataFrame({
+        "cat": rng.choice(["a", "b", None], n),
+        "num": np.where(rng.random(n) < 0.1, np.nan, rng.normal(size=n)),
+        "late_str": [str(i) for i in range(n - 3)] + ["x"] * 3,   # 마지막 청크에서 문자열로 넓어지는 컬럼
+        "when": pd.date_range("2024-01-01", periods=n, freq="h").astype(str),
+    })
+    return df.to_csv(index=False).encode()
+
+@pytest.mark.parametrize("sanitize, compact", [(False, False), (True, False), (False, True)])
+def test_csv_store_hit_matches_fresh_load(tmp_path, sanitize, compact):
+    data = _csv_bytes()
+    kwargs = dict(store_dir=str(tmp_path), sanitize=sanitize, compact=compact, chunk_rows=100)
+    key, fresh, var_types = dataset_cache.load_dataset(data, "csv", **kwargs)
+
+    # CSV는 청크 적재한 파일 하나만 저장소에 남음 (임시 파일 / 다시 쓴 파일 없음)
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted([f"{key}.arrow", f"{key}.json", "catalog.json"])
+    assert var_types["datetime"] == ["when"]
+
+    dataset_cache._memory_cache.pop(key)
+    _, reloaded, reloaded_types = dataset_cache.load_dataset(data, "csv", **kwargs)
+    pd.testing.assert_frame_equal(reloaded, fresh)
+    assert reloaded_types == var_types
@@ -0,0 +1,70 @@
+# tests/test_group_summary.py
+
+import numpy as np
+import pytest
+from scipy import stats  # type: ignore
+from statsmodels.stats.multicomp import pairwise_tukeyhsd  # type: ignore
+
+from eda_modules.group_summary import group_summary, pairwise_tests, oneway_anova, tukey_hsd
+
+
+def _design(balanced):
+    """그룹 4개의 값과 그룹 코드 (unbalanced면 그룹 크기 / 분산이 다르고 결측 값과 결측 코드 포함)"""
+    rng = np.random.default_rng(1)
+    sizes = (40, 40, 40, 40) if balanced else (12, 85, 3, 40)
+    scales = (1.0, 1.0, 1.0, 1.0) if balanced else (1.0, 4.0, 0.5, 2.0)
+    values = np.concatenate([rng.normal(loc=g * 0.4, scale=s, size=n) for g, (n, s) in enumerate(zip(sizes, scales))])
+    codes = np.repeat(np.arange(len(sizes)), sizes)
+    if not balanced:
+        values[[0, 50]] = np.nan
+        codes[[5, 60]] = -1
+    return values, codes, len(sizes)
+
+def _split(values, codes, n_groups):
+    valid = (codes >= 0) & ~np.isnan(values)
+    return [values[valid & (codes == g)] for g in range(n_groups)]
+
+@pytest.mark.parametrize("balanced", [True, False])
+def test_pairwise_tests_match_scipy(balanced):
+    values, codes, n_groups = _design(balanced)
+    groups = _split(values, codes, n_groups)
+    result = pairwise_tests(group_summary(values, codes, n_groups))
+    assert len(result) == n_groups * (n_groups - 1) // 2
+
+    for row in result.itertuples():
+        x, y = groups[row.i], groups[row.j]
+        levene = stats.levene(x, y)
+        equal_var = levene.pvalue > 0.05
+        ttest = stats.ttest_ind(x, y, equal_var=equal_var)
+        pooled_std = np.sqrt(((len(x) - 1) * x.var(ddof=1) + (len(y) - 1) * y.var(ddof=1)) / (len(x) + len(y) - 2))
+        np.testing.assert_allclose([row.levene_stat, row.levene_p], [levene.statistic, levene.pvalue], rtol=1e-9)
+        assert row.equal_var == equal_var
+        np.testing.assert_allclose([row.t, row.p], [ttest.statistic, ttest.pvalue], rtol=1e-9)
+        np.testing.assert_allclose(row.cohens_d, (x.mean() - y.mean()) / pooled_std, rtol=1e-9)
+
+def test_pairwise_tests_skip_small_groups():
+    values, codes, n_groups = _design(balanced=False)
+    result = pairwise_tests(group_summary(values, codes, n_groups), min_n=5)
+    assert 2 not in set(result["i"]) | set(result["j"])
+
+@pytest.mark.parametrize("balanced", [True, False])
+def test_oneway_anova_matches_scipy(balanced):
+    values, codes, n_groups = _design(balanced)
+    groups = _split(values, codes, n_groups)
+    result = oneway_anova(group_summary(values, codes, n_groups))
+    expected = stats.f_oneway(*groups)
+    np.testing.assert_allclose([result["F"], result["p"]], [expected.statistic, expected.pvalue], rtol=1e-9)
+    assert result["df_between"] == n_groups - 1
+    assert result["df_within"] == sum(len(g) for g in groups) - n_groups
+
+@pytest.mark.parametrize("balanced", [True, False])
+def test_tukey_hsd_matches_statsmodels(balanced):
+    values, codes, n_groups = _design(balanced)
+    valid = (codes >= 0) & ~np.isnan(values)
+    expected = pairwise_tukeyhsd(values[valid], codes[valid], alpha=0.05)
+    result = tukey_hsd(group_summary(values, codes, n_groups), alpha=0.05)
+
+    np.testing.assert_allclose(result["meandiff"], expected.meandiffs, rtol=1e-9)
+    np.testing.assert_allclose(result["p_adj"], expected.pvalues, rtol=1e-6, atol=1e-9)
+    np.testing.assert_allclose(result[["lower", "upper"]].to_numpy(), expected.confint, rtol=1e-9)
+    np.testing.assert_array_equal(result["reject"], expected.reject)
@@ -0,0 +1,26 @@
+# tests/test_kde_engine.py
+
+import numpy as np
+from scipy.stats import gaussian_kde  # type: ignore
+
+from eda_modules.kde_engine import kde_batch, scott_bandwidth, KDE_CUT
+
+
+def _series():
+    rng = np.random.default_rng(5)
+    return [rng.normal(0, 1, 500), rng.normal(50, 0.5, 300), rng.normal(20, 10, 1000), np.array([1.0, 1.0])]
+
+def test_curves_match_gaussian_kde_on_own_support():
+    series = _series()
+    curves = kde_batch(series)
+    assert curves[-1] is None
+
+    for values, (x, density) in zip(series[:-1], curves[:-1]):
+        bw = scott_bandwidth(values)
+        step = x[1] - x[0]
+        # 시리즈 범위 (최솟값 - cut * bw ~ 최댓값 + cut * bw)를 감싸는 격자점까지만
+        assert values.min() - KDE_CUT * bw - step <= x[0] <= values.min() - KDE_CUT * bw
+        assert values.max() + KDE_CUT * bw <= x[-1] <= values.max() + KDE_CUT * bw + step
+        reference = gaussian_kde(values)(x)
+        np.testing.assert_allclose(density, reference, atol=5e-3 * reference.max())
+        np.testing.assert_allclose(np.trapezoid(density, x), 1.0, atol=1e-3)
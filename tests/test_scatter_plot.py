@@ -0,0 +1,21 @@
+# tests/test_scatter_plot.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda_modules.scatter_plot import value_range
+
+
+@pytest.mark.parametrize("values", [
+    pd.Series([np.nan, np.nan]),
+    pd.Series([pd.NA, pd.NA], dtype="Int64"),
+    pd.Series([2.0, 2.0, np.nan]),
+    pd.Series([np.inf, -np.inf]),
+    pd.Series([], dtype=float),
+])
+def test_value_range_without_usable_span(values):
+    assert value_range(values) is None
+
+def test_value_range_ignores_missing_and_infinite():
+    assert value_range(pd.Series([3.0, np.nan, -np.inf, 1.0, np.inf, 2.0])) == (1.0, 3.0)
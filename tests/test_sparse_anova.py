@@ -0,0 +1,45 @@
+# tests/test_sparse_anova.py
+
+import numpy as np
+import pandas as pd
+import pytest
+import statsmodels.api as sm  # type: ignore
+from statsmodels.formula.api import ols  # type: ignore
+
+from eda_modules.sparse_anova import sparse_type2_anova
+
+
+def _design(balanced):
+    """범주형 요인 3개의 주효과 모형 데이터 (balanced면 완전 요인 설계의 같은 반복 수)"""
+    rng = np.random.default_rng(2)
+    levels = {"a": 3, "b": 4, "c": 25}
+    if balanced:
+        grid = np.array(np.meshgrid(*[np.arange(k) for k in levels.values()], indexing="ij")).reshape(len(levels), -1)
+        codes = dict(zip(levels, np.repeat(grid, 3, axis=1)))
+    else:
+        n = 900
+        codes = {name: rng.choice(k, size=n, p=np.arange(1, k + 1) / (k * (k + 1) / 2)) for name, k in levels.items()}
+    n = len(codes["a"])
+    effects = {name: rng.normal(size=k) for name, k in levels.items()}
+    y = sum(effects[name][codes[name]] for name in levels) + rng.normal(scale=2.0, size=n)
+    df = pd.DataFrame({"y": y, **codes})
+    return df, [(f"C({name})", codes[name], k) for name, k in levels.items()]
+
+@pytest.mark.parametrize("balanced", [True, False])
+def test_matches_statsmodels_type2(balanced):
+    df, factors = _design(balanced)
+    expected = sm.stats.anova_lm(ols("y ~ C(a) + C(b) + C(c)", data=df).fit(), typ=2)
+    result = sparse_type2_anova(df["y"].to_numpy(), factors)
+
+    assert list(result.index) == list(expected.index)
+    np.testing.assert_allclose(result["df"], expected["df"])
+    np.testing.assert_allclose(result["sum_sq"], expected["sum_sq"], rtol=1e-8)
+    np.testing.assert_allclose(result[["F", "PR(>F)"]].iloc[:-1], expected[["F", "PR(>F)"]].iloc[:-1], rtol=1e-7)
+    assert result[["F", "PR(>F)"]].iloc[-1].isna().all()
+
+@pytest.mark.parametrize("balanced", [True, False])
+def test_single_factor_matches_statsmodels(balanced):
+    df, factors = _design(balanced)
+    expected = sm.stats.anova_lm(ols("y ~ C(c)", data=df).fit(), typ=2)
+    result = sparse_type2_anova(df["y"].to_numpy(), factors[2:])
+    np.testing.assert_allclose(result[["sum_sq", "df"]], expected[["sum_sq", "df"]], rtol=1e-8)
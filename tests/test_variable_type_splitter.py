@@ -0,0 +1,34 @@
+# tests/test_variable_type_splitter.py
+
+import pandas as pd
+
+from eda_modules import variable_type_splitter
+from eda_modules.variable_type_splitter import split_variable_types, parse_datetime_columns
+
+
+def _frame():
+    return pd.DataFrame({
+        "when": pd.date_range("2024-01-01", periods=50, freq="D").strftime("%Y/%m/%d"),
+        "label": ["a", "b"] * 25,
+        "value": range(50),
+    })
+
+def test_split_does_not_modify_frame():
+    df = _frame()
+    before = df.copy()
+    assert split_variable_types(df) == {"datetime": ["when"], "categorical": ["label"], "numerical": ["value"]}
+    pd.testing.assert_frame_equal(df, before)
+
+def test_parse_datetime_columns_returns_parsed_columns():
+    df = _frame()
+    parsed = parse_datetime_columns(df)
+    assert list(parsed) == ["when"]
+    pd.testing.assert_series_equal(parsed["when"], pd.to_datetime(df["when"], format="%Y/%m/%d"))
+    assert df["when"].dtype == object
+
+def test_format_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(variable_type_splitter, "DATETIME_FORMAT_CACHE_SIZE", 3)
+    variable_type_splitter._datetime_format_cache.clear()
+    for i in range(10):
+        parse_datetime_columns(_frame().rename(columns={"when": f"when{i}"}))
+    assert len(variable_type_splitter._datetime_format_cache) == 3